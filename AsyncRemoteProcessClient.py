@@ -0,0 +1,248 @@
+import asyncio
+import sys
+
+import ProtocolSchema
+from RemoteProcessClient import RemoteProcessClient
+from StrategyLog import StrategyLog
+from model.Move import Move
+
+
+class IncompleteMessageError(Exception):
+    pass
+
+
+class ProtocolParser(RemoteProcessClient):
+    RESUMABLE_ENTITY_NAMES = {ProtocolSchema.PLAYER_CONTEXT.name, ProtocolSchema.WORLD.name}
+
+    def __init__(self, transport, unit_pool=None, capture_path=None, world_columns=None, decode_profile=None):
+        RemoteProcessClient.__init__(
+            self, None, None, transport, unit_pool, capture_path=capture_path, world_columns=world_columns,
+            decode_profile=decode_profile
+        )
+
+    def feed(self, data):
+        byte_count = data.__len__()
+        if self.capture is not None:
+            self.capture.write(data)
+
+        if self.read_limit + byte_count > self.read_buffer.__len__():
+            remaining_byte_count = self.read_limit - self.read_offset
+
+            if self.read_offset:
+                self.read_buffer[:remaining_byte_count] = self.read_buffer[self.read_offset:self.read_limit]
+                self.read_offset = 0
+                self.read_limit = remaining_byte_count
+
+            if self.read_limit + byte_count > self.read_buffer.__len__():
+                self.read_view.release()
+                self.read_buffer.extend(bytes(self.read_limit + byte_count - self.read_buffer.__len__()))
+                self.read_view = memoryview(self.read_buffer)
+
+        self.read_buffer[self.read_limit:self.read_limit + byte_count] = data
+        self.read_limit += byte_count
+
+    def fill_read_buffer(self, byte_count):
+        raise IncompleteMessageError()
+
+    def flush(self):
+        if self.write_offset:
+            self.socket.write(bytes(self.write_buffer[:self.write_offset]))
+            self.write_offset = 0
+
+    def attempt(self, read, *args):
+        while True:
+            offset = self.read_offset
+            try:
+                return read(*args)
+            except IncompleteMessageError:
+                self.read_offset = offset
+                yield
+
+    def measure(self, skip):
+        offset = self.read_offset
+        skip()
+        self.read_offset = offset
+
+    def parse_messages(self):
+        while True:
+            self.mark_message()
+            message_type = yield from self.attempt(self.read_enum, RemoteProcessClient.MessageType)
+
+            if message_type == RemoteProcessClient.MessageType.TEAM_SIZE:
+                message = yield from self.attempt(self.read_int)
+            elif message_type == RemoteProcessClient.MessageType.GAME_CONTEXT:
+                message = yield from self.parse_entity(ProtocolSchema.GAME)
+            elif message_type == RemoteProcessClient.MessageType.PLAYER_CONTEXT:
+                message = yield from self.parse_entity(ProtocolSchema.PLAYER_CONTEXT)
+                self.complete_tick()
+            elif message_type == RemoteProcessClient.MessageType.GAME_OVER:
+                message = None
+            else:
+                raise ValueError("Received unexpected message [type=%s]." % message_type)
+
+            yield message_type, message
+
+    def parse_entity(self, entity_type):
+        if entity_type.pooled and self.unit_pool is not None:
+            # The pooled reader takes the unit from the pool and clears its lists before it has read the rest, so it
+            # must not be run on a unit that has only partly arrived: the unit is stepped over first.
+            yield from self.attempt(self.measure, getattr(self, "skip_" + entity_type.name))
+            return getattr(self, "read_" + entity_type.name)()
+
+        if entity_type.name not in ProtocolParser.RESUMABLE_ENTITY_NAMES:
+            return (yield from self.attempt(getattr(self, "read_" + entity_type.name)))
+
+        if not (yield from self.attempt(self.read_boolean)):
+            return None
+
+        columns = self.world_columns if entity_type.collects_columns else None
+        if columns is not None:
+            columns.clear()
+
+        skipped_fields = () if self.decode_profile is None else self.decode_profile.skipped_fields(entity_type)
+        values = []
+
+        for field_name, field_type in entity_type.fields:
+            if field_name in skipped_fields:
+                field_value = yield from self.attempt(
+                    self.read_skipped, getattr(self, field_type.skip_method), *field_type.skip_args
+                )
+            elif isinstance(field_type, ProtocolSchema.ListWireType):
+                field_value = yield from self.parse_list(ProtocolSchema.ENTITY_TYPE_BY_NAME[field_type.entity_name])
+            elif isinstance(field_type, ProtocolSchema.EntityWireType):
+                field_value = yield from self.parse_entity(ProtocolSchema.ENTITY_TYPE_BY_NAME[field_type.entity_name])
+            else:
+                field_value = yield from self.attempt(field_type.read_value, self)
+            values.append(field_value)
+
+        if skipped_fields:
+            value = self.decode_profile.create(entity_type, values)
+        else:
+            value = entity_type.create(values)
+        if columns is not None:
+            value.columns = columns.finish()
+        return value
+
+    def parse_list(self, entity_type):
+        count = yield from self.attempt(self.read_int)
+        if count < 0:
+            return None if entity_type.list_cache is None else getattr(self, entity_type.list_cache)
+
+        elements = []
+
+        for _ in range(count):
+            elements.append((yield from self.parse_entity(entity_type)))
+
+        if entity_type.list_cache is not None:
+            setattr(self, entity_type.list_cache, elements)
+        return elements
+
+
+class AsyncRemoteProcessClient(asyncio.Protocol):
+    def __init__(self, token, strategy_class, loop=None):
+        self.token = token
+        self.strategy_class = strategy_class
+        self.finished = (loop or asyncio.get_event_loop()).create_future()
+        self.parser = None
+        self.messages = None
+        self.team_size = None
+        self.game = None
+        self.strategies = []
+        self.log = StrategyLog.shared()
+
+    def connection_made(self, transport):
+        self.parser = ProtocolParser(transport)
+        self.messages = self.parser.parse_messages()
+        self.parser.write_token_message(self.token)
+        self.parser.write_protocol_version_message()
+
+    def data_received(self, data):
+        self.parser.feed(data)
+
+        try:
+            while not self.finished.done():
+                message = next(self.messages)
+                if message is None:
+                    break
+
+                self.handle_message(*message)
+        except Exception as error:
+            self.finished.set_exception(error)
+            self.log.close()
+            self.parser.close()
+
+    def handle_message(self, message_type, message):
+        if self.team_size is None:
+            RemoteProcessClient.ensure_message_type(message_type, RemoteProcessClient.MessageType.TEAM_SIZE)
+            self.team_size = message
+            self.strategies = [self.strategy_class() for _ in range(self.team_size)]
+            return
+
+        if self.game is None:
+            RemoteProcessClient.ensure_message_type(message_type, RemoteProcessClient.MessageType.GAME_CONTEXT)
+            self.game = message
+            return
+
+        if message_type == RemoteProcessClient.MessageType.GAME_OVER:
+            self.stop()
+            return
+
+        RemoteProcessClient.ensure_message_type(message_type, RemoteProcessClient.MessageType.PLAYER_CONTEXT)
+        player_context = message
+        if player_context is None:
+            self.stop()
+            return
+
+        player_wizards = player_context.wizards
+        if player_wizards is None or player_wizards.__len__() != self.team_size:
+            self.stop()
+            return
+
+        moves = []
+
+        for wizard_index in range(self.team_size):
+            move = Move()
+            moves.append(move)
+            self.strategies[wizard_index].move(player_wizards[wizard_index], player_context.world, self.game, move)
+
+        self.parser.write_moves_message(moves)
+        # As in Runner, the log is written while the game computes the next tick, not while the wizards move.
+        self.log.flush()
+
+    def stop(self):
+        if not self.finished.done():
+            self.finished.set_result(None)
+        self.log.close()
+        self.parser.close()
+
+    def connection_lost(self, exc):
+        if self.finished.done():
+            return
+
+        if exc is None:
+            exc = IOError("Connection closed before the game was over.")
+        self.finished.set_exception(exc)
+        self.log.close()
+
+
+async def run(host, port, token, strategy_class, loop=None):
+    loop = loop or asyncio.get_event_loop()
+    _, client = await loop.create_connection(
+        lambda: AsyncRemoteProcessClient(token, strategy_class, loop), host, port
+    )
+    await client.finished
+
+
+if __name__ == "__main__":
+    from MyStrategy import MyStrategy
+
+    if sys.argv.__len__() == 4:
+        session = run(sys.argv[1], int(sys.argv[2]), sys.argv[3], MyStrategy)
+    else:
+        session = run("127.0.0.1", 31001, "0000000000000000", MyStrategy)
+
+    event_loop = asyncio.new_event_loop()
+    try:
+        event_loop.run_until_complete(session)
+    finally:
+        event_loop.close()
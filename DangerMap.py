@@ -0,0 +1,100 @@
+import math
+
+
+class DangerMap:
+    # The damage enemies can deal within the next horizon_ticks ticks, summed per cell of a coarse grid over the map.
+    # An enemy covers every cell that some point of it may be within its attack distance plus the target radius,
+    # wherever in its own cell the enemy stands, so the map overestimates: a cell without danger is out of reach of
+    # every enemy that is ready to attack. The cover of an enemy is redrawn only when it changes cells or when its
+    # threat changes. Buildings never move, so their covers are computed once per building.
+    CELL_SIZE = 40.0
+    HORIZON_TICKS = 10
+
+    def __init__(self, map_size, target_radius, horizon_ticks=HORIZON_TICKS, cell_size=CELL_SIZE):
+        self.cell_size = cell_size
+        self.horizon_ticks = horizon_ticks
+        self.target_radius = target_radius
+        self.column_count = int(math.ceil(map_size / cell_size))
+        self.danger = [0] * (self.column_count * self.column_count)
+        self.threats_by_id = {}
+        self.static_cells_by_id = {}
+
+        self.update_count = 0
+        self.redraw_count = 0
+        self.redrawn_cell_count = 0
+
+    def expected_damage(self, damage, cooldown_ticks, remaining_cooldown_ticks):
+        if remaining_cooldown_ticks > self.horizon_ticks:
+            return 0
+        return damage * (1 + (self.horizon_ticks - remaining_cooldown_ticks) // max(cooldown_ticks, 1))
+
+    def cell_of(self, x, y):
+        column_count = self.column_count
+        cell_x = min(max(int(x / self.cell_size), 0), column_count - 1)
+        cell_y = min(max(int(y / self.cell_size), 0), column_count - 1)
+        return cell_x * column_count + cell_y
+
+    def cover(self, cell, reach):
+        # Two points in cells whose centres are d apart are at most d plus a cell diagonal apart.
+        cell_size = self.cell_size
+        column_count = self.column_count
+        center_x, center_y = divmod(cell, column_count)
+        reach_in_cells = reach / cell_size + math.sqrt(2.0)
+        cells = []
+
+        for cell_x in range(max(int(center_x - reach_in_cells), 0), min(int(center_x + reach_in_cells) + 1,
+                                                                            column_count)):
+            dx = cell_x - center_x
+            half_height = math.sqrt(max(reach_in_cells * reach_in_cells - dx * dx, 0.0))
+            min_cell_y = max(int(math.ceil(center_y - half_height)), 0)
+            max_cell_y = min(int(math.floor(center_y + half_height)), column_count - 1)
+            cells.extend(range(cell_x * column_count + min_cell_y, cell_x * column_count + max_cell_y + 1))
+
+        return cells
+
+    def draw(self, cells, damage):
+        if not damage:
+            return
+        danger = self.danger
+        for cell in cells:
+            danger[cell] += damage
+        self.redraw_count += 1
+        self.redrawn_cell_count += cells.__len__()
+
+    def update(self, static_threats, moving_threats):
+        # Threats are (unit, attack distance, damage, cooldown ticks) for every enemy ready or about to be.
+        self.update_count += 1
+        threats_by_id = self.threats_by_id
+        seen_ids = set()
+
+        for threats, static in ((static_threats, True), (moving_threats, False)):
+            for unit, attack_distance, damage, cooldown_ticks in threats:
+                seen_ids.add(unit.id)
+                expected_damage = self.expected_damage(damage, cooldown_ticks, unit.remaining_action_cooldown_ticks)
+                key = (self.cell_of(unit.x, unit.y), attack_distance, expected_damage)
+                threat = threats_by_id.get(unit.id)
+                if threat is not None:
+                    if threat[0] == key:
+                        continue
+                    self.draw(threat[1], -threat[2])
+
+                cells = []
+                if expected_damage:
+                    if static:
+                        cells = self.static_cells_by_id.get(unit.id)
+                        if cells is None:
+                            cells = self.cover(key[0], attack_distance + self.target_radius)
+                            self.static_cells_by_id[unit.id] = cells
+                    else:
+                        cells = self.cover(key[0], attack_distance + self.target_radius)
+                    self.draw(cells, expected_damage)
+                threats_by_id[unit.id] = (key, cells, expected_damage)
+
+        for unit_id in [unit_id for unit_id in threats_by_id if unit_id not in seen_ids]:
+            _, cells, expected_damage = threats_by_id.pop(unit_id)
+            self.draw(cells, -expected_damage)
+
+        return self
+
+    def expected_damage_at(self, x, y):
+        return self.danger[self.cell_of(x, y)]
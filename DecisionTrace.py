@@ -0,0 +1,207 @@
+import array
+import copy
+import json
+import os
+import signal
+import threading
+
+
+class DecisionTrace:
+    # Ring buffer of the decisions of the last CAPACITY moves: the branches of setup_move the move went through, the
+    # last enemy picked as target and the last obstacle attacked on the way, whether a retreat was tried and
+    # succeeded, what changed the move afterwards and the move itself. The records live in columns allocated once,
+    # and a move only overwrites the fields of its slot, so keeping the trace costs a few stores per move. Nothing is
+    # formatted or written until the trace is dumped: Runner dumps it when a move raises, when a tick runs longer than
+    # SLOW_TICK_SECONDS and when the process gets SIGUSR1.
+    #
+    # Dumps are JSON lines, oldest record first, written to STRATEGY_TRACE_DIR as trace-<tick>-<reason>.jsonl, and
+    # only when it is set. A dump copies the columns and leaves formatting and writing them to a thread, so the tick
+    # only pays for the copy.
+    CAPACITY = 4096
+    SLOW_TICK_SECONDS = 0.1
+
+    # Bits of the branches of a record, in the order setup_move goes through them.
+    CONTINUE_OBSTACLE = 1
+    LOW_LIFE = 2
+    BONUS = 4
+    OUT_OF_LANE = 8
+    STRAYING_ENEMY = 16
+    TO_VANGUARD = 32
+    NO_VANGUARD = 64
+    UNDER_ATTACK = 128
+    RETREAT_FROM_ATTACKER = 256
+    ATTACK = 512
+    NEXT_WAYPOINT = 1024
+    STAND = 2048
+
+    BRANCH_NAMES = [
+        (CONTINUE_OBSTACLE, "continue obstacle"), (LOW_LIFE, "low life"), (BONUS, "bonus"),
+        (OUT_OF_LANE, "out of lane"), (STRAYING_ENEMY, "straying enemy"), (TO_VANGUARD, "to vanguard"),
+        (NO_VANGUARD, "no vanguard"), (UNDER_ATTACK, "under attack"), (RETREAT_FROM_ATTACKER, "retreat from attacker"),
+        (ATTACK, "attack"), (NEXT_WAYPOINT, "next waypoint"), (STAND, "stand"),
+    ]
+
+    # Bits of the flags of a record.
+    DODGED = 1
+    SEARCHED = 2
+    OVERRUN = 4
+
+    FLAG_NAMES = [(DODGED, "dodged"), (SEARCHED, "searched"), (OVERRUN, "overrun")]
+    LEVEL_NAMES = ["full", "reduced", "minimal"]
+
+    COLUMNS = [
+        "ticks", "wizard_ids", "branches", "target_ids", "obstacle_ids", "retreats", "flags", "levels", "speeds",
+        "strafe_speeds", "turns", "actions", "move_seconds",
+    ]
+
+    shared_trace = None
+
+    def __init__(self, capacity=CAPACITY, directory=None):
+        self.capacity = capacity
+        self.directory = directory
+        self.ticks = array.array("q", bytes(8 * capacity))
+        self.wizard_ids = array.array("q", bytes(8 * capacity))
+        self.branches = array.array("h", bytes(2 * capacity))
+        self.target_ids = array.array("q", bytes(8 * capacity))
+        self.obstacle_ids = array.array("q", bytes(8 * capacity))
+        # -1 when no retreat was tried, else whether it succeeded.
+        self.retreats = array.array("b", bytes(capacity))
+        self.flags = array.array("b", bytes(capacity))
+        self.levels = array.array("b", bytes(capacity))
+        self.speeds = array.array("d", bytes(8 * capacity))
+        self.strafe_speeds = array.array("d", bytes(8 * capacity))
+        self.turns = array.array("d", bytes(8 * capacity))
+        self.actions = array.array("b", bytes(capacity))
+        self.move_seconds = array.array("d", bytes(8 * capacity))
+
+        self.index = 0
+        self.record_count = 0
+        self.dumped_record_count = 0
+        self.dump_requested = False
+        self.dump_count = 0
+        self.writer = None
+
+    @classmethod
+    def shared(cls):
+        if cls.shared_trace is None:
+            cls.shared_trace = cls(directory=os.environ.get("STRATEGY_TRACE_DIR") or None)
+        return cls.shared_trace
+
+    def start(self, tick, wizard_id):
+        if self.record_count > 0:
+            self.index = (self.index + 1) % self.capacity
+        self.record_count += 1
+        index = self.index
+        self.ticks[index] = tick
+        self.wizard_ids[index] = wizard_id
+        self.branches[index] = 0
+        self.target_ids[index] = -1
+        self.obstacle_ids[index] = -1
+        self.retreats[index] = -1
+        self.flags[index] = 0
+
+    def branch(self, bit):
+        self.branches[self.index] |= bit
+
+    def target(self, unit_id):
+        self.target_ids[self.index] = unit_id
+
+    def obstacle(self, unit_id):
+        self.obstacle_ids[self.index] = unit_id
+
+    def retreat(self, succeeded):
+        self.retreats[self.index] = succeeded
+
+    def flag(self, bit):
+        self.flags[self.index] |= bit
+
+    def finish(self, move, level, seconds):
+        index = self.index
+        self.levels[index] = level
+        self.move_seconds[index] = seconds
+        self.replace_move(move)
+
+    def replace_move(self, move):
+        # Also for the move sent in place of one that was cut short.
+        index = self.index
+        self.speeds[index] = move.speed
+        self.strafe_speeds[index] = move.strafe_speed
+        self.turns[index] = move.turn
+        self.actions[index] = move.action or 0
+
+    def last_tick(self):
+        return self.ticks[self.index] if self.record_count > 0 else -1
+
+    def install_dump_signal(self):
+        # Makes SIGUSR1 ask for a dump, which Runner writes once the tick is over. Only on Unix and in the main
+        # thread; elsewhere the trace is dumped on exceptions and slow ticks only.
+        if not hasattr(signal, "SIGUSR1"):
+            return
+
+        def on_dump_signal(signal_number, frame):
+            self.dump_requested = True
+
+        try:
+            signal.signal(signal.SIGUSR1, on_dump_signal)
+        except ValueError:
+            pass
+
+    def dump_slow_tick(self, tick):
+        # A run of slow ticks is dumped once: after a dump, the next waits until half of the buffer is new.
+        if self.dump_count > 0 and self.record_count - self.dumped_record_count < self.capacity // 2:
+            return None
+        return self.dump(tick, "slow")
+
+    def records(self):
+        count = min(self.record_count, self.capacity)
+        for offset in range(count - 1, -1, -1):
+            index = (self.index - offset) % self.capacity
+            retreat = self.retreats[index]
+            yield {
+                "tick": self.ticks[index],
+                "wizard": self.wizard_ids[index],
+                "branches": [name for bit, name in DecisionTrace.BRANCH_NAMES if self.branches[index] & bit],
+                "target": self.target_ids[index] if self.target_ids[index] >= 0 else None,
+                "obstacle": self.obstacle_ids[index] if self.obstacle_ids[index] >= 0 else None,
+                "retreat": None if retreat < 0 else bool(retreat),
+                "flags": [name for bit, name in DecisionTrace.FLAG_NAMES if self.flags[index] & bit],
+                "level": DecisionTrace.LEVEL_NAMES[self.levels[index]],
+                "speed": self.speeds[index],
+                "strafe_speed": self.strafe_speeds[index],
+                "turn": self.turns[index],
+                "action": self.actions[index],
+                "move_ms": self.move_seconds[index] * 1e3,
+            }
+
+    def snapshot(self):
+        snapshot = copy.copy(self)
+        for name in DecisionTrace.COLUMNS:
+            setattr(snapshot, name, getattr(self, name)[:])
+        return snapshot
+
+    def dump(self, tick, reason):
+        # Returns the path the records are being written to, or None when dumps are off, there is nothing to dump or
+        # the last dump is still being written. The write itself is not waited for, and a file that cannot be written
+        # is given up on: a dump must never cost the game.
+        self.dump_requested = False
+        if self.directory is None or self.record_count == 0:
+            return None
+        if self.writer is not None and self.writer.is_alive():
+            return None
+        path = os.path.join(self.directory, "trace-%d-%s.jsonl" % (tick, reason))
+        self.writer = threading.Thread(target=DecisionTrace.write, args=(self.snapshot(), path), name="trace dump")
+        self.writer.start()
+        self.dumped_record_count = self.record_count
+        self.dump_count += 1
+        return path
+
+    def wait(self):
+        if self.writer is not None:
+            self.writer.join()
+
+    def write(self, path):
+        try:
+            with open(path, "w") as file:
+                file.write("".join(json.dumps(record) + "\n" for record in self.records()))
+        except OSError:
+            pass
@@ -0,0 +1,113 @@
+import io
+from types import MethodType
+
+import ProtocolSchema
+from RemoteProcessClient import RemoteProcessClient
+
+
+class LazyFields:
+    def __getattr__(self, name):
+        lazy_fields = self.__dict__.get("lazy_fields")
+        if lazy_fields is None or name not in lazy_fields:
+            raise AttributeError("'%s' object has no attribute '%s'" % (self.__class__.__name__, name))
+
+        decode, data = lazy_fields.pop(name)
+        value = decode(data)
+        setattr(self, name, value)
+        return value
+
+
+class SectionDecoder(RemoteProcessClient):
+    def __init__(self):
+        RemoteProcessClient.__init__(self, None, None, io.BytesIO())
+
+    def decode(self, data, read_method, args):
+        self.read_view = memoryview(data)
+        self.read_offset = 0
+        self.read_limit = data.__len__()
+        return getattr(self, read_method)(*args)
+
+    def fill_read_buffer(self, byte_count):
+        raise IOError("Can't read %s bytes from skipped section." % str(byte_count))
+
+
+class DecodeProfile:
+    def __init__(self, skipped_fields_by_entity_name):
+        self.skipped_fields_by_entity_name = {}
+        self.model_class_by_entity_name = {}
+        self.section_decoder = None
+
+        for entity_name, field_names in skipped_fields_by_entity_name.items():
+            entity_type = ProtocolSchema.ENTITY_TYPE_BY_NAME.get(entity_name)
+            if entity_type is None:
+                raise ValueError("Unknown entity type '%s'." % entity_name)
+
+            field_type_by_name = dict(entity_type.fields)
+            for field_name in field_names:
+                field_type = field_type_by_name.get(field_name)
+                if field_type is None:
+                    raise ValueError("Entity type '%s' has no field '%s'." % (entity_name, field_name))
+                if field_type.struct_format is not None:
+                    raise ValueError("Field '%s.%s' is fixed-width and is decoded together with its neighbours."
+                                     % (entity_name, field_name))
+                entity_name_of_field = getattr(field_type, "entity_name", None)
+                if entity_name_of_field is not None and ProtocolSchema.contains_registry(
+                        ProtocolSchema.ENTITY_TYPE_BY_NAME[entity_name_of_field]):
+                    raise ValueError("Field '%s.%s' holds units the server may refer back to and can't be skipped."
+                                     % (entity_name, field_name))
+
+            if field_names:
+                self.skipped_fields_by_entity_name[entity_name] = frozenset(field_names)
+                self.model_class_by_entity_name[entity_name] = type(
+                    "Lazy" + entity_type.model_class.__name__, (LazyFields, entity_type.model_class), {}
+                )
+
+        self.functions = {}
+        for entity_name in self.skipped_fields_by_entity_name:
+            constants = {}
+            functions = [ProtocolSchema.generate_reader(
+                ProtocolSchema.ENTITY_TYPE_BY_NAME[entity_name], RemoteProcessClient.BYTE_ORDER_FORMAT_STRING,
+                constants, self
+            )]
+            self.functions.update(ProtocolSchema.compile_functions("profile %s" % entity_name, functions, constants))
+
+    def skipped_fields(self, entity_type):
+        return self.skipped_fields_by_entity_name.get(entity_type.name, frozenset())
+
+    def model_class(self, entity_type):
+        return self.model_class_by_entity_name.get(entity_type.name, entity_type.model_class)
+
+    def lazy_decoder(self, field_type):
+        read_method = field_type.read_method
+        args = field_type.args
+
+        def decode(data):
+            if self.section_decoder is None:
+                self.section_decoder = SectionDecoder()
+            return self.section_decoder.decode(data, read_method, args)
+
+        return decode
+
+    def install(self, client):
+        for function_name, function in self.functions.items():
+            setattr(client, function_name, MethodType(function, client))
+
+    def create(self, entity_type, values):
+        skipped_fields = self.skipped_fields(entity_type)
+        if not skipped_fields:
+            return entity_type.create(values)
+
+        field_values = []
+        lazy_fields = {}
+
+        for (field_name, field_type), field_value in zip(entity_type.fields, values):
+            if field_name in skipped_fields:
+                lazy_fields[field_name] = (self.lazy_decoder(field_type), field_value)
+                field_value = None
+            field_values.append(field_value)
+
+        value = self.model_class(entity_type)(*field_values)
+        for field_name in lazy_fields:
+            delattr(value, field_name)
+        value.lazy_fields = lazy_fields
+        return value
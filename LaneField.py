@@ -0,0 +1,145 @@
+import array
+import math
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class LaneField:
+    # Distances to every lane and along every lane, sampled on a grid of nodes cell_size apart over the whole map.
+    # The projection follows MyStrategy: the closest waypoint segment wins (the first one on ties) and the distance
+    # along the lane is measured up to the foot of the perpendicular on that segment.
+    CELL_SIZE = 20.0
+
+    # The distance along a lane jumps where the closest segment changes from one to another, as on the inner side of
+    # a bend. Elsewhere it changes by at most the distance between two points, so a cell whose corners differ by more
+    # than its diagonal plus this slack straddles a jump, and the lane field has no answer there.
+    JUMP_SLACK = 1.0
+
+    def __init__(self, waypoints_by_lane, lanes, map_size, cell_size=CELL_SIZE, interpolate=True):
+        if numpy is None:
+            raise ImportError("NumPy is required to build the lane field.")
+
+        self.lanes = list(lanes)
+        self.map_size = map_size
+        self.cell_size = cell_size
+        self.interpolate = interpolate
+        self.node_count = int(math.ceil(map_size / cell_size)) + 1
+
+        coordinates = numpy.arange(self.node_count, dtype=numpy.float64) * cell_size
+        xs, ys = numpy.meshgrid(coordinates, coordinates, indexing="ij")
+
+        self.distance_by_lane = {}
+        self.arc_length_by_lane = {}
+        self.arc_length_jumps_by_lane = {}
+        distances = []
+        max_arc_length_spread = cell_size * math.sqrt(2.0) + LaneField.JUMP_SLACK
+
+        for lane in self.lanes:
+            distance, arc_length = LaneField.project(waypoints_by_lane[lane], xs, ys)
+            distances.append(distance)
+            self.distance_by_lane[lane] = LaneField.to_array("f", distance)
+            self.arc_length_by_lane[lane] = LaneField.to_array("f", arc_length)
+
+            corners = numpy.stack([arc_length[:-1, :-1], arc_length[:-1, 1:], arc_length[1:, :-1], arc_length[1:, 1:]])
+            jumps = corners.max(axis=0) - corners.min(axis=0) > max_arc_length_spread
+            self.arc_length_jumps_by_lane[lane] = LaneField.to_array("b", jumps)
+
+        self.nearest_lane_indices = LaneField.to_array("b", numpy.argmin(numpy.stack(distances), axis=0))
+
+    @staticmethod
+    def project(waypoints, xs, ys):
+        min_distance = None
+        arc_length = None
+        path_length = 0.0
+
+        for start, end in zip(waypoints, waypoints[1:]):
+            dx = end.x - start.x
+            dy = end.y - start.y
+            squared_length = dx * dx + dy * dy
+            if squared_length == 0:
+                t = numpy.zeros_like(xs)
+            else:
+                t = numpy.clip(((xs - start.x) * dx + (ys - start.y) * dy) / squared_length, 0.0, 1.0)
+
+            distance = numpy.hypot(xs - (start.x + t * dx), ys - (start.y + t * dy))
+            segment_arc_length = path_length + t * math.sqrt(squared_length)
+
+            if min_distance is None:
+                min_distance = distance
+                arc_length = segment_arc_length
+            else:
+                closer = distance < min_distance
+                min_distance = numpy.where(closer, distance, min_distance)
+                arc_length = numpy.where(closer, segment_arc_length, arc_length)
+
+            path_length += math.hypot(dx, dy)
+
+        return min_distance, arc_length
+
+    @staticmethod
+    def to_array(typecode, values):
+        result = array.array(typecode)
+        result.frombytes(values.astype(numpy.dtype(typecode)).tobytes())
+        return result
+
+    def node(self, x, y):
+        limit = self.map_size
+        scale = 1.0 / self.cell_size
+        return (
+            int(min(max(x, 0.0), limit) * scale + 0.5) * self.node_count +
+            int(min(max(y, 0.0), limit) * scale + 0.5)
+        )
+
+    def cell(self, x, y):
+        limit = self.map_size
+        scale = 1.0 / self.cell_size
+        cell_limit = self.node_count - 2
+        return (
+            min(int(min(max(x, 0.0), limit) * scale), cell_limit) * (cell_limit + 1) +
+            min(int(min(max(y, 0.0), limit) * scale), cell_limit)
+        )
+
+    def sample(self, values, x, y):
+        if not self.interpolate:
+            return values[self.node(x, y)]
+
+        node_count = self.node_count
+        scale = 1.0 / self.cell_size
+        fx = min(max(x, 0.0), self.map_size) * scale
+        fy = min(max(y, 0.0), self.map_size) * scale
+        ix = min(int(fx), node_count - 2)
+        iy = min(int(fy), node_count - 2)
+        tx = fx - ix
+        ty = fy - iy
+        index = ix * node_count + iy
+
+        return (
+            (values[index] * (1.0 - ty) + values[index + 1] * ty) * (1.0 - tx) +
+            (values[index + node_count] * (1.0 - ty) + values[index + node_count + 1] * ty) * tx
+        )
+
+    def distance_to_lane(self, lane, x, y):
+        return self.sample(self.distance_by_lane[lane], x, y)
+
+    def distance_on_lane(self, lane, x, y):
+        if self.arc_length_jumps_by_lane[lane][self.cell(x, y)]:
+            return None
+        return self.sample(self.arc_length_by_lane[lane], x, y)
+
+    def nearest_lane(self, x, y):
+        if not self.interpolate:
+            node = self.node(x, y)
+            lane = self.lanes[self.nearest_lane_indices[node]]
+            return lane, self.distance_by_lane[lane][node]
+
+        nearest_lane = None
+        nearest_distance = None
+        for lane in self.lanes:
+            distance = self.sample(self.distance_by_lane[lane], x, y)
+            if (nearest_lane is None) or (nearest_distance > distance):
+                nearest_lane = lane
+                nearest_distance = distance
+        return nearest_lane, nearest_distance
@@ -0,0 +1,254 @@
+import math
+import random
+import time
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from model.ActionType import ActionType
+
+
+class MoveSearch:
+    # An anytime search over the moves of the wizard. Every candidate (speed, strafe speed, turn, action) is held for
+    # HORIZON_TICKS ticks and rolled forward with a kinematic model: the wizard turns at most its turn rate a tick,
+    # up to the full turn, and moves at its speeds clipped to the speed ellipse; other units keep their velocities and
+    # projectiles fly straight on until their range is covered. A candidate scores its progress towards the waypoint
+    # and the damage of its action, less the damage it takes from projectiles and from enemies whose attack is ready
+    # while it is in their reach, and less a penalty for every tick it runs into a unit or off the map.
+    #
+    # The first batch holds the move of the rules and a fixed grid of moves, later batches sample around the best
+    # candidate so far and uniformly over all moves, until the deadline. Every batch is rolled forward in NumPy,
+    # candidates against units against ticks, CHUNK_SIZE candidates at a time; a chunk is only started when one like
+    # the last fits before the deadline, and the candidates it leaves no time for are not scored. The deadline is on
+    # process_time, the clock the time budget charges moves to.
+    HORIZON_TICKS = 10
+    SEARCH_BUDGET_MICROSECONDS = 2000
+    BATCH_SIZE = 64
+    CHUNK_SIZE = 32
+
+    PROGRESS_WEIGHT = 0.25
+    COLLISION_PENALTY = 50.0
+    # The move of the rules wins ties and near ties, the search only steps in where it knows better.
+    RULE_MOVE_BONUS = 0.5
+
+    GRID_SPEED_FRACTIONS = [-1.0, 0.0, 1.0]
+    GRID_TURN_TICKS = [0.0, -1.0, 1.0, -4.0, 4.0, -30.0, 30.0]
+
+    def __init__(self, game, projectile_dodge, seed=0):
+        if numpy is None:
+            raise ImportError("NumPy is required to search moves.")
+
+        self.game = game
+        self.projectile_dodge = projectile_dodge
+        self.rnd = random.Random(seed)
+        self.damage_by_action = {
+            ActionType.STAFF: game.staff_damage,
+            ActionType.MAGIC_MISSILE: game.magic_missile_direct_damage,
+            ActionType.FROST_BOLT: game.frost_bolt_direct_damage,
+            ActionType.FIREBALL: game.fireball_explosion_max_damage
+        }
+        self.ticks = numpy.arange(1, MoveSearch.HORIZON_TICKS + 1, dtype=numpy.float64)
+
+        self.chunk_seconds = 0.0
+
+        self.search_count = 0
+        self.batch_count = 0
+        self.rollout_count = 0
+
+    def prepare(self, me, waypoint, threats, obstacles, projectiles, wizards):
+        # Threats are (unit, attack distance, damage, cooldown ticks) as for the danger map, obstacles are any units
+        # the wizard may run into. Positions are kept relative to the wizard.
+        self.me = me
+        self.waypoint = (waypoint.x - me.x, waypoint.y - me.y)
+        ticks = self.ticks
+
+        rows = [(unit.x - me.x, unit.y - me.y, unit.speed_x, unit.speed_y, attack_distance + me.radius, damage,
+                 unit.remaining_action_cooldown_ticks, max(cooldown_ticks, 1))
+                for unit, attack_distance, damage, cooldown_ticks in threats]
+        threat_columns = numpy.array(rows).reshape(-1, 8).T
+        # An enemy attacks on the ticks its cooldown comes round, from the tick it is ready on.
+        since_ready = ticks - threat_columns[6][:, None]
+        ready = (since_ready >= 0.0) & (since_ready % threat_columns[7][:, None] == 0.0)
+        threat_damages = ready * threat_columns[5][:, None]
+        threat_xs = threat_columns[0][:, None] + threat_columns[2][:, None] * ticks
+        threat_ys = threat_columns[1][:, None] + threat_columns[3][:, None] * ticks
+        # Only the threats that attack while the wizard may be in their reach can tell the candidates apart.
+        kept = (self.reachable(threat_xs, threat_ys, threat_columns[4][:, None]) & (threat_damages > 0.0)).any(axis=1)
+        self.threat_xs = threat_xs[kept]
+        self.threat_ys = threat_ys[kept]
+        self.threat_reaches = threat_columns[4][kept][:, None]
+        self.threat_damages = threat_damages[kept]
+
+        rows = [(unit.x - me.x, unit.y - me.y, unit.speed_x, unit.speed_y, unit.radius + me.radius)
+                for unit in obstacles if unit.id != me.id]
+        obstacle_columns = numpy.array(rows).reshape(-1, 5).T
+        obstacle_xs = obstacle_columns[0][:, None] + obstacle_columns[2][:, None] * ticks
+        obstacle_ys = obstacle_columns[1][:, None] + obstacle_columns[3][:, None] * ticks
+        kept = self.reachable(obstacle_xs, obstacle_ys, obstacle_columns[4][:, None]).any(axis=1)
+        self.obstacle_xs = obstacle_xs[kept]
+        self.obstacle_ys = obstacle_ys[kept]
+        self.obstacle_radii = obstacle_columns[4][kept][:, None]
+
+        self.projectile_dodge.track(projectiles, wizards)
+        positions, velocities, flight_ticks, hit_radii, damages = self.projectile_dodge.columns(me, projectiles)
+        all_ticks = numpy.arange(0, ticks.__len__() + 1, dtype=numpy.float64)
+        projectile_xs = positions[:, 0][:, None] + velocities[:, 0][:, None] * all_ticks
+        projectile_ys = positions[:, 1][:, None] + velocities[:, 1][:, None] * all_ticks
+        # A projectile covers at most its speed between two ticks, so checking the ticks with that much more slack
+        # keeps every projectile that may hit.
+        slack = hit_radii + numpy.hypot(velocities[:, 0], velocities[:, 1])
+        alive = all_ticks[:-1] < flight_ticks[:, None]
+        kept = (self.reachable(projectile_xs[:, 1:], projectile_ys[:, 1:], slack[:, None]) & alive).any(axis=1)
+        self.projectile_xs = projectile_xs[kept]
+        self.projectile_ys = projectile_ys[kept]
+        self.projectile_alive = alive[kept]
+        self.projectile_hit_radii = hit_radii[kept][:, None]
+        self.projectile_damages = damages[kept]
+
+    def reachable(self, xs, ys, distances):
+        # Whether the wizard, starting at the origin, may come within the distances of the positions on every tick.
+        reach = distances + self.game.wizard_forward_speed * self.ticks
+        return xs * xs + ys * ys <= reach * reach
+
+    def clip_speeds(self, speeds, strafe_speeds):
+        max_speeds = numpy.where(speeds > 0.0, self.game.wizard_forward_speed, self.game.wizard_backward_speed)
+        ellipse = numpy.hypot(speeds / max_speeds, strafe_speeds / self.game.wizard_strafe_speed)
+        factor = 1.0 / numpy.maximum(ellipse, 1.0)
+        return speeds * factor, strafe_speeds * factor
+
+    def evaluate(self, speeds, strafe_speeds, turns, attack_damages):
+        me = self.me
+        ticks = self.ticks
+        speeds, strafe_speeds = self.clip_speeds(speeds, strafe_speeds)
+
+        max_turn = self.game.wizard_max_turn_angle
+        angles = me.angle + numpy.sign(turns)[:, None] * numpy.minimum(numpy.abs(turns)[:, None], max_turn * ticks)
+        cos_angles = numpy.cos(angles)
+        sin_angles = numpy.sin(angles)
+        xs = numpy.cumsum(speeds[:, None] * cos_angles - strafe_speeds[:, None] * sin_angles, axis=1)
+        ys = numpy.cumsum(speeds[:, None] * sin_angles + strafe_speeds[:, None] * cos_angles, axis=1)
+
+        scores = attack_damages.copy()
+        waypoint_x, waypoint_y = self.waypoint
+        progress = math.hypot(waypoint_x, waypoint_y) - numpy.hypot(waypoint_x - xs[:, -1], waypoint_y - ys[:, -1])
+        scores += MoveSearch.PROGRESS_WEIGHT * progress
+
+        dx = self.threat_xs[None] - xs[:, None]
+        dy = self.threat_ys[None] - ys[:, None]
+        in_reach = dx * dx + dy * dy <= (self.threat_reaches * self.threat_reaches)[None]
+        scores -= (in_reach * self.threat_damages[None]).sum(axis=(1, 2))
+
+        dx = self.obstacle_xs[None] - xs[:, None]
+        dy = self.obstacle_ys[None] - ys[:, None]
+        collisions = (dx * dx + dy * dy < (self.obstacle_radii * self.obstacle_radii)[None]).sum(axis=(1, 2))
+        low = me.radius
+        high = self.game.map_size - me.radius
+        collisions += ((me.x + xs < low) | (me.x + xs > high) | (me.y + ys < low) | (me.y + ys > high)).sum(axis=1)
+        scores -= MoveSearch.COLLISION_PENALTY * collisions
+
+        if self.projectile_damages.__len__():
+            # A projectile hits when it comes close enough at any time between two ticks, both moving straight.
+            start_xs = numpy.concatenate([numpy.zeros((xs.__len__(), 1)), xs], axis=1)
+            start_ys = numpy.concatenate([numpy.zeros((ys.__len__(), 1)), ys], axis=1)
+            relative_xs = self.projectile_xs[None] - start_xs[:, None]
+            relative_ys = self.projectile_ys[None] - start_ys[:, None]
+            x0 = relative_xs[:, :, :-1]
+            y0 = relative_ys[:, :, :-1]
+            step_xs = relative_xs[:, :, 1:] - x0
+            step_ys = relative_ys[:, :, 1:] - y0
+            fraction = -(x0 * step_xs + y0 * step_ys) / numpy.maximum(step_xs * step_xs + step_ys * step_ys, 1e-9)
+            fraction = numpy.clip(fraction, 0.0, 1.0)
+            closest_xs = x0 + step_xs * fraction
+            closest_ys = y0 + step_ys * fraction
+            hits = (closest_xs * closest_xs + closest_ys * closest_ys < (self.projectile_hit_radii ** 2)[None])
+            hits = (hits & self.projectile_alive[None]).any(axis=2)
+            scores -= (hits * self.projectile_damages[None]).sum(axis=1)
+
+        self.batch_count += 1
+        self.rollout_count += scores.__len__()
+        return scores
+
+    def evaluate_before(self, deadline, speeds, strafe_speeds, turns, attack_damages, check=None):
+        # A chunk is only started when one like the last fits before the deadline, and after check, if given, let it.
+        scores = numpy.full(speeds.__len__(), -numpy.inf)
+        for start in range(0, speeds.__len__(), MoveSearch.CHUNK_SIZE):
+            if check is not None:
+                check()
+            chunk_start = time.process_time()
+            if chunk_start + self.chunk_seconds >= deadline:
+                break
+            end = start + MoveSearch.CHUNK_SIZE
+            scores[start:end] = self.evaluate(
+                speeds[start:end], strafe_speeds[start:end], turns[start:end], attack_damages[start:end])
+            self.chunk_seconds = time.process_time() - chunk_start
+        return scores
+
+    def grid_candidates(self, rule_move):
+        game = self.game
+        speeds, strafe_speeds, turns = [rule_move[0]], [rule_move[1]], [rule_move[2]]
+        for speed_fraction in MoveSearch.GRID_SPEED_FRACTIONS:
+            speed = speed_fraction * (game.wizard_forward_speed if speed_fraction > 0.0 else game.wizard_backward_speed)
+            for strafe_fraction in MoveSearch.GRID_SPEED_FRACTIONS:
+                for turn_ticks in MoveSearch.GRID_TURN_TICKS:
+                    speeds.append(speed)
+                    strafe_speeds.append(strafe_fraction * game.wizard_strafe_speed)
+                    turns.append(turn_ticks * game.wizard_max_turn_angle)
+        return numpy.array(speeds), numpy.array(strafe_speeds), numpy.array(turns)
+
+    def sampled_candidates(self, best_move, count):
+        game = self.game
+        rnd = self.rnd
+        speeds, strafe_speeds, turns = [], [], []
+        for index in range(count):
+            if index % 2 == 0:
+                speeds.append(best_move[0] + rnd.gauss(0.0, 1.0))
+                strafe_speeds.append(best_move[1] + rnd.gauss(0.0, 1.0))
+                turns.append(best_move[2] + rnd.gauss(0.0, game.wizard_max_turn_angle * 2.0))
+            else:
+                speeds.append(rnd.uniform(-game.wizard_backward_speed, game.wizard_forward_speed))
+                strafe_speeds.append(rnd.uniform(-game.wizard_strafe_speed, game.wizard_strafe_speed))
+                turns.append(rnd.uniform(-math.pi, math.pi))
+        return numpy.array(speeds), numpy.array(strafe_speeds), numpy.array(turns)
+
+    def search(self, rule_move, missile_target, deadline, check=None):
+        # rule_move is the (speed, strafe speed, turn, action, cast angle, min cast distance) the rules came up with,
+        # missile_target the unit a magic missile may be cast at this tick, if any. Returns the best move found
+        # before the deadline in the same form, the move of the rules when the deadline is over before the search
+        # starts. check is called before every chunk and may raise to give up the search.
+        self.search_count += 1
+        self.chunk_seconds = 0.0
+        me = self.me
+        missile = None
+        if missile_target is not None:
+            cast_angle = me.get_angle_to_unit(missile_target)
+            if abs(cast_angle) < self.game.staff_sector / 2.0:
+                min_cast_distance = me.get_distance_to_unit(missile_target) - missile_target.radius
+                missile = (ActionType.MAGIC_MISSILE, cast_angle, min_cast_distance)
+        missile_damage = self.damage_by_action[ActionType.MAGIC_MISSILE] if missile is not None else 0.0
+        rule_damage = self.damage_by_action.get(rule_move[3], 0.0)
+
+        speeds, strafe_speeds, turns = self.grid_candidates(rule_move)
+        attack_damages = numpy.full(speeds.__len__(), float(missile_damage))
+        attack_damages[0] = rule_damage + MoveSearch.RULE_MOVE_BONUS
+        scores = self.evaluate_before(deadline, speeds, strafe_speeds, turns, attack_damages, check)
+        index = int(numpy.argmax(scores))
+        if scores[index] == -numpy.inf:
+            return rule_move
+        best_move = rule_move if index == 0 else (speeds[index], strafe_speeds[index], turns[index])
+        best_score = scores[index]
+
+        while time.process_time() + self.chunk_seconds < deadline:
+            speeds, strafe_speeds, turns = self.sampled_candidates(best_move, MoveSearch.BATCH_SIZE)
+            scores = self.evaluate_before(
+                deadline, speeds, strafe_speeds, turns, numpy.full(speeds.__len__(), float(missile_damage)), check)
+            index = int(numpy.argmax(scores))
+            if scores[index] > best_score:
+                best_move, best_score = (speeds[index], strafe_speeds[index], turns[index]), scores[index]
+
+        if best_move is rule_move:
+            return rule_move
+        speed, strafe_speed = self.clip_speeds(numpy.array([best_move[0]]), numpy.array([best_move[1]]))
+        action, cast_angle, min_cast_distance = missile if missile is not None else (ActionType.NONE, 0.0, 0.0)
+        return float(speed[0]), float(strafe_speed[0]), float(best_move[2]), action, cast_angle, min_cast_distance
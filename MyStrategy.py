@@ -21,10 +21,26 @@ from model.Bonus import Bonus
 from model.BonusType import BonusType
 
 import math
+import os
 import random
+import time
+
+from DecisionTrace import DecisionTrace
+from LaneField import LaneField
+from MoveSearch import MoveSearch
+from PathPlanner import PathPlanner
+from ProjectileDodge import ProjectileDodge
+from StaticUnitGrid import StaticUnitGrid
+from StrategyLog import StrategyLog
+from TimeBudget import TimeBudget
+from UnitSpatialHash import UnitSpatialHash
 
 WAYPOINT_RADIUS = 150.0
 LOW_HP_FACTOR = 0.25
+AIM_COOLDOWN_TICKS = 10
+# Whether the move search second-guesses the rules within its deadline every tick, unless the strategy is told so
+# when it is made. STRATEGY_SEARCH_MOVES=on turns it on for every strategy of the process.
+SEARCH_MOVES = os.environ.get("STRATEGY_SEARCH_MOVES", "off").lower() == "on"
 
 
 def intersection_point(p, v, w):
@@ -94,6 +110,8 @@ def unit_class_str(unit):
 
 
 class Point2D:
+    __slots__ = ("x", "y", "radius")
+
     def __init__(self, x, y):
         self.x = x
         self.y = y
@@ -106,6 +124,42 @@ class Point2D:
         return self.get_distance_to(unit.x, unit.y)
 
 
+class TickContext:
+    def __init__(self):
+        self.view_by_name = {}
+
+        self.computed_count = 0
+        self.reused_count = 0
+        self.last_tick_computed_count = 0
+        self.last_tick_reused_count = 0
+        self.total_computed_count = 0
+        self.total_reused_count = 0
+        self.total_reused_count_by_name = {}
+
+    def get(self, name, compute):
+        view = self.view_by_name.get(name)
+
+        if view is None:
+            view = compute()
+            self.view_by_name[name] = view
+            self.computed_count += 1
+        else:
+            self.reused_count += 1
+            self.total_reused_count_by_name[name] = self.total_reused_count_by_name.get(name, 0) + 1
+
+        return view
+
+    def end_tick(self):
+        self.view_by_name.clear()
+
+        self.last_tick_computed_count = self.computed_count
+        self.last_tick_reused_count = self.reused_count
+        self.total_computed_count += self.computed_count
+        self.total_reused_count += self.reused_count
+        self.computed_count = 0
+        self.reused_count = 0
+
+
 def is_frozen(unit: LivingUnit):
     for status in unit.statuses:
         if status.type == StatusType.FROZEN:
@@ -128,12 +182,25 @@ def can_be_frozen(target):
 
 class MyStrategy:
 
-    def __init__(self):
+    def __init__(self, time_budget=None, log=None, trace=None, search_moves=None):
         self.lane = LaneType.TOP
         self.me = None
         self.world = None
         self.game = None
         self.current_move = None
+        self.tick_context = TickContext()
+        self.static_building_grid = StaticUnitGrid()
+        self.static_tree_grid = StaticUnitGrid()
+        self.unit_hash = None
+        self.lane_field = None
+        self.path_planner = None
+        self.projectile_dodge = None
+        self.move_search = None
+        self.search_moves = search_moves if search_moves is not None else SEARCH_MOVES
+        self.time_budget = time_budget
+        self.log = log if log is not None else StrategyLog.shared()
+        self.trace = trace if trace is not None else DecisionTrace.shared()
+        self.last_target_id = None
         self.waypoints = None
         self.waypoints_by_lane = None
         self.strafe_line = 0
@@ -194,22 +261,29 @@ class MyStrategy:
         else:
             return "%s[%s](%0.1f, %0.1f)" % (unit_class_str(unit), self.unit_faction_str(unit), unit.x, unit.y)
 
+    def describe_log_argument(self, value):
+        if isinstance(value, (Unit, Point2D)):
+            return self.unit_to_str(value)
+        return value
+
     def can_strafe(self, strafe_direction):
         distance_to_check = self.me.radius * 0.1
         x = self.me.x + math.cos(self.me.angle + strafe_direction * math.pi / 2) * distance_to_check
         if not (self.me.radius < x < self.game.map_size - self.me.radius):
-            print(self.world.tick_index, "X bump")
+            self.log.debug(self.world.tick_index, "X bump")
             return False
         y = self.me.y + math.sin(self.me.angle + strafe_direction * math.pi / 2) * distance_to_check
         if not (self.me.radius < y < self.game.map_size - self.me.radius):
-            print(self.world.tick_index, "Y bump")
+            self.log.debug(self.world.tick_index, "Y bump")
             return False
 
-        for unit in self.world.buildings + self.world.trees + self.world.minions + self.world.wizards:
+        radius = self.me.radius
+        nearby_units = self.building_grid().query_circle(x, y, radius) + self.tree_grid().query_circle(x, y, radius)
+        for unit in nearby_units + self.world.minions + self.world.wizards:
             if unit.id == self.me.id:
                 continue
             if unit.get_distance_to(x, y) <= unit.radius + self.me.radius:
-                print(self.world.tick_index, "Bump with %s" % self.unit_to_str(unit))
+                self.log.debug(self.world.tick_index, "Bump with %s", unit)
                 return False
 
         return True
@@ -228,6 +302,9 @@ class MyStrategy:
         self.world = world
         self.game = game
         self.current_move = move
+        # The strategies of a team share the log; the wizards are of one faction, so any that moved describes units.
+        self.log.describe = self.describe_log_argument
+        self.tick_context.end_tick()
 
     def select_target(self, target1: LivingUnit, target2: LivingUnit):
         if target1 is None:
@@ -285,19 +362,34 @@ class MyStrategy:
         else:
             return target2
 
+    def get_last_target(self):
+        for unit in self.world.wizards + self.world.minions + self.world.buildings:
+            if unit.id == self.last_target_id:
+                if self.is_enemy(unit) and self.me.get_distance_to_unit(unit) - unit.radius <= self.me.cast_range:
+                    return unit
+                return None
+        return None
+
     def get_nearest_target(self) -> LivingUnit:
-        attacker = self.get_closest_attacker()
-        if attacker is not None:
-            return attacker
-        nearest_target = None
-        for target in self.enemy_units():
-            distance = self.me.get_distance_to_unit(target) - target.radius  # allow minimal collision
-            if distance > self.me.cast_range:
-                continue
-            nearest_target = self.select_target(nearest_target, target)
+        if self.time_budget.level == TimeBudget.MINIMAL and self.last_target_id is not None:
+            last_target = self.get_last_target()
+            if last_target is not None:
+                return last_target
+        nearest_target = self.get_closest_attacker()
+        if nearest_target is None:
+            for target, target_distance in zip(self.nearby_enemy_units(), self.nearby_enemy_distances()):
+                distance = target_distance - target.radius  # allow minimal collision
+                if distance > self.me.cast_range:
+                    continue
+                nearest_target = self.select_target(nearest_target, target)
+        self.last_target_id = nearest_target.id if nearest_target is not None else None
         return nearest_target
 
     def get_unit_distance_on_lane(self, lane: LaneType, unit):
+        if self.lane_field is not None:
+            distance = self.lane_field.distance_on_lane(lane, unit.x, unit.y)
+            if distance is not None:
+                return distance
         wp = self.waypoints_by_lane[lane]
         min_segment_distance = None
         unit_distance_on_lane = None
@@ -312,19 +404,24 @@ class MyStrategy:
         return unit_distance_on_lane
 
     def get_unit_distance_to_lane(self, lane: LaneType, unit):
+        if self.lane_field is not None:
+            return self.lane_field.distance_to_lane(lane, unit.x, unit.y)
         wp = self.waypoints_by_lane[lane]
         return min(distance_to_segment(unit, wp[i], wp[i+1]) for i in range(len(wp) - 1))
 
     def get_unit_lane(self, unit):
         if (type(unit) is Building) and (unit.type == BuildingType.FACTION_BASE):
             return None
-        closest_lane = None
-        distance_to_closest_lane = None
-        for lane in [LaneType.TOP, LaneType.MIDDLE, LaneType.BOTTOM]:
-            distance_to_lane = self.get_unit_distance_to_lane(lane, unit)
-            if (closest_lane is None) or (distance_to_closest_lane > distance_to_lane):
-                closest_lane = lane
-                distance_to_closest_lane = distance_to_lane
+        if self.lane_field is not None:
+            closest_lane, distance_to_closest_lane = self.lane_field.nearest_lane(unit.x, unit.y)
+        else:
+            closest_lane = None
+            distance_to_closest_lane = None
+            for lane in [LaneType.TOP, LaneType.MIDDLE, LaneType.BOTTOM]:
+                distance_to_lane = self.get_unit_distance_to_lane(lane, unit)
+                if (closest_lane is None) or (distance_to_closest_lane > distance_to_lane):
+                    closest_lane = lane
+                    distance_to_closest_lane = distance_to_lane
         if distance_to_closest_lane is not None:
             if distance_to_closest_lane > 400:
                 return None
@@ -350,14 +447,14 @@ class MyStrategy:
             if distance > vanguard_distance:
                 vanguard = ally
                 vanguard_distance = distance
-        print(self.world.tick_index, "vanguard: %s" % self.unit_to_str(vanguard))
+        self.log.debug(self.world.tick_index, "vanguard: %s", vanguard)
         return vanguard
 
-    def aims_me(self, enemy):
-        distance = self.me.get_distance_to_unit(enemy) - self.me.radius
+    def aims_me(self, enemy, enemy_distance):
+        distance = enemy_distance - self.me.radius
         if distance > self.get_attack_distance(enemy):
             return False
-        if enemy.remaining_action_cooldown_ticks > 10:
+        if enemy.remaining_action_cooldown_ticks > AIM_COOLDOWN_TICKS:
             return False
         # if type(enemy) is not Wizard:
         #    for ally in self.allies():
@@ -372,15 +469,29 @@ class MyStrategy:
             return closest_orc
         closest_attacker = None
         closest_attacker_distance = None
-        for enemy in self.enemy_units():
-            if not self.aims_me(enemy):
+        for enemy, attacker_distance in zip(self.nearby_enemy_units(), self.nearby_enemy_distances()):
+            if not self.aims_me(enemy, attacker_distance):
                 continue
-            attacker_distance = self.me.get_distance_to_unit(enemy)
             if (closest_attacker_distance is None) or (closest_attacker_distance > attacker_distance):
                 closest_attacker = enemy
                 closest_attacker_distance = attacker_distance
         return closest_attacker
 
+    def get_attack_damage(self, unit):
+        if type(unit) is Wizard:
+            return self.game.magic_missile_direct_damage
+        return unit.damage
+
+    def get_attack_cooldown_ticks(self, unit):
+        if type(unit) is Wizard:
+            return self.game.magic_missile_cooldown_ticks
+        return unit.cooldown_ticks
+
+    def get_threat(self, enemy):
+        return (
+            enemy, self.get_attack_distance(enemy), self.get_attack_damage(enemy), self.get_attack_cooldown_ticks(enemy)
+        )
+
     def is_enemy(self, unit):
         if unit.faction == self.me.faction:
             return False
@@ -398,16 +509,14 @@ class MyStrategy:
     def get_closest_orc_attacker(self):
         closest_attacker = None
         closest_attacker_life = None
-        for attacker in self.world.minions:
-            if not self.is_enemy(attacker):
+        for attacker, attacker_distance in zip(self.nearby_enemy_units(), self.nearby_enemy_distances()):
+            if not isinstance(attacker, Minion) or attacker.type != MinionType.ORC_WOODCUTTER:
                 continue
-            if attacker.type != MinionType.ORC_WOODCUTTER:
-                continue
-            distance = self.me.get_distance_to_unit(attacker) - self.me.radius
+            distance = attacker_distance - self.me.radius
             attack_distance = self.get_attack_distance(attacker)
             if attack_distance < distance:
                 continue
-            print(self.world.tick_index, "Attacker: %s" % self.unit_to_str(attacker))
+            self.log.debug(self.world.tick_index, "Attacker: %s", attacker)
             if (closest_attacker is None) or attacker.life < closest_attacker_life:
                 closest_attacker = attacker
                 closest_attacker_life = attacker.life
@@ -416,25 +525,90 @@ class MyStrategy:
     def get_closest_wizard_attacker(self):
         closest_wizard = None
         closest_wizard_distance = None
-        for wizard in self.world.wizards:
-            if wizard.faction == self.me.faction:
-                continue
-            distance = self.me.get_distance_to_unit(wizard) - self.me.radius
+        wizards = self.nearby_other_faction_wizards()
+        for wizard, wizard_distance in zip(wizards, self.me.get_distances_to_units(wizards)):
+            distance = wizard_distance - self.me.radius
             if distance > self.me.cast_range:
                 continue
-            print(self.world.tick_index, "Hazard: %s" % self.unit_to_str(wizard))
+            self.log.debug(self.world.tick_index, "Hazard: %s", wizard)
             if (closest_wizard is None) or distance < closest_wizard_distance:
                 closest_wizard = wizard
                 closest_wizard_distance = distance
         return closest_wizard
 
-    def enemy_units(self):
-        targets = self.world.buildings + self.world.wizards + self.world.minions
-        return [unit for unit in targets if self.is_enemy(unit)]
+    def living_units(self):
+        return self.tick_context.get(
+            "living_units", lambda: self.world.buildings + self.world.wizards + self.world.minions
+        )
+
+    def building_grid(self):
+        return self.tick_context.get("building_grid", lambda: self.static_building_grid.update(self.world.buildings))
+
+    def tree_grid(self):
+        return self.tick_context.get("tree_grid", lambda: self.static_tree_grid.update(self.world.trees))
+
+    def units_near_path(self, destination, include_trees):
+        me = self.me
+        units = self.building_grid().query_segment(me.x, me.y, destination.x, destination.y, me.radius)
+        units = units + self.world.wizards + self.world.minions
+        if include_trees:
+            units += self.tree_grid().query_segment(me.x, me.y, destination.x, destination.y, me.radius)
+        return units
+
+    def moving_unit_hash(self):
+        return self.tick_context.get(
+            "moving_unit_hash", lambda: self.unit_hash.update(self.world.wizards + self.world.minions)
+        )
+
+    def other_factions(self):
+        return self.tick_context.get("other_factions", lambda: [
+            faction for faction in self.moving_unit_hash().factions() if faction != self.me.faction
+        ])
+
+    def register_angry_neutrals(self):
+        # is_enemy remembers every neutral it has seen angry; the neutrals out of range must be looked at as well.
+        for unit in self.moving_unit_hash().units_of_faction(Faction.NEUTRAL):
+            self.is_enemy(unit)
+        return True
+
+    def nearby_radius(self):
+        # The range checks of a tick share one query at the longest range any of them needs: they run their exact
+        # tests on the candidates anyway.
+        return self.tick_context.get("nearby_radius", lambda: max(
+            self.me.vision_range, self.me.cast_range, self.max_moving_unit_attack_distance() + self.me.radius
+        ))
+
+    def find_enemy_units_near(self, radius):
+        self.tick_context.get("registered_angry_neutrals", self.register_angry_neutrals)
+        units = self.moving_unit_hash().query_circle(self.me.x, self.me.y, radius, self.other_factions())
+        # Buildings are few and some of them have a long attack range, so they are always taken as candidates.
+        return [unit for unit in self.world.buildings + units if self.is_enemy(unit)]
+
+    def nearby_enemy_units(self):
+        return self.tick_context.get("nearby_enemy_units", lambda: self.find_enemy_units_near(self.nearby_radius()))
+
+    def nearby_enemy_distances(self):
+        return self.tick_context.get(
+            "nearby_enemy_distances", lambda: self.me.get_distances_to_units(self.nearby_enemy_units())
+        )
+
+    def nearby_other_faction_wizards(self):
+        return self.tick_context.get("nearby_other_faction_wizards", lambda: [
+            unit for unit in self.moving_unit_hash().query_circle(
+                self.me.x, self.me.y, self.nearby_radius(), self.other_factions()
+            ) if isinstance(unit, Wizard)
+        ])
+
+    def max_moving_unit_attack_distance(self):
+        return self.tick_context.get("max_moving_unit_attack_distance", lambda: max(
+            [self.game.orc_woodcutter_attack_range * 2, self.game.fetish_blowdart_attack_range] +
+            [wizard.cast_range for wizard in self.world.wizards]
+        ))
 
     def allies(self):
-        units = self.world.buildings + self.world.wizards + self.world.minions
-        return [unit for unit in units if (unit.faction == self.me.faction) and (unit.id != self.me.id)]
+        return self.tick_context.get("allies", lambda: [
+            unit for unit in self.living_units() if (unit.faction == self.me.faction) and (unit.id != self.me.id)
+        ])
 
     def get_next_waypoint(self):
         last_waypoint = self.waypoints[-1]
@@ -460,6 +634,10 @@ class MyStrategy:
 
     def initialize_strategy(self, me: Wizard, game: Game, move: Move):
         random.seed(game.random_seed)
+        if self.time_budget is None:
+            self.time_budget = TimeBudget(game.tick_count)
+        self.unit_hash = UnitSpatialHash(game.wizard_cast_range)
+        self.path_planner = PathPlanner(game.map_size, game.wizard_radius)
         map_size = game.map_size
         self.waypoints_by_lane = {
             LaneType.MIDDLE: [
@@ -499,13 +677,13 @@ class MyStrategy:
 
         if me.id in [1, 2, 6, 7]:
             self.lane = LaneType.TOP
-            print("TOP")
+            self.log.info(None, "TOP")
         elif me.id in [3, 8]:
             self.lane = LaneType.MIDDLE
-            print("MIDDLE")
+            self.log.info(None, "MIDDLE")
         else:
             self.lane = LaneType.BOTTOM
-            print("BOTTOM")
+            self.log.info(None, "BOTTOM")
 
         if me.master:
             move.messages = [
@@ -524,6 +702,19 @@ class MyStrategy:
         # self.lane = LaneType.MIDDLE
         self.waypoints = self.waypoints_by_lane[self.lane]
 
+        try:
+            self.lane_field = LaneField(
+                self.waypoints_by_lane, [LaneType.TOP, LaneType.MIDDLE, LaneType.BOTTOM], map_size)
+        except ImportError:
+            self.lane_field = None
+
+        try:
+            self.projectile_dodge = ProjectileDodge(game)
+            self.move_search = MoveSearch(game, self.projectile_dodge)
+        except ImportError:
+            self.projectile_dodge = None
+            self.move_search = None
+
     def get_attack_distance(self, unit):
         if type(unit) is Wizard:
             return unit.cast_range
@@ -535,7 +726,7 @@ class MyStrategy:
             elif unit.type == MinionType.FETISH_BLOWDART:
                 return self.game.fetish_blowdart_attack_range
         else:
-            print(self.world.tick_index, "Unknown enemy", unit)
+            self.log.warning(self.world.tick_index, "Unknown enemy %s", unit)
             return 0
 
     def go_to_next_waypoint(self):
@@ -546,7 +737,7 @@ class MyStrategy:
             return
         if next_waypoint != self.last_waypoint:
             self.last_waypoint = next_waypoint
-            print(self.world.tick_index, "Go to next waypoint")
+            self.log.debug(self.world.tick_index, "Go to next waypoint")
         self.go_to_waypoint(next_waypoint)
 
     def get_next_point(self):
@@ -570,13 +761,18 @@ class MyStrategy:
         dst2 = self.get_sub_waypoint(waypoint)
         closest_obstacle = None
         distance_to_closest_obstacle = None
-        for obstacle in self.world.trees + self.enemy_units():
+        radius = self.me.radius
+        reach = max(src.get_distance_to_unit(dst1), src.get_distance_to_unit(dst2)) + radius
+        obstacles = self.tree_grid().query_box(
+            min(src.x, dst1.x, dst2.x) - radius, min(src.y, dst1.y, dst2.y) - radius,
+            max(src.x, dst1.x, dst2.x) + radius, max(src.y, dst1.y, dst2.y) + radius
+        ) + (self.nearby_enemy_units() if reach <= self.nearby_radius() else self.find_enemy_units_near(reach))
+        for obstacle, distance_to_obstacle in zip(obstacles, self.me.get_distances_to_units(obstacles)):
             distance1 = distance_to_segment(obstacle, src, dst1)
             if distance1 > self.me.radius + obstacle.radius:
                 distance2 = distance_to_segment(obstacle, src, dst2)
                 if distance2 > self.me.radius + obstacle.radius:
                     continue
-            distance_to_obstacle = self.me.get_distance_to_unit(obstacle)
             if (distance_to_closest_obstacle is None) or (distance_to_obstacle < distance_to_closest_obstacle):
                 closest_obstacle = obstacle
                 distance_to_closest_obstacle = distance_to_obstacle
@@ -621,7 +817,7 @@ class MyStrategy:
         if distance < self.game.staff_range + target.radius:
             if self.me.remaining_cooldown_ticks_by_action[ActionType.STAFF] == 0:
                 if -self.game.staff_sector / 2.0 < angle < +self.game.staff_sector / 2.0:
-                    print(self.world.tick_index, "STAFF ATTACK for %s" % self.unit_to_str(target))
+                    self.log.debug(self.world.tick_index, "STAFF ATTACK for %s", target)
                     self.current_move.action = ActionType.STAFF
         if distance < self.me.cast_range + target.radius:
             if self.me.remaining_cooldown_ticks_by_action[ActionType.MAGIC_MISSILE] == 0:
@@ -629,7 +825,7 @@ class MyStrategy:
                 future_position = predict_position(target, ticks_to_achieve)
                 future_distance = self.me.get_distance_to_unit(future_position) - target.radius
                 if self.is_attack_angle(future_position, self.game.magic_missile_radius):
-                    print(self.world.tick_index, "MISSILE for %s" % self.unit_to_str(target))
+                    self.log.debug(self.world.tick_index, "MISSILE for %s", target)
                     self.current_move.cast_angle = self.me.get_angle_to_unit(future_position)
                     self.current_move.min_cast_distance = future_distance + self.game.magic_missile_radius
                     self.current_move.action = ActionType.MAGIC_MISSILE
@@ -638,22 +834,39 @@ class MyStrategy:
                 future_position = predict_position(target, ticks_to_achieve)
                 future_distance = self.me.get_distance_to_unit(future_position) - target.radius
                 if self.is_attack_angle(future_position, self.game.frost_bolt_radius):
-                    print(self.world.tick_index, "FROST for %s" % self.unit_to_str(target))
+                    self.log.debug(self.world.tick_index, "FROST for %s", target)
                     self.current_move.cast_angle = self.me.get_angle_to_unit(future_position)
                     self.current_move.min_cast_distance = future_distance + self.game.frost_bolt_radius
                     self.current_move.action = ActionType.FROST_BOLT
 
+    def plan_path(self):
+        # The planner works towards the next waypoint of the lane whatever the wizard is busy with, a slice of the
+        # search per tick, so that the path is ready once go_to_next_waypoint heads there. Behind the time budget the
+        # slices get smaller, and at the last resort the wizard walks the path it has.
+        if self.time_budget.level == TimeBudget.MINIMAL:
+            return
+        budget = PathPlanner.PLANNING_BUDGET_MICROSECONDS
+        if self.time_budget.level == TimeBudget.REDUCED:
+            budget *= 0.25
+        self.path_planner.update_obstacles(self.world.trees, self.world.buildings, self.me)
+        next_waypoint = self.get_next_waypoint()
+        self.path_planner.plan(self.me.x, self.me.y, next_waypoint.x, next_waypoint.y, budget)
+
     def go_to_waypoint(self, waypoint):
+        steering_point = self.path_planner.steering_point(self.me.x, self.me.y, waypoint.x, waypoint.y)
+        if steering_point is not None:
+            waypoint = Point2D(*steering_point)
+
         can_move = True
         distance_to_check = self.me.radius * 0.5
         dst = Point2D(
             self.me.x + math.cos(self.me.angle) * distance_to_check,
             self.me.y + math.sin(self.me.angle) * distance_to_check)
-        for unit in self.world.buildings + self.world.wizards + self.world.minions:
+        for unit in self.units_near_path(dst, False):
             if unit.id == self.me.id:
                 continue
             if distance_to_segment(unit, self.me, dst) < self.me.radius + unit.radius:
-                print(self.world.tick_index, "Cannot move")
+                self.log.debug(self.world.tick_index, "Cannot move")
                 can_move = False
                 break
         angle = self.me.get_angle_to(waypoint.x, waypoint.y)
@@ -662,9 +875,12 @@ class MyStrategy:
         if abs(angle) > self.game.staff_sector / 4.0:
             return True
 
-        obstacle = self.get_closest_obstacle(waypoint)
+        obstacle = None
+        if self.time_budget.level != TimeBudget.MINIMAL:
+            obstacle = self.get_closest_obstacle(waypoint)
         if obstacle is not None:
-            print(self.world.tick_index, "Obstacle: %s" % self.unit_to_str(obstacle))
+            self.log.debug(self.world.tick_index, "Obstacle: %s", obstacle)
+            self.trace.obstacle(obstacle.id)
             self.setup_attack(obstacle)
             self.last_tree = obstacle.id
             self.current_move.speed = self.game.wizard_forward_speed
@@ -678,6 +894,11 @@ class MyStrategy:
         return True
 
     def retreat(self):
+        retreated = self.try_retreat()
+        self.trace.retreat(retreated)
+        return retreated
+
+    def try_retreat(self):
         previous_waypoint = self.get_previous_waypoint()
 
         distance_to_check = self.me.radius * 0.5
@@ -689,7 +910,7 @@ class MyStrategy:
         if x_locked or y_locked:
             return False
 
-        for unit in self.world.buildings + self.world.minions + self.world.trees + self.world.wizards:
+        for unit in self.units_near_path(Point2D(x, y), True):
             if unit.id != self.me.id:
                 if distance_to_segment(unit, self.me, Point2D(x, y)) < self.me.radius + unit.radius:
                     return False
@@ -712,8 +933,8 @@ class MyStrategy:
     def find_closest_bonus(self):
         closest_bonus = None
         closest_bonus_distance = None
-        for bonus in self.world.bonuses:
-            bonus_distance = self.me.get_distance_to_unit(bonus)
+        bonuses = self.world.bonuses
+        for bonus, bonus_distance in zip(bonuses, self.me.get_distances_to_units(bonuses)):
             if bonus_distance > self.me.vision_range:
                 continue
             if (closest_bonus_distance is None) or (closest_bonus_distance > bonus_distance):
@@ -737,8 +958,7 @@ class MyStrategy:
     def get_straying_enemy(self):
         closest_straying_enemy = None
         closest_straying_enemy_distance = None
-        for enemy in self.enemy_units():
-            distance = self.me.get_distance_to_unit(enemy)
+        for enemy, distance in zip(self.nearby_enemy_units(), self.nearby_enemy_distances()):
             if distance > self.me.vision_range:
                 continue
             if type(enemy) in [Minion, Building]:
@@ -751,10 +971,8 @@ class MyStrategy:
     def get_wound_enemy(self):
         closest_wound_enemy = None
         closest_wound_enemy_distance = None
-        for wizard in self.world.wizards:
-            if wizard.faction == self.me.faction:
-                continue
-            distance = self.me.get_distance_to_unit(wizard)
+        wizards = self.nearby_other_faction_wizards()
+        for wizard, distance in zip(wizards, self.me.get_distances_to_units(wizards)):
             if distance > self.me.vision_range:
                 continue
             if wizard.life >= self.me.max_life * LOW_HP_FACTOR:
@@ -769,11 +987,11 @@ class MyStrategy:
         dst = Point2D(
             self.me.x + math.cos(self.me.angle) * distance_to_check,
             self.me.y + math.sin(self.me.angle) * distance_to_check)
-        for unit in self.world.buildings + self.world.wizards + self.world.minions + self.world.trees:
+        for unit in self.units_near_path(dst, True):
             if unit.id in [self.me.id, target.id]:
                 continue
             if distance_to_segment(unit, self.me, dst) < self.me.radius + unit.radius:
-                print(self.world.tick_index, "Freeway is blocked by %s" % self.unit_to_str(unit))
+                self.log.debug(self.world.tick_index, "Freeway is blocked by %s", unit)
                 return False
         return True
 
@@ -801,18 +1019,122 @@ class MyStrategy:
         elif next_skill == SkillType.SHIELD:
             self.has_shield = True
         self.last_level += 1
-        print(self.world.tick_index, "LEVEL UP! Level=%d, skill=%d" % (self.me.level, self.current_move.skill_to_learn))
+        self.log.info(
+            self.world.tick_index, "LEVEL UP! Level=%d, skill=%d", self.me.level, self.current_move.skill_to_learn)
+
+    def can_move(self, speed, strafe_speed):
+        if speed == 0 and strafe_speed == 0:
+            return True
+        distance_to_check = self.me.radius * 0.5
+        angle = self.me.angle + math.atan2(strafe_speed, speed)
+        dst = Point2D(
+            self.me.x + math.cos(angle) * distance_to_check,
+            self.me.y + math.sin(angle) * distance_to_check)
+        if not (self.me.radius < dst.x < self.game.map_size - self.me.radius):
+            return False
+        if not (self.me.radius < dst.y < self.game.map_size - self.me.radius):
+            return False
+        for unit in self.units_near_path(dst, True):
+            if unit.id == self.me.id:
+                continue
+            if distance_to_segment(unit, self.me, dst) < self.me.radius + unit.radius:
+                return False
+        return True
+
+    def dodge_projectiles(self):
+        if (self.projectile_dodge is None) or is_frozen(self.me):
+            return
+        projectiles = [projectile for projectile in self.world.projectiles if projectile.faction != self.me.faction]
+        self.time_budget.check()
+        moves = self.projectile_dodge.plan(
+            self.me, projectiles, self.world.wizards, self.current_move.speed, self.current_move.strafe_speed)
+        if moves is None:
+            return
+        for speed, strafe_speed, damage in moves:
+            self.time_budget.check()
+            if self.can_move(speed, strafe_speed):
+                self.log.info(
+                    self.world.tick_index, "Dodge: speed %.1f, strafe %.1f, damage %d", speed, strafe_speed, damage)
+                self.current_move.speed = speed
+                self.current_move.strafe_speed = strafe_speed
+                self.trace.flag(DecisionTrace.DODGED)
+                return
+
+    def can_cast_magic_missile(self):
+        if self.me.remaining_action_cooldown_ticks > 0:
+            return False
+        if self.me.remaining_cooldown_ticks_by_action[ActionType.MAGIC_MISSILE] > 0:
+            return False
+        return self.me.mana >= self.game.magic_missile_manacost
+
+    def search_move(self):
+        if (self.move_search is None) or is_frozen(self.me) or (self.time_budget.level != TimeBudget.FULL):
+            return
+        budget_seconds = min(MoveSearch.SEARCH_BUDGET_MICROSECONDS * 1e-6, self.time_budget.remaining_move_seconds())
+        deadline = time.process_time() + budget_seconds
+
+        me = self.me
+        reach = MoveSearch.HORIZON_TICKS * self.game.wizard_forward_speed + me.radius
+        unit_hash = self.moving_unit_hash()
+        obstacles = self.tree_grid().query_circle(me.x, me.y, reach) + \
+            self.building_grid().query_circle(me.x, me.y, reach) + \
+            unit_hash.query_circle(me.x, me.y, reach, unit_hash.factions())
+        threats = [self.get_threat(enemy) for enemy in self.nearby_enemy_units()]
+        projectiles = [projectile for projectile in self.world.projectiles if projectile.faction != me.faction]
+        if me.life < me.max_life * LOW_HP_FACTOR:
+            waypoint = self.get_previous_waypoint()
+        else:
+            waypoint = self.get_next_waypoint()
+        missile_target = self.get_nearest_target() if self.can_cast_magic_missile() else None
+
+        move = self.current_move
+        rule_move = (move.speed, move.strafe_speed, move.turn, move.action, move.cast_angle, move.min_cast_distance)
+        if time.process_time() >= deadline:
+            return
+        self.move_search.prepare(me, waypoint, threats, obstacles, projectiles, self.world.wizards)
+        best_move = self.move_search.search(rule_move, missile_target, deadline, self.time_budget.check)
+        if best_move is rule_move:
+            return
+        self.trace.flag(DecisionTrace.SEARCHED)
+        self.log.info(self.world.tick_index, "Search: speed %.1f, strafe %.1f, turn %.2f, action %s", *best_move[:4])
+        move.speed, move.strafe_speed, move.turn, move.action, move.cast_angle, move.min_cast_distance = best_move
 
     def move(self, me: Wizard, world: World, game: Game, move: Move):
         self.initialize_tick(me, world, game, move)
+        self.time_budget.start_move(world.tick_index)
+        self.trace.start(world.tick_index, me.id)
+        try:
+            # The watchdog of the time budget may give up the move at every check, which come between the stages and
+            # within the loops of the search and the dodge, never in the bookkeeping below.
+            self.setup_move()
+            self.time_budget.check()
+            if self.search_moves:
+                self.search_move()
+            self.dodge_projectiles()
+        finally:
+            self.time_budget.end_move()
+            self.trace.finish(self.current_move, self.time_budget.level, self.time_budget.last_move_seconds)
+
+    def recover(self):
+        # A move given up by the watchdog ran far too long, most likely in planning the path, so the planner starts
+        # over rather than resume the search that took so long.
+        if self.me is None:
+            return
+        self.path_planner = PathPlanner(self.game.map_size, self.game.wizard_radius)
+        self.last_tree = None
 
+    def setup_move(self):
         if self.game.skills_enabled:
             self.setup_skills()
 
+        self.plan_path()
+
         if self.last_tree is not None:
             obstacle = next((tree for tree in self.world.trees if tree.id == self.last_tree), None)
             if obstacle is not None:
-                print(self.world.tick_index, "Continue removing the obstacle")
+                self.log.debug(self.world.tick_index, "Continue removing the obstacle")
+                self.trace.branch(DecisionTrace.CONTINUE_OBSTACLE)
+                self.trace.obstacle(obstacle.id)
                 self.setup_attack(obstacle)
                 if abs(self.me.get_angle_to_unit(obstacle)) < self.game.staff_sector / 2:
                     self.current_move.speed = self.game.wizard_forward_speed
@@ -824,30 +1146,35 @@ class MyStrategy:
 
         move_forward = True
 
-        if me.life < me.max_life * LOW_HP_FACTOR:
+        if self.me.life < self.me.max_life * LOW_HP_FACTOR:
+            self.trace.branch(DecisionTrace.LOW_LIFE)
             nearest_target = self.get_nearest_target()
             if nearest_target is not None:
+                self.trace.target(nearest_target.id)
                 self.setup_attack(nearest_target)
             if self.retreat():
-                print(self.world.tick_index, "Medic!")
+                self.log.info(self.world.tick_index, "Medic!")
                 return
-            print(self.world.tick_index, "Medic needed, but no chance to retreat")
+            self.log.info(self.world.tick_index, "Medic needed, but no chance to retreat")
             move_forward = False
         else:
             bonus = self.find_closest_bonus()
             if bonus is not None:
-                print(self.world.tick_index, "Bonus: %s" % self.unit_to_str(bonus))
+                self.log.debug(self.world.tick_index, "Bonus: %s", bonus)
+                self.trace.branch(DecisionTrace.BONUS)
                 self.go_to_waypoint(bonus)
                 hazard = self.get_closest_wizard_attacker()
                 if hazard and hazard.get_distance_to_unit(bonus) < 800:
-                    print(self.world.tick_index, "Hazard: %s" % self.unit_to_str(hazard))
+                    self.log.debug(self.world.tick_index, "Hazard: %s", hazard)
+                    self.trace.target(hazard.id)
                     self.setup_attack(hazard)
                 return
 
         vanguard = self.get_vanguard()
         if vanguard is not None:
             if self.get_unit_lane(self.me) != self.lane:
-                print(self.world.tick_index, "Out of lane, go to vanguard")
+                self.log.debug(self.world.tick_index, "Out of lane, go to vanguard")
+                self.trace.branch(DecisionTrace.OUT_OF_LANE)
                 self.go_to_waypoint(vanguard)
                 move_forward = False
             else:
@@ -855,41 +1182,52 @@ class MyStrategy:
                 my_distance = self.get_unit_distance_on_lane(self.lane, self.me)
                 straying_enemy = self.get_straying_enemy()
                 if move_forward and (straying_enemy is not None):
+                    self.trace.branch(DecisionTrace.STRAYING_ENEMY)
                     self.go_to_waypoint(straying_enemy)
+                    self.trace.target(straying_enemy.id)
                     self.setup_attack(straying_enemy)
                     move_forward = False
                 elif my_distance + 30 > vanguard_distance:
                     if my_distance > vanguard_distance + 100:
+                        self.trace.branch(DecisionTrace.TO_VANGUARD)
                         self.go_to_waypoint(vanguard)
                     else:
+                        self.trace.branch(DecisionTrace.NO_VANGUARD)
                         if self.retreat():
-                            print(self.world.tick_index, "There is no vanguard. Retreat.")
+                            self.log.info(self.world.tick_index, "There is no vanguard. Retreat.")
                         else:
-                            print(self.world.tick_index, "There is no vanguard. Cannot retreat")
+                            self.log.info(self.world.tick_index, "There is no vanguard. Cannot retreat")
                     move_forward = False
 
         closest_attacker = self.get_closest_attacker()
         if closest_attacker is not None:
-            print(self.world.tick_index, "Under attack! %s" % self.unit_to_str(closest_attacker))
+            self.log.info(self.world.tick_index, "Under attack! %s", closest_attacker)
+            self.trace.branch(DecisionTrace.UNDER_ATTACK)
             if self.shall_retreat_from_attacker(closest_attacker):
+                self.trace.branch(DecisionTrace.RETREAT_FROM_ATTACKER)
                 if self.retreat():
-                    print(self.world.tick_index, "Retreat")
+                    self.log.info(self.world.tick_index, "Retreat")
                 else:
-                    print(self.world.tick_index, "Failed to retreat")
+                    self.log.info(self.world.tick_index, "Failed to retreat")
                 move_forward = False
             else:
-                print(self.world.tick_index, "Should not retreat")
+                self.log.debug(self.world.tick_index, "Should not retreat")
         else:
-            print(self.world.tick_index, "There is no attacker")
+            self.log.debug(self.world.tick_index, "There is no attacker")
 
         nearest_target = self.get_nearest_target()
         if nearest_target is not None:
+            self.trace.branch(DecisionTrace.ATTACK)
+            self.trace.target(nearest_target.id)
             self.setup_attack(nearest_target)
             if not self.game.skills_enabled and move_forward and self.current_move.action != ActionType.NONE:
                 self.current_move.speed = self.game.wizard_forward_speed
             return
 
-        print(self.world.tick_index, "No target to attack")
+        self.log.debug(self.world.tick_index, "No target to attack")
 
         if move_forward:
+            self.trace.branch(DecisionTrace.NEXT_WAYPOINT)
             self.go_to_next_waypoint()
+        else:
+            self.trace.branch(DecisionTrace.STAND)
@@ -0,0 +1,428 @@
+import heapq
+import math
+import time
+
+INFINITY = float("inf")
+SQRT_2 = math.sqrt(2.0)
+
+DIRECTIONS = [(1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (1, -1), (-1, 1), (-1, -1)]
+
+
+class PathPlanner:
+    # D* Lite over an occupancy grid of the map. A cell is blocked while its centre lies within the radius of a tree
+    # or a building plus the walker's radius and a clearance, and the outer ring of cells is always blocked; moving
+    # units are left to the local checks of the strategy. The search runs backwards from the goal, so the walker
+    # moving only shifts the heuristic, and a tree that is cut down only reopens the vertices whose cost to the goal
+    # it changes. Trees nobody has seen yet are assumed away and get blocked as they come into view.
+    CELL_SIZE = 30.0
+    CLEARANCE = 15.0
+
+    # A search that doesn't finish within the budget is resumed on the next call; until it has finished the planner
+    # has no path to offer. Taking in the obstacles that changed counts against the same budget.
+    PLANNING_BUDGET_MICROSECONDS = 1000
+    STEPS_PER_TIME_CHECK = 8
+
+    # The path is followed this many cells ahead, and the walker is steered at the farthest of them it can see.
+    LOOKAHEAD_CELLS = 16
+
+    def __init__(self, map_size, unit_radius, cell_size=CELL_SIZE):
+        self.cell_size = cell_size
+        self.unit_radius = unit_radius
+        self.column_count = column_count = int(math.ceil(map_size / cell_size))
+        self.blocked_counts = [0] * (column_count * column_count)
+        self.border_cells = bytearray(column_count * column_count)
+        self.obstacles_by_id = {}
+        self.cells_by_obstacle_id = {}
+        self.trees = None
+        self.buildings = None
+        self.observer = None
+        self.scanned_units = None
+        self.scan_index = 0
+        self.seen_ids = None
+        self.missing_obstacles = None
+
+        # Every neighbour of a cell off the border is on the map, so steps are plain index offsets: the neighbour,
+        # the cost and the two cells whose corners a diagonal step cuts (the neighbour itself for straight steps).
+        self.steps = [
+            (dx * column_count + dy, cell_size * SQRT_2, dx * column_count, dy) if dx and dy else
+            (dx * column_count + dy, cell_size, dx * column_count + dy, dx * column_count + dy)
+            for dx, dy in DIRECTIONS
+        ]
+
+        for cell_x in range(column_count):
+            for cell_y in (0, column_count - 1):
+                self.border_cells[cell_x * column_count + cell_y] = 1
+                self.border_cells[cell_y * column_count + cell_x] = 1
+        edge_indices = [
+            index for index in range(column_count)
+            if min((index + 0.5) * cell_size, map_size - (index + 0.5) * cell_size) < unit_radius
+        ]
+        for index in range(column_count):
+            for edge_index in edge_indices:
+                self.border_cells[index * column_count + edge_index] = 1
+                self.border_cells[edge_index * column_count + index] = 1
+        for cell, border in enumerate(self.border_cells):
+            self.blocked_counts[cell] += border
+
+        self.goal = None
+        self.start = None
+        self.start_x = 0
+        self.start_y = 0
+        self.g = {}
+        self.rhs = {}
+        self.queue = []
+        self.queued_keys = {}
+        self.key_modifier = 0.0
+        self.pending_cells = set()
+        self.converged = False
+        self.revision = 0
+        self.path = None
+        self.path_key = None
+
+        self.expansion_count = 0
+        self.search_count = 0
+        self.over_budget_count = 0
+
+    def cell_of(self, x, y):
+        column_count = self.column_count
+        cell_x = min(max(int(x / self.cell_size), 0), column_count - 1)
+        cell_y = min(max(int(y / self.cell_size), 0), column_count - 1)
+        return cell_x * column_count + cell_y
+
+    def cell_center(self, cell):
+        cell_x, cell_y = divmod(cell, self.column_count)
+        return (cell_x + 0.5) * self.cell_size, (cell_y + 0.5) * self.cell_size
+
+    def heuristic(self, cell1, cell2):
+        x1, y1 = divmod(cell1, self.column_count)
+        x2, y2 = divmod(cell2, self.column_count)
+        dx = abs(x1 - x2)
+        dy = abs(y1 - y2)
+        return (dx + dy + (SQRT_2 - 2.0) * min(dx, dy)) * self.cell_size
+
+    def key(self, cell):
+        value = min(self.g.get(cell, INFINITY), self.rhs.get(cell, INFINITY))
+        x, y = divmod(cell, self.column_count)
+        dx = abs(x - self.start_x)
+        dy = abs(y - self.start_y)
+        return value + (dx + dy + (SQRT_2 - 2.0) * min(dx, dy)) * self.cell_size + self.key_modifier, value
+
+    def successors(self, cell):
+        # Blocked cells can be left but not entered, and diagonal steps can't cut the corner of a blocked cell.
+        if self.border_cells[cell]:
+            return self.border_successors(cell)
+        blocked_counts = self.blocked_counts
+        return [
+            (cell + offset, cost) for offset, cost, side1, side2 in self.steps
+            if not (blocked_counts[cell + offset] or blocked_counts[cell + side1] or blocked_counts[cell + side2])
+        ]
+
+    def border_successors(self, cell):
+        column_count = self.column_count
+        blocked_counts = self.blocked_counts
+        cell_x, cell_y = divmod(cell, column_count)
+        result = []
+        for dx, dy in DIRECTIONS:
+            x = cell_x + dx
+            y = cell_y + dy
+            if 0 <= x < column_count and 0 <= y < column_count and not (
+                    blocked_counts[x * column_count + y] or
+                    blocked_counts[x * column_count + cell_y] or blocked_counts[cell_x * column_count + y]):
+                result.append((x * column_count + y, math.hypot(dx, dy) * self.cell_size))
+        return result
+
+    def predecessors(self, cell):
+        # Only free cells can be entered, and free cells are off the border.
+        blocked_counts = self.blocked_counts
+        if blocked_counts[cell]:
+            return []
+        return [
+            (cell + offset, cost) for offset, cost, side1, side2 in self.steps
+            if not (blocked_counts[cell + side1] or blocked_counts[cell + side2])
+        ]
+
+    def best_successor_cost(self, cell):
+        g = self.g
+        return min((cost + g.get(successor, INFINITY) for successor, cost in self.successors(cell)), default=INFINITY)
+
+    def update_vertex(self, cell):
+        if self.g.get(cell, INFINITY) != self.rhs.get(cell, INFINITY):
+            key = self.key(cell)
+            self.queued_keys[cell] = key
+            heapq.heappush(self.queue, (key[0], key[1], cell))
+        elif cell in self.queued_keys:
+            del self.queued_keys[cell]
+
+    def add_obstacle(self, unit):
+        cell_size = self.cell_size
+        column_count = self.column_count
+        reach = unit.radius + self.unit_radius + PathPlanner.CLEARANCE
+        cells = []
+
+        # Each column of cells whose centres are within reach is a run of rows around the unit.
+        for cell_x in range(max(int((unit.x - reach) / cell_size), 0), min(int((unit.x + reach) / cell_size) + 1,
+                                                                               column_count)):
+            dx = (cell_x + 0.5) * cell_size - unit.x
+            if dx * dx >= reach * reach:
+                continue
+            half_height = math.sqrt(reach * reach - dx * dx)
+            min_cell_y = max(int(math.ceil((unit.y - half_height) / cell_size - 0.5)), 0)
+            max_cell_y = min(int(math.floor((unit.y + half_height) / cell_size - 0.5)), column_count - 1)
+            cells.extend(range(cell_x * column_count + min_cell_y, cell_x * column_count + max_cell_y + 1))
+
+        self.obstacles_by_id[unit.id] = unit
+        self.cells_by_obstacle_id[unit.id] = cells
+        blocked_counts = self.blocked_counts
+        for cell in cells:
+            blocked_counts[cell] += 1
+        return [cell for cell in cells if blocked_counts[cell] == 1]
+
+    def remove_obstacle(self, unit_id):
+        del self.obstacles_by_id[unit_id]
+        blocked_counts = self.blocked_counts
+        cells = self.cells_by_obstacle_id.pop(unit_id)
+        for cell in cells:
+            blocked_counts[cell] -= 1
+        return [cell for cell in cells if blocked_counts[cell] == 0]
+
+    def update_obstacles(self, trees, buildings, observer):
+        # Units out of sight are not in the world, so an obstacle is dropped only when it's missing although the
+        # observer, the walker itself, should see it. Obstacles removed elsewhere are dropped once it comes close.
+        # The lists are only taken here: plan compares them with the obstacles it has, within its budget, and starts
+        # over when it's handed new lists before it's done.
+        self.observer = observer
+        if (trees is self.trees) and (buildings is self.buildings):
+            return
+        self.trees = trees
+        self.buildings = buildings
+        self.scanned_units = trees + buildings
+        self.scan_index = 0
+        self.seen_ids = set()
+        self.missing_obstacles = None
+        self.converged = False
+
+    def apply_obstacles(self, deadline):
+        if self.scanned_units is None:
+            return True
+        units = self.scanned_units
+        obstacles_by_id = self.obstacles_by_id
+        seen_ids = self.seen_ids
+        changed_cells = []
+        step_count = 0
+        try:
+            while self.scan_index < units.__len__():
+                step_count += 1
+                if step_count % PathPlanner.STEPS_PER_TIME_CHECK == 0 and time.process_time() > deadline:
+                    return False
+                unit = units[self.scan_index]
+                self.scan_index += 1
+                seen_ids.add(unit.id)
+                if unit.id not in obstacles_by_id:
+                    changed_cells += self.add_obstacle(unit)
+
+            if self.missing_obstacles is None:
+                self.missing_obstacles = [unit for unit_id, unit in obstacles_by_id.items() if unit_id not in seen_ids]
+            missing_obstacles = self.missing_obstacles
+            observer = self.observer
+            while missing_obstacles:
+                step_count += 1
+                if step_count % PathPlanner.STEPS_PER_TIME_CHECK == 0 and time.process_time() > deadline:
+                    return False
+                unit = missing_obstacles.pop()
+                if observer.get_distance_to_unit(unit) <= observer.vision_range - unit.radius:
+                    changed_cells += self.remove_obstacle(unit.id)
+
+            self.scanned_units = None
+            self.seen_ids = None
+            self.missing_obstacles = None
+            return True
+        finally:
+            if changed_cells:
+                self.revision += 1
+                self.pend_changed_cells(changed_cells)
+
+    def pend_changed_cells(self, changed_cells):
+        # The edges into a cell and the diagonal edges past it all start at its neighbours; their costs to the goal
+        # are brought up to date by update_pending_cells. Changed cells are never on the border.
+        if self.goal is None:
+            return
+        pending_cells = self.pending_cells
+        for cell in changed_cells:
+            for offset, _, _, _ in self.steps:
+                pending_cells.add(cell + offset)
+
+    def set_goal(self, goal):
+        if goal == self.goal:
+            return
+        self.goal = goal
+        self.g = {}
+        self.rhs = {goal: 0.0}
+        self.queue = []
+        self.queued_keys = {}
+        self.key_modifier = 0.0
+        self.pending_cells = set()
+        self.converged = False
+        self.revision += 1
+        self.update_vertex(goal)
+
+    def set_start(self, start):
+        if start == self.start:
+            return
+        if self.start is not None:
+            self.key_modifier += self.heuristic(self.start, start)
+        self.start = start
+        self.start_x, self.start_y = divmod(start, self.column_count)
+        self.converged = False
+
+    def update_pending_cells(self, deadline):
+        pending_cells = self.pending_cells
+        goal = self.goal
+        step_count = 0
+        while pending_cells:
+            step_count += 1
+            if step_count % PathPlanner.STEPS_PER_TIME_CHECK == 0 and time.process_time() > deadline:
+                return False
+            cell = pending_cells.pop()
+            if cell != goal:
+                self.rhs[cell] = self.best_successor_cost(cell)
+            self.update_vertex(cell)
+        return True
+
+    def compute_shortest_path(self, deadline):
+        queue = self.queue
+        queued_keys = self.queued_keys
+        g = self.g
+        rhs = self.rhs
+        start = self.start
+        goal = self.goal
+        expansion_count = 0
+        step_count = 0
+
+        while queue:
+            # Dropping stale entries counts as a step too: after a change of goal or start they can run into the
+            # thousands.
+            step_count += 1
+            if step_count % PathPlanner.STEPS_PER_TIME_CHECK == 0 and time.process_time() > deadline:
+                self.expansion_count += expansion_count
+                self.revision += 1
+                return False
+
+            k1, k2, cell = queue[0]
+            if queued_keys.get(cell) != (k1, k2):
+                heapq.heappop(queue)
+                continue
+            if (k1, k2) >= self.key(start) and rhs.get(start, INFINITY) == g.get(start, INFINITY):
+                break
+
+            expansion_count += 1
+
+            key = self.key(cell)
+            if (k1, k2) < key:
+                queued_keys[cell] = key
+                heapq.heapreplace(queue, (key[0], key[1], cell))
+                continue
+
+            heapq.heappop(queue)
+            del queued_keys[cell]
+            g_cell = g.get(cell, INFINITY)
+            rhs_cell = rhs.get(cell, INFINITY)
+
+            if g_cell > rhs_cell:
+                g[cell] = rhs_cell
+                for predecessor, cost in self.predecessors(cell):
+                    if predecessor != goal and cost + rhs_cell < rhs.get(predecessor, INFINITY):
+                        rhs[predecessor] = cost + rhs_cell
+                        self.update_vertex(predecessor)
+            else:
+                g[cell] = INFINITY
+                for predecessor, cost in self.predecessors(cell):
+                    if predecessor != goal and rhs.get(predecessor, INFINITY) == cost + g_cell:
+                        rhs[predecessor] = self.best_successor_cost(predecessor)
+                    self.update_vertex(predecessor)
+                self.update_vertex(cell)
+
+        # Stale entries pile up in the heap; they are dropped whenever they outnumber the live ones.
+        if queue.__len__() > 2 * queued_keys.__len__() + 1000:
+            self.queue = [(key[0], key[1], cell) for cell, key in queued_keys.items()]
+            heapq.heapify(self.queue)
+
+        self.expansion_count += expansion_count
+        if expansion_count:
+            self.revision += 1
+        self.converged = True
+        return True
+
+    def plan(self, x, y, goal_x, goal_y, budget_microseconds=PLANNING_BUDGET_MICROSECONDS):
+        deadline = time.process_time() + budget_microseconds * 1e-6
+        self.set_start(self.cell_of(x, y))
+        self.set_goal(self.cell_of(goal_x, goal_y))
+        if self.converged:
+            return True
+        self.search_count += 1
+        if not (self.apply_obstacles(deadline) and self.update_pending_cells(deadline) and
+                self.compute_shortest_path(deadline)):
+            self.over_budget_count += 1
+            return False
+        return True
+
+    def get_path(self):
+        path_key = (self.start, self.revision)
+        if path_key == self.path_key:
+            return self.path
+
+        g = self.g
+        cell = self.start
+        path = [cell]
+        for _ in range(PathPlanner.LOOKAHEAD_CELLS):
+            if cell == self.goal:
+                break
+            best_cost = INFINITY
+            for successor, cost in self.successors(cell):
+                if cost + g.get(successor, INFINITY) < best_cost:
+                    best_cost = cost + g.get(successor, INFINITY)
+                    cell = successor
+            if best_cost == INFINITY:
+                path = None
+                break
+            path.append(cell)
+
+        self.path = path
+        self.path_key = path_key
+        return path
+
+    def is_line_free(self, x1, y1, x2, y2):
+        # Blocked cells are sampled along the line; the walker's own cell doesn't count, it may have strayed into it.
+        # Both ends are on the map, and so is every point between them.
+        blocked_counts = self.blocked_counts
+        column_count = self.column_count
+        scale = 1.0 / self.cell_size
+        start = self.cell_of(x1, y1)
+        sample_count = int(math.hypot(x2 - x1, y2 - y1) * 3.0 * scale) + 1
+        step_x = (x2 - x1) / sample_count
+        step_y = (y2 - y1) / sample_count
+        for index in range(1, sample_count + 1):
+            cell = int((x1 + step_x * index) * scale) * column_count + int((y1 + step_y * index) * scale)
+            if blocked_counts[cell] and cell != start:
+                return False
+        return True
+
+    def steering_point(self, x, y, goal_x, goal_y):
+        # None unless the last plan was for this goal and this position and it has finished, or when the goal itself
+        # is in sight at the end of the path ahead. Otherwise the farthest cell of that path that can be seen straight
+        # from the position; cells seen from there mostly form a prefix of the path, so it is found by bisection.
+        if (not self.converged) or (self.goal != self.cell_of(goal_x, goal_y)) or (self.start != self.cell_of(x, y)):
+            return None
+        path = self.get_path()
+        if (path is None) or (path.__len__() < 2):
+            return None
+        if path[-1] == self.goal and self.is_line_free(x, y, goal_x, goal_y):
+            return None
+        seen = 1
+        hidden = path.__len__()
+        while hidden - seen > 1:
+            middle = (seen + hidden) // 2
+            if self.is_line_free(x, y, *self.cell_center(path[middle])):
+                seen = middle
+            else:
+                hidden = middle
+        return self.cell_center(path[seen])
@@ -0,0 +1,129 @@
+import math
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from model.ProjectileType import ProjectileType
+
+
+class ProjectileDodge:
+    # Picks the move of the wizard that keeps it out of the way of the enemy projectiles in flight. Every projectile
+    # flies straight on at its speed until it has covered its range, the wizard keeps the candidate move and its angle
+    # for as long, and a projectile hits when the two come closer than their radii at the time of closest approach.
+    # All projectiles against all candidate moves are worked out at once in NumPy.
+    #
+    # The range of a projectile is counted from where its owner stood when the projectile was first seen, or from
+    # where the projectile itself was if the owner was out of sight, so the flight left is never underestimated.
+    # A fireball explodes on contact or at the end of its flight, so its whole path is as dangerous as the explosion.
+
+    # Candidate moves as (forward, strafe) fractions of the wizard speeds, the planned move goes first.
+    CANDIDATE_MOVES = [
+        (0.0, 0.0), (1.0, 0.0), (-1.0, 0.0), (0.0, 1.0), (0.0, -1.0),
+        (math.sqrt(0.5), math.sqrt(0.5)), (math.sqrt(0.5), -math.sqrt(0.5)),
+        (-math.sqrt(0.5), math.sqrt(0.5)), (-math.sqrt(0.5), -math.sqrt(0.5))
+    ]
+
+    def __init__(self, game):
+        if numpy is None:
+            raise ImportError("NumPy is required to dodge projectiles.")
+
+        self.forward_speed = game.wizard_forward_speed
+        self.backward_speed = game.wizard_backward_speed
+        self.strafe_speed = game.wizard_strafe_speed
+        self.max_cast_range = game.wizard_cast_range + 4 * game.range_bonus_per_skill_level
+        self.hit_radius_by_type = {
+            ProjectileType.MAGIC_MISSILE: game.magic_missile_radius,
+            ProjectileType.FROST_BOLT: game.frost_bolt_radius,
+            ProjectileType.FIREBALL: game.fireball_explosion_min_damage_range,
+            ProjectileType.DART: game.dart_radius
+        }
+        self.damage_by_type = {
+            ProjectileType.MAGIC_MISSILE: game.magic_missile_direct_damage,
+            ProjectileType.FROST_BOLT: game.frost_bolt_direct_damage,
+            ProjectileType.FIREBALL: game.fireball_explosion_max_damage,
+            ProjectileType.DART: game.dart_direct_damage
+        }
+        self.dart_range = game.fetish_blowdart_attack_range
+        self.origins_by_id = {}
+
+        self.plan_count = 0
+        self.dodge_count = 0
+
+    def track(self, projectiles, wizards):
+        # Remembers where every projectile set off and forgets the projectiles that are gone.
+        origins_by_id = {}
+        wizards_by_id = None
+        for projectile in projectiles:
+            origin = self.origins_by_id.get(projectile.id)
+            if origin is None:
+                if wizards_by_id is None:
+                    wizards_by_id = {wizard.id: wizard for wizard in wizards}
+                owner = wizards_by_id.get(projectile.owner_unit_id)
+                if projectile.type == ProjectileType.DART:
+                    flight_range = self.dart_range
+                elif owner is not None:
+                    flight_range = owner.cast_range
+                else:
+                    flight_range = self.max_cast_range
+                origin_unit = projectile if owner is None else owner
+                origin = (origin_unit.x, origin_unit.y, flight_range)
+            origins_by_id[projectile.id] = origin
+        self.origins_by_id = origins_by_id
+
+    def candidate_speeds(self, speed, strafe_speed):
+        speeds = [(speed, strafe_speed)]
+        for forward, strafe in ProjectileDodge.CANDIDATE_MOVES:
+            speeds.append((forward * (self.forward_speed if forward > 0.0 else self.backward_speed),
+                           strafe * self.strafe_speed))
+        return speeds
+
+    def columns(self, me, projectiles):
+        # Positions relative to me, velocities, ticks of flight left, hit distances to me and damages, one row each.
+        rows = []
+        for projectile in projectiles:
+            origin_x, origin_y, flight_range = self.origins_by_id[projectile.id]
+            flown = math.hypot(projectile.x - origin_x, projectile.y - origin_y)
+            rows.append((projectile.x - me.x, projectile.y - me.y, projectile.speed_x, projectile.speed_y,
+                         max(flight_range - flown, 0.0), self.hit_radius_by_type[projectile.type] + me.radius,
+                         self.damage_by_type[projectile.type]))
+        columns = numpy.array(rows).reshape(-1, 7).T
+        flight_ticks = columns[4] / numpy.maximum(numpy.hypot(columns[2], columns[3]), 1e-9)
+        return columns[0:2].T, columns[2:4].T, flight_ticks, columns[5], columns[6]
+
+    def plan(self, me, projectiles, wizards, speed, strafe_speed):
+        # Returns None when no candidate move is less damaging than the planned one, otherwise the candidate moves
+        # that are as (speed, strafe speed, damage), the least damaging first and, among equally damaging ones, the
+        # closest to the planned move first.
+        self.plan_count += 1
+        self.track(projectiles, wizards)
+        if not projectiles:
+            return None
+
+        positions, velocities, flight_ticks, hit_radii, damages = self.columns(me, projectiles)
+
+        speeds = numpy.array(self.candidate_speeds(speed, strafe_speed))
+        cos_angle = math.cos(me.angle)
+        sin_angle = math.sin(me.angle)
+        wizard_velocities = numpy.empty_like(speeds)
+        wizard_velocities[:, 0] = speeds[:, 0] * cos_angle - speeds[:, 1] * sin_angle
+        wizard_velocities[:, 1] = speeds[:, 0] * sin_angle + speeds[:, 1] * cos_angle
+
+        # Relative to the wizard, a projectile starts at positions and moves at its velocity less the wizard's.
+        relative_velocities = velocities[:, None, :] - wizard_velocities[None, :, :]
+        squared_speeds = numpy.maximum((relative_velocities * relative_velocities).sum(axis=2), 1e-9)
+        ticks = -(positions[:, None, :] * relative_velocities).sum(axis=2) / squared_speeds
+        ticks = numpy.clip(ticks, 0.0, flight_ticks[:, None])
+        closest = positions[:, None, :] + relative_velocities * ticks[:, :, None]
+        hits = (closest * closest).sum(axis=2) < (hit_radii * hit_radii)[:, None]
+        candidate_damages = (hits * damages[:, None]).sum(axis=0)
+
+        if candidate_damages.min() == candidate_damages[0]:
+            return None
+
+        self.dodge_count += 1
+        deviations = numpy.hypot(*(wizard_velocities - wizard_velocities[0]).T)
+        order = numpy.lexsort((deviations, candidate_damages))
+        order = order[candidate_damages[order] < candidate_damages[0]]
+        return list(zip(speeds[order, 0].tolist(), speeds[order, 1].tolist(), candidate_damages[order].tolist()))
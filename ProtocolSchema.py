@@ -0,0 +1,738 @@
+import re
+import struct
+
+from WorldColumns import WorldColumns
+from model.ActionType import ActionType
+from model.Bonus import Bonus
+from model.BonusType import BonusType
+from model.Building import Building
+from model.BuildingType import BuildingType
+from model.Faction import Faction
+from model.Game import Game
+from model.LaneType import LaneType
+from model.Message import Message
+from model.Minion import Minion
+from model.MinionType import MinionType
+from model.Move import Move
+from model.Player import Player
+from model.PlayerContext import PlayerContext
+from model.Projectile import Projectile
+from model.ProjectileType import ProjectileType
+from model.SkillType import SkillType
+from model.Status import Status
+from model.StatusType import StatusType
+from model.Tree import Tree
+from model.Wizard import Wizard
+from model.World import World
+
+enum_values_by_class = {}
+
+generated_sources = {}
+
+
+def enum_values(enum_class):
+    values = enum_values_by_class.get(enum_class)
+
+    if values is None:
+        values = frozenset(
+            enum_value for enum_key, enum_value in enum_class.__dict__.items() if not str(enum_key).startswith("__")
+        )
+        enum_values_by_class[enum_class] = values
+
+    return values
+
+
+def constant_name(name):
+    return re.sub("(?<!^)(?=[A-Z])", "_", name).upper()
+
+
+class FixedWireType:
+    def __init__(self, struct_format, read_method):
+        self.struct_format = struct_format
+        self.read_method = read_method
+
+    def decode(self, name, constants):
+        return name
+
+    def encode(self, expression, constants):
+        return expression
+
+    def read_value(self, client):
+        return getattr(client, self.read_method)()
+
+
+class BooleanWireType(FixedWireType):
+    def __init__(self):
+        FixedWireType.__init__(self, "b", "read_boolean")
+
+    def decode(self, name, constants):
+        return "%s != 0" % name
+
+    def encode(self, expression, constants):
+        return "1 if %s else 0" % expression
+
+
+class EnumWireType(FixedWireType):
+    def __init__(self, enum_class):
+        FixedWireType.__init__(self, "b", "read_enum")
+        self.enum_class = enum_class
+
+    def decode(self, name, constants):
+        values_name = constant_name(self.enum_class.__name__) + "_VALUES"
+        constants[values_name] = enum_values(self.enum_class)
+        return "%s if %s in %s else None" % (name, name, values_name)
+
+    def encode(self, expression, constants):
+        return "-1 if %s is None else %s" % (expression, expression)
+
+    def read_value(self, client):
+        return client.read_enum(self.enum_class)
+
+
+class VariableWireType:
+    struct_format = None
+
+    def __init__(self, read_method, write_method, *args, element_size=None):
+        self.read_method = read_method
+        self.write_method = write_method
+        self.args = args
+        self.skip_method = "skip_array"
+        self.skip_args = (element_size,)
+
+    def read(self, constants):
+        return "self.%s(%s)" % (self.read_method, ", ".join(self.argument_names(constants)))
+
+    def write(self, expression, constants):
+        return "self.%s(%s)" % (self.write_method, expression)
+
+    def skip(self):
+        return "self.%s(%s)" % (self.skip_method, ", ".join(repr(argument) for argument in self.skip_args))
+
+    def read_skipped(self):
+        return "self.read_skipped(%s)" % ", ".join(
+            ["self." + self.skip_method] + [repr(argument) for argument in self.skip_args]
+        )
+
+    def argument_names(self, constants):
+        names = []
+
+        for argument in self.args:
+            if isinstance(argument, type):
+                constants[argument.__name__] = argument
+                names.append(argument.__name__)
+            else:
+                names.append(repr(argument))
+
+        return names
+
+    def read_value(self, client):
+        return getattr(client, self.read_method)(*self.args)
+
+
+class EntityWireType(VariableWireType):
+    def __init__(self, entity_name):
+        VariableWireType.__init__(self, "read_" + entity_name, "write_" + entity_name)
+        self.entity_name = entity_name
+        self.skip_method = "skip_" + entity_name
+        self.skip_args = ()
+
+
+class ListWireType(VariableWireType):
+    def __init__(self, entity_name, plural_name):
+        VariableWireType.__init__(self, "read_" + plural_name, "write_" + plural_name)
+        self.entity_name = entity_name
+        self.skip_method = "skip_" + plural_name
+        self.skip_args = ()
+
+    def read_into(self, target_expression):
+        return "self.%s_into(%s)" % (self.read_method, target_expression)
+
+
+BOOLEAN = BooleanWireType()
+INT = FixedWireType("i", "read_int")
+LONG = FixedWireType("q", "read_long")
+DOUBLE = FixedWireType("d", "read_double")
+STRING = VariableWireType("read_string", "write_string", element_size=1)
+BYTE_ARRAY = VariableWireType("read_byte_array", "write_byte_array", False, element_size=1)
+INTS = VariableWireType("read_ints", "write_ints", element_size=4)
+
+
+def enum(enum_class):
+    return EnumWireType(enum_class)
+
+
+def enums(enum_class):
+    return VariableWireType("read_enums", "write_enums", enum_class, element_size=1)
+
+
+class EntityType:
+    def __init__(self, name, plural_name, model_class, fields, registry=None, list_cache=None, positional=True,
+                 pooled=False, column_kind=None, collects_columns=False):
+        self.name = name
+        self.plural_name = plural_name
+        self.model_class = model_class
+        self.fields = fields
+        self.registry = registry
+        self.list_cache = list_cache
+        self.positional = positional
+        self.pooled = pooled
+        self.column_kind = column_kind
+        self.collects_columns = collects_columns
+
+    def wire_type(self):
+        return EntityWireType(self.name)
+
+    def list_wire_type(self):
+        return ListWireType(self.name, self.plural_name)
+
+    def create(self, values):
+        if self.positional:
+            return self.model_class(*values)
+
+        value = self.model_class()
+        for (field_name, _), field_value in zip(self.fields, values):
+            setattr(value, field_name, field_value)
+        return value
+
+
+UNIT_FIELDS = [
+    ("id", LONG), ("x", DOUBLE), ("y", DOUBLE), ("speed_x", DOUBLE), ("speed_y", DOUBLE), ("angle", DOUBLE),
+    ("faction", enum(Faction))
+]
+
+CIRCULAR_UNIT_FIELDS = UNIT_FIELDS + [("radius", DOUBLE)]
+
+STATUS = EntityType("status", "statuses", Status, [
+    ("id", LONG), ("type", enum(StatusType)), ("wizard_id", LONG), ("player_id", LONG),
+    ("remaining_duration_ticks", INT)
+])
+
+LIVING_UNIT_FIELDS = CIRCULAR_UNIT_FIELDS + [("life", INT), ("max_life", INT), ("statuses", STATUS.list_wire_type())]
+
+MESSAGE = EntityType("message", "messages", Message, [
+    ("lane", enum(LaneType)), ("skill_to_learn", enum(SkillType)), ("raw_message", BYTE_ARRAY)
+])
+
+BONUS = EntityType("bonus", "bonuses", Bonus, CIRCULAR_UNIT_FIELDS + [("type", enum(BonusType))])
+
+BUILDING = EntityType("building", "buildings", Building, LIVING_UNIT_FIELDS + [
+    ("type", enum(BuildingType)), ("vision_range", DOUBLE), ("attack_range", DOUBLE), ("damage", INT),
+    ("cooldown_ticks", INT), ("remaining_action_cooldown_ticks", INT)
+], registry="unit_cache", list_cache="buildings", column_kind=WorldColumns.BUILDING)
+
+MINION = EntityType("minion", "minions", Minion, LIVING_UNIT_FIELDS + [
+    ("type", enum(MinionType)), ("vision_range", DOUBLE), ("damage", INT), ("cooldown_ticks", INT),
+    ("remaining_action_cooldown_ticks", INT)
+], registry="unit_cache", pooled=True, column_kind=WorldColumns.MINION)
+
+PROJECTILE = EntityType("projectile", "projectiles", Projectile, CIRCULAR_UNIT_FIELDS + [
+    ("type", enum(ProjectileType)), ("owner_unit_id", LONG), ("owner_player_id", LONG)
+])
+
+TREE = EntityType(
+    "tree", "trees", Tree, LIVING_UNIT_FIELDS, registry="unit_cache", list_cache="trees", column_kind=WorldColumns.TREE
+)
+
+WIZARD = EntityType("wizard", "wizards", Wizard, LIVING_UNIT_FIELDS + [
+    ("owner_player_id", LONG), ("me", BOOLEAN), ("mana", INT), ("max_mana", INT), ("vision_range", DOUBLE),
+    ("cast_range", DOUBLE), ("xp", INT), ("level", INT), ("skills", enums(SkillType)),
+    ("remaining_action_cooldown_ticks", INT), ("remaining_cooldown_ticks_by_action", INTS), ("master", BOOLEAN),
+    ("messages", MESSAGE.list_wire_type())
+], pooled=True, column_kind=WorldColumns.WIZARD)
+
+PLAYER = EntityType("player", "players", Player, [
+    ("id", LONG), ("me", BOOLEAN), ("name", STRING), ("strategy_crashed", BOOLEAN), ("score", INT),
+    ("faction", enum(Faction))
+], registry="player_cache", list_cache="players")
+
+WORLD = EntityType("world", "worlds", World, [
+    ("tick_index", INT), ("tick_count", INT), ("width", DOUBLE), ("height", DOUBLE),
+    ("players", PLAYER.list_wire_type()), ("wizards", WIZARD.list_wire_type()),
+    ("minions", MINION.list_wire_type()), ("projectiles", PROJECTILE.list_wire_type()),
+    ("bonuses", BONUS.list_wire_type()), ("buildings", BUILDING.list_wire_type()), ("trees", TREE.list_wire_type())
+], collects_columns=True)
+
+PLAYER_CONTEXT = EntityType("player_context", "player_contexts", PlayerContext, [
+    ("wizards", WIZARD.list_wire_type()), ("world", WORLD.wire_type())
+])
+
+MOVE = EntityType("move", "moves", Move, [
+    ("speed", DOUBLE), ("strafe_speed", DOUBLE), ("turn", DOUBLE), ("action", enum(ActionType)),
+    ("cast_angle", DOUBLE), ("min_cast_distance", DOUBLE), ("max_cast_distance", DOUBLE),
+    ("status_target_id", LONG), ("skill_to_learn", enum(SkillType)), ("messages", MESSAGE.list_wire_type())
+], positional=False)
+
+GAME = EntityType("game", "games", Game, [
+    ("random_seed", LONG),
+    ("tick_count", INT),
+    ("map_size", DOUBLE),
+    ("skills_enabled", BOOLEAN),
+    ("raw_messages_enabled", BOOLEAN),
+    ("friendly_fire_damage_factor", DOUBLE),
+    ("building_damage_score_factor", DOUBLE),
+    ("building_elimination_score_factor", DOUBLE),
+    ("minion_damage_score_factor", DOUBLE),
+    ("minion_elimination_score_factor", DOUBLE),
+    ("wizard_damage_score_factor", DOUBLE),
+    ("wizard_elimination_score_factor", DOUBLE),
+    ("team_working_score_factor", DOUBLE),
+    ("victory_score", INT),
+    ("score_gain_range", DOUBLE),
+    ("raw_message_max_length", INT),
+    ("raw_message_transmission_speed", DOUBLE),
+    ("wizard_radius", DOUBLE),
+    ("wizard_cast_range", DOUBLE),
+    ("wizard_vision_range", DOUBLE),
+    ("wizard_forward_speed", DOUBLE),
+    ("wizard_backward_speed", DOUBLE),
+    ("wizard_strafe_speed", DOUBLE),
+    ("wizard_base_life", INT),
+    ("wizard_life_growth_per_level", INT),
+    ("wizard_base_mana", INT),
+    ("wizard_mana_growth_per_level", INT),
+    ("wizard_base_life_regeneration", DOUBLE),
+    ("wizard_life_regeneration_growth_per_level", DOUBLE),
+    ("wizard_base_mana_regeneration", DOUBLE),
+    ("wizard_mana_regeneration_growth_per_level", DOUBLE),
+    ("wizard_max_turn_angle", DOUBLE),
+    ("wizard_max_resurrection_delay_ticks", INT),
+    ("wizard_min_resurrection_delay_ticks", INT),
+    ("wizard_action_cooldown_ticks", INT),
+    ("staff_cooldown_ticks", INT),
+    ("magic_missile_cooldown_ticks", INT),
+    ("frost_bolt_cooldown_ticks", INT),
+    ("fireball_cooldown_ticks", INT),
+    ("haste_cooldown_ticks", INT),
+    ("shield_cooldown_ticks", INT),
+    ("magic_missile_manacost", INT),
+    ("frost_bolt_manacost", INT),
+    ("fireball_manacost", INT),
+    ("haste_manacost", INT),
+    ("shield_manacost", INT),
+    ("staff_damage", INT),
+    ("staff_sector", DOUBLE),
+    ("staff_range", DOUBLE),
+    ("level_up_xp_values", INTS),
+    ("minion_radius", DOUBLE),
+    ("minion_vision_range", DOUBLE),
+    ("minion_speed", DOUBLE),
+    ("minion_max_turn_angle", DOUBLE),
+    ("minion_life", INT),
+    ("faction_minion_appearance_interval_ticks", INT),
+    ("orc_woodcutter_action_cooldown_ticks", INT),
+    ("orc_woodcutter_damage", INT),
+    ("orc_woodcutter_attack_sector", DOUBLE),
+    ("orc_woodcutter_attack_range", DOUBLE),
+    ("fetish_blowdart_action_cooldown_ticks", INT),
+    ("fetish_blowdart_attack_range", DOUBLE),
+    ("fetish_blowdart_attack_sector", DOUBLE),
+    ("bonus_radius", DOUBLE),
+    ("bonus_appearance_interval_ticks", INT),
+    ("bonus_score_amount", INT),
+    ("dart_radius", DOUBLE),
+    ("dart_speed", DOUBLE),
+    ("dart_direct_damage", INT),
+    ("magic_missile_radius", DOUBLE),
+    ("magic_missile_speed", DOUBLE),
+    ("magic_missile_direct_damage", INT),
+    ("frost_bolt_radius", DOUBLE),
+    ("frost_bolt_speed", DOUBLE),
+    ("frost_bolt_direct_damage", INT),
+    ("fireball_radius", DOUBLE),
+    ("fireball_speed", DOUBLE),
+    ("fireball_explosion_max_damage_range", DOUBLE),
+    ("fireball_explosion_min_damage_range", DOUBLE),
+    ("fireball_explosion_max_damage", INT),
+    ("fireball_explosion_min_damage", INT),
+    ("guardian_tower_radius", DOUBLE),
+    ("guardian_tower_vision_range", DOUBLE),
+    ("guardian_tower_life", DOUBLE),
+    ("guardian_tower_attack_range", DOUBLE),
+    ("guardian_tower_damage", INT),
+    ("guardian_tower_cooldown_ticks", INT),
+    ("faction_base_radius", DOUBLE),
+    ("faction_base_vision_range", DOUBLE),
+    ("faction_base_life", DOUBLE),
+    ("faction_base_attack_range", DOUBLE),
+    ("faction_base_damage", INT),
+    ("faction_base_cooldown_ticks", INT),
+    ("burning_duration_ticks", INT),
+    ("burning_summary_damage", INT),
+    ("empowered_duration_ticks", INT),
+    ("empowered_damage_factor", DOUBLE),
+    ("frozen_duration_ticks", INT),
+    ("hastened_duration_ticks", INT),
+    ("hastened_bonus_duration_factor", DOUBLE),
+    ("hastened_movement_bonus_factor", DOUBLE),
+    ("hastened_rotation_bonus_factor", DOUBLE),
+    ("shielded_duration_ticks", INT),
+    ("shielded_bonus_duration_factor", DOUBLE),
+    ("shielded_direct_damage_absorption_factor", DOUBLE),
+    ("aura_skill_range", DOUBLE),
+    ("range_bonus_per_skill_level", DOUBLE),
+    ("magical_damage_bonus_per_skill_level", INT),
+    ("staff_damage_bonus_per_skill_level", INT),
+    ("movement_bonus_factor_per_skill_level", DOUBLE),
+    ("magical_damage_absorption_per_skill_level", INT)
+])
+
+ENTITY_TYPES = [
+    BONUS, BUILDING, GAME, MESSAGE, MINION, MOVE, PLAYER, PLAYER_CONTEXT, PROJECTILE, STATUS, TREE, WIZARD, WORLD
+]
+
+ENTITY_TYPE_BY_NAME = {entity_type.name: entity_type for entity_type in ENTITY_TYPES}
+
+
+def contains_registry(entity_type):
+    if entity_type.registry is not None:
+        return True
+
+    for _, field_type in entity_type.fields:
+        entity_name = getattr(field_type, "entity_name", None)
+        if entity_name is not None and contains_registry(ENTITY_TYPE_BY_NAME[entity_name]):
+            return True
+
+    return False
+
+
+def field_runs(fields):
+    runs = []
+
+    for field in fields:
+        fixed = field[1].struct_format is not None
+        if fixed and runs and runs[-1][0]:
+            runs[-1][1].append(field)
+        else:
+            runs.append((fixed, [field]))
+
+    return runs
+
+
+def generate_field_reads(entity_type, runs, byte_order, constants, indent, into_value, skipped_fields=()):
+    lines = []
+    values = []
+
+    for run_index, (fixed, fields) in runs:
+        if fixed:
+            struct_name = "%s_READ_STRUCT_%d" % (entity_type.name.upper(), run_index)
+            constants[struct_name] = struct.Struct(
+                byte_order + "".join(field_type.struct_format for _, field_type in fields)
+            )
+            lines.append(indent + "%s, = %s.unpack_from(self.read_view, self.reserve_bytes(%d))" % (
+                ", ".join(field_name for field_name, _ in fields), struct_name, constants[struct_name].size
+            ))
+            values += [field_type.decode(field_name, constants) for field_name, field_type in fields]
+        else:
+            field_name, field_type = fields[0]
+            if field_name in skipped_fields:
+                lines.append(indent + "%s = %s" % (field_name, field_type.read_skipped()))
+                values.append("None")
+                continue
+
+            if into_value and isinstance(field_type, ListWireType):
+                lines.append(indent + "%s = %s" % (
+                    field_name, field_type.read_into("getattr(value, %r, None)" % field_name)
+                ))
+            else:
+                lines.append(indent + "%s = %s" % (field_name, field_type.read(constants)))
+            values.append(field_name)
+
+    return lines, values
+
+
+def generate_reader(entity_type, byte_order, constants, profile=None):
+    lines = ["def read_%s(self):" % entity_type.name]
+    skipped_fields = () if profile is None else profile.skipped_fields(entity_type)
+
+    if entity_type.registry is None:
+        lines += [
+            "    if not self.read_boolean():",
+            "        return None"
+        ]
+    elif entity_type.pooled:
+        lines += [
+            "    flag = self.read_signed_byte()",
+            "    if flag == 0:",
+            "        return None",
+            "    if flag == 100:",
+            "        value = self.%s.reference(self.read_long())" % entity_type.registry,
+            "        if self.unit_pool is not None:",
+            "            self.unit_pool.touch(value)"
+        ]
+        if entity_type.column_kind is not None:
+            lines += [
+                "        if self.world_columns is not None:",
+                "            self.world_columns.append_unit(%d, value)" % entity_type.column_kind
+            ]
+        lines.append("        return value")
+    elif entity_type.column_kind is not None:
+        lines += [
+            "    flag = self.read_signed_byte()",
+            "    if flag == 0:",
+            "        return None",
+            "    if flag == 100:",
+            "        value = self.%s.reference(self.read_long())" % entity_type.registry,
+            "        if self.world_columns is not None:",
+            "            self.world_columns.append_unit(%d, value)" % entity_type.column_kind,
+            "        return value"
+        ]
+    else:
+        lines += [
+            "    flag = self.read_signed_byte()",
+            "    if flag == 0:",
+            "        return None",
+            "    if flag == 100:",
+            "        return self.%s.reference(self.read_long())" % entity_type.registry
+        ]
+
+    if entity_type.collects_columns:
+        lines += [
+            "    columns = self.world_columns",
+            "    if columns is not None:",
+            "        columns.clear()"
+        ]
+
+    model_class = entity_type.model_class if profile is None else profile.model_class(entity_type)
+    model_name = model_class.__name__
+    constants[model_name] = model_class
+    runs = list(enumerate(field_runs(entity_type.fields)))
+
+    if entity_type.pooled:
+        if "id" not in [field_name for field_name, _ in runs[0][1][1]]:
+            raise ValueError("Pooled entity type '%s' must start with a fixed-width id." % entity_type.name)
+
+        id_lines, id_values = generate_field_reads(entity_type, runs[:1], byte_order, constants, "    ", False)
+        new_lines, new_values = generate_field_reads(
+            entity_type, runs[1:], byte_order, constants, "        ", False, skipped_fields
+        )
+        pooled_lines, pooled_values = generate_field_reads(
+            entity_type, runs[1:], byte_order, constants, "        ", True, skipped_fields
+        )
+        lines += id_lines
+        lines.append("    unit_pool = self.unit_pool")
+        lines.append("    if unit_pool is None:")
+        lines += new_lines
+        lines.append("        value = %s(%s)" % (model_name, ", ".join(id_values + new_values)))
+        lines.append("    else:")
+        lines.append("        value = unit_pool.acquire(%s, id)" % model_name)
+        lines += pooled_lines
+        lines.append("        value.__init__(%s)" % ", ".join(id_values + pooled_values))
+    else:
+        field_lines, values = generate_field_reads(
+            entity_type, runs, byte_order, constants, "    ", False, skipped_fields
+        )
+        lines += field_lines
+
+        if entity_type.positional:
+            lines.append("    value = %s(%s)" % (model_name, ", ".join(values)))
+        else:
+            lines.append("    value = %s()" % model_name)
+            for (field_name, _), field_value in zip(entity_type.fields, values):
+                if field_name not in skipped_fields:
+                    lines.append("    value.%s = %s" % (field_name, field_value))
+
+    if skipped_fields:
+        lazy_fields = []
+
+        for field_name, field_type in entity_type.fields:
+            if field_name in skipped_fields:
+                decoder_name = "%s_%s_DECODER" % (entity_type.name.upper(), field_name.upper())
+                constants[decoder_name] = profile.lazy_decoder(field_type)
+                if entity_type.positional:
+                    lines.append("    del value.%s" % field_name)
+                lazy_fields.append("%r: (%s, %s)" % (field_name, decoder_name, field_name))
+
+        lines.append("    value.lazy_fields = {%s}" % ", ".join(lazy_fields))
+
+    if entity_type.registry is not None:
+        # Units of list-cached kinds stay in use while their list is reused, see UnitCache.
+        static = entity_type.list_cache is not None
+        if "life" in [field_name for field_name, _ in entity_type.fields]:
+            lines.append("    self.%s.store(value.id, value, life <= 0, %s)" % (entity_type.registry, static))
+        else:
+            lines.append("    self.%s.store(value.id, value, False, %s)" % (entity_type.registry, static))
+
+    if entity_type.column_kind is not None:
+        field_names = [field_name for field_name, _ in entity_type.fields]
+        lines += [
+            "    columns = self.world_columns",
+            "    if columns is not None:",
+            "        columns.append(%d, value, id, x, y, speed_x, speed_y, radius, life, max_life, faction, %s)" % (
+                entity_type.column_kind,
+                "remaining_action_cooldown_ticks" if "remaining_action_cooldown_ticks" in field_names else "0"
+            )
+        ]
+
+    if entity_type.collects_columns:
+        lines.append("    value.columns = None if columns is None else columns.finish()")
+
+    lines.append("    return value")
+    return lines
+
+
+def generate_writer(entity_type, byte_order, constants):
+    lines = [
+        "def write_%s(self, value):" % entity_type.name,
+        "    if value is None:",
+        "        self.write_boolean(False)",
+        "        return"
+    ]
+
+    flag_pending = True
+
+    for run_index, (fixed, fields) in enumerate(field_runs(entity_type.fields)):
+        if fixed:
+            struct_name = "%s_WRITE_STRUCT_%d" % (entity_type.name.upper(), run_index)
+            constants[struct_name] = struct.Struct(
+                byte_order + ("b" if flag_pending else "") +
+                "".join(field_type.struct_format for _, field_type in fields)
+            )
+            arguments = ["1"] if flag_pending else []
+            arguments += [field_type.encode("value." + field_name, constants) for field_name, field_type in fields]
+            lines.append("    %s.pack_into(self.write_buffer, self.reserve_write_bytes(%d), %s)" % (
+                struct_name, constants[struct_name].size, ", ".join(arguments)
+            ))
+        else:
+            if flag_pending:
+                lines.append("    self.write_boolean(True)")
+            field_name, field_type = fields[0]
+            lines.append("    " + field_type.write("value." + field_name, constants))
+
+        flag_pending = False
+
+    return lines
+
+
+def generate_list_reader(entity_type, byte_order, constants):
+    lines = [
+        "def read_%s(self):" % entity_type.plural_name,
+        "    count = self.read_int()",
+        "    if count < 0:",
+        "        return %s" % ("None" if entity_type.list_cache is None else "self." + entity_type.list_cache),
+        "    read_%s = self.read_%s" % (entity_type.name, entity_type.name),
+        "    values = [read_%s() for _ in range(count)]" % entity_type.name
+    ]
+
+    if entity_type.list_cache is not None:
+        lines.append("    self.%s = values" % entity_type.list_cache)
+
+    lines.append("    return values")
+    return lines
+
+
+def generate_list_reader_into(entity_type, byte_order, constants):
+    lines = [
+        "def read_%s_into(self, values):" % entity_type.plural_name,
+        "    count = self.read_int()",
+        "    if count < 0:",
+        "        return %s" % ("None" if entity_type.list_cache is None else "self." + entity_type.list_cache),
+        "    if values is None:",
+        "        values = []",
+        "    else:",
+        "        del values[:]",
+        "    read_%s = self.read_%s" % (entity_type.name, entity_type.name),
+        "    for _ in range(count):",
+        "        values.append(read_%s())" % entity_type.name
+    ]
+
+    if entity_type.list_cache is not None:
+        lines.append("    self.%s = values" % entity_type.list_cache)
+
+    lines.append("    return values")
+    return lines
+
+
+def fields_contain_registry(entity_type):
+    for _, field_type in entity_type.fields:
+        entity_name = getattr(field_type, "entity_name", None)
+        if entity_name is not None and contains_registry(ENTITY_TYPE_BY_NAME[entity_name]):
+            return True
+
+    return False
+
+
+def generate_skipper(entity_type, byte_order, constants):
+    # Units of registry kinds get a skipper too, though a decode profile may not skip them: the asynchronous parser
+    # steps over a pooled unit to see it is fully buffered before decoding it.
+    if fields_contain_registry(entity_type):
+        return []
+
+    lines = ["def skip_%s(self):" % entity_type.name]
+
+    if entity_type.registry is None:
+        lines += [
+            "    if not self.read_boolean():",
+            "        return"
+        ]
+    else:
+        lines += [
+            "    flag = self.read_signed_byte()",
+            "    if flag == 0:",
+            "        return",
+            "    if flag == 100:",
+            "        self.reserve_bytes(8)",
+            "        return"
+        ]
+
+    for run_index, (fixed, fields) in enumerate(field_runs(entity_type.fields)):
+        if fixed:
+            lines.append("    self.reserve_bytes(%d)" % struct.calcsize(
+                byte_order + "".join(field_type.struct_format for _, field_type in fields)
+            ))
+        else:
+            lines.append("    " + fields[0][1].skip())
+
+    return lines
+
+
+def generate_list_skipper(entity_type, byte_order, constants):
+    if fields_contain_registry(entity_type):
+        return []
+
+    return [
+        "def skip_%s(self):" % entity_type.plural_name,
+        "    skip_%s = self.skip_%s" % (entity_type.name, entity_type.name),
+        "    for _ in range(self.read_int()):",
+        "        skip_%s()" % entity_type.name
+    ]
+
+
+def generate_list_writer(entity_type, byte_order, constants):
+    return [
+        "def write_%s(self, values):" % entity_type.plural_name,
+        "    if values is None:",
+        "        self.write_int(-1)",
+        "        return",
+        "    self.write_int(values.__len__())",
+        "    write_%s = self.write_%s" % (entity_type.name, entity_type.name),
+        "    for value in values:",
+        "        write_%s(value)" % entity_type.name
+    ]
+
+
+CODEC_GENERATORS = [
+    generate_reader, generate_writer, generate_list_reader, generate_list_reader_into, generate_list_writer,
+    generate_skipper, generate_list_skipper
+]
+
+
+def compile_functions(name, functions, constants):
+    functions = [lines for lines in functions if lines]
+    source = "\n\n".join("\n".join(lines) for lines in functions) + "\n"
+    generated_sources[name] = source
+
+    namespace = dict(constants)
+    exec(compile(source, "<codec %s>" % name, "exec"), namespace)
+
+    function_names = [lines[0][len("def "):lines[0].index("(")] for lines in functions]
+    return {function_name: namespace[function_name] for function_name in function_names}
+
+
+def install_codecs(client_class):
+    for entity_type in ENTITY_TYPES:
+        constants = {}
+        functions = [generate(entity_type, client_class.BYTE_ORDER_FORMAT_STRING, constants)
+                     for generate in CODEC_GENERATORS]
+
+        for function_name, function in compile_functions(entity_type.name, functions, constants).items():
+            setattr(client_class, function_name, function)
@@ -0,0 +1,34 @@
+import mmap
+
+from RemoteProcessClient import RemoteProcessClient
+from TrafficCapture import TrafficCapture
+
+
+class ReplayClient(RemoteProcessClient):
+    def __init__(self, path, unit_pool=None, unit_cache=None, world_columns=None, decode_profile=None):
+        capture_file = open(path, "rb")
+        RemoteProcessClient.__init__(
+            self, None, None, capture_file, unit_pool, unit_cache, world_columns=world_columns,
+            decode_profile=decode_profile
+        )
+
+        self.read_buffer = mmap.mmap(capture_file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.read_view = memoryview(self.read_buffer)
+        self.read_limit = self.read_buffer.__len__()
+        self.message_offsets = TrafficCapture.read_index(path, RemoteProcessClient.SWAP_ARRAY_BYTES)
+
+    def seek_message(self, message_index):
+        self.read_offset = self.message_offsets[message_index]
+
+    def fill_read_buffer(self, byte_count):
+        raise IOError("Can't read %s bytes from capture: %d of %d bytes left." % (
+            str(byte_count), self.read_limit - self.read_offset, self.read_limit
+        ))
+
+    def flush(self):
+        self.write_offset = 0
+
+    def close(self):
+        self.read_view.release()
+        self.read_buffer.close()
+        RemoteProcessClient.close(self)
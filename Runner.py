@@ -1,13 +1,24 @@
 import sys
+import time
 
+from DecisionTrace import DecisionTrace
 from MyStrategy import MyStrategy
 from RemoteProcessClient import RemoteProcessClient
+from ReplayClient import ReplayClient
+from StrategyLog import StrategyLog
+from TimeBudget import TickOverrun, TimeBudget
 from model.Move import Move
 
 
 class Runner:
     def __init__(self):
-        if sys.argv.__len__() == 4:
+        if sys.argv.__len__() == 3 and sys.argv[1] == "--replay":
+            self.remote_process_client = ReplayClient(sys.argv[2])
+            self.token = "0000000000000000"
+        elif sys.argv.__len__() == 5:
+            self.remote_process_client = RemoteProcessClient(sys.argv[1], int(sys.argv[2]), capture_path=sys.argv[4])
+            self.token = sys.argv[3]
+        elif sys.argv.__len__() == 4:
             self.remote_process_client = RemoteProcessClient(sys.argv[1], int(sys.argv[2]))
             self.token = sys.argv[3]
         else:
@@ -15,6 +26,9 @@ class Runner:
             self.token = "0000000000000000"
 
     def run(self):
+        log = StrategyLog.shared()
+        trace = DecisionTrace.shared()
+        trace.install_dump_signal()
         try:
             self.remote_process_client.write_token_message(self.token)
             self.remote_process_client.write_protocol_version_message()
@@ -22,9 +36,10 @@ class Runner:
             game = self.remote_process_client.read_game_context_message()
 
             strategies = []
+            time_budget = TimeBudget(game.tick_count, team_size)
 
             for _ in range(team_size):
-                strategies.append(MyStrategy())
+                strategies.append(MyStrategy(time_budget, log, trace))
 
             while True:
                 player_context = self.remote_process_client.read_player_context_message()
@@ -36,16 +51,47 @@ class Runner:
                     break
 
                 moves = []
+                tick_index = player_context.world.tick_index
+                tick_start = time.process_time()
 
                 for wizard_index in range(team_size):
                     player_wizard = player_wizards[wizard_index]
 
                     move = Move()
                     moves.append(move)
-                    strategies[wizard_index].move(player_wizard, player_context.world, game, move)
+                    try:
+                        with time_budget.watchdog():
+                            strategies[wizard_index].move(player_wizard, player_context.world, game, move)
+                    except TickOverrun:
+                        log.warning(tick_index, "Move overran %.1f s, standing still", time_budget.hard_limit_seconds)
+                        moves[wizard_index] = Move()
+                        trace.flag(DecisionTrace.OVERRUN)
+                        trace.replace_move(moves[wizard_index])
+                        strategies[wizard_index].recover()
+
+                tick_seconds = time.process_time() - tick_start
 
                 self.remote_process_client.write_moves_message(moves)
+                # The log is written while the game computes the next tick, not while the wizards move.
+                log.flush()
+
+                if tick_seconds > DecisionTrace.SLOW_TICK_SECONDS:
+                    path = trace.dump_slow_tick(tick_index)
+                    if path is not None:
+                        log.warning(tick_index, "Tick took %.3f s, decision trace dumped to %s", tick_seconds, path)
+                if trace.dump_requested:
+                    path = trace.dump(tick_index, "request")
+                    if path is not None:
+                        log.warning(tick_index, "Decision trace dumped to %s", path)
+        except Exception:
+            # The process is going down: a dump still being written is let finish rather than skipped.
+            trace.wait()
+            path = trace.dump(trace.last_tick(), "exception")
+            if path is not None:
+                log.warning(trace.last_tick(), "Decision trace dumped to %s", path)
+            raise
         finally:
+            log.close()
             self.remote_process_client.close()
 
 
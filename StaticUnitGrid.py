@@ -0,0 +1,75 @@
+from math import floor
+
+
+class StaticUnitGrid:
+    # Trees and buildings never move, and the server resends their lists only when one of them appears or disappears.
+    # Otherwise the decoder hands back the very list object it returned the tick before, so the grid is rebuilt only
+    # when it is given a different list.
+    CELL_SIZE = 100.0
+
+    # Queries return the units whose bounding boxes overlap the query box, padded so that rounding can't drop a unit
+    # that an exact distance test would accept. Callers run their own exact test on the candidates.
+    QUERY_MARGIN = 1.0
+
+    def __init__(self, cell_size=CELL_SIZE):
+        self.cell_size = cell_size
+        self.units = None
+        self.unit_count = 0
+        self.unit_indices_by_cell = {}
+
+        self.build_count = 0
+        self.reuse_count = 0
+
+    def update(self, units):
+        if units is self.units and units.__len__() == self.unit_count:
+            self.reuse_count += 1
+            return self
+
+        cell_size = self.cell_size
+        unit_indices_by_cell = {}
+
+        for index, unit in enumerate(units):
+            radius = unit.radius
+            min_cell_y = floor((unit.y - radius) / cell_size)
+            max_cell_y = floor((unit.y + radius) / cell_size)
+            for cell_x in range(floor((unit.x - radius) / cell_size), floor((unit.x + radius) / cell_size) + 1):
+                for cell_y in range(min_cell_y, max_cell_y + 1):
+                    unit_indices = unit_indices_by_cell.get((cell_x, cell_y))
+                    if unit_indices is None:
+                        unit_indices_by_cell[(cell_x, cell_y)] = [index]
+                    else:
+                        unit_indices.append(index)
+
+        self.units = units
+        self.unit_count = units.__len__()
+        self.unit_indices_by_cell = unit_indices_by_cell
+        self.build_count += 1
+        return self
+
+    def query_box(self, min_x, min_y, max_x, max_y):
+        cell_size = self.cell_size
+        margin = StaticUnitGrid.QUERY_MARGIN
+        unit_indices_by_cell = self.unit_indices_by_cell
+        min_cell_y = floor((min_y - margin) / cell_size)
+        max_cell_y = floor((max_y + margin) / cell_size)
+        cells = []
+
+        for cell_x in range(floor((min_x - margin) / cell_size), floor((max_x + margin) / cell_size) + 1):
+            for cell_y in range(min_cell_y, max_cell_y + 1):
+                unit_indices = unit_indices_by_cell.get((cell_x, cell_y))
+                if unit_indices is not None:
+                    cells.append(unit_indices)
+
+        if not cells:
+            return []
+
+        # A unit spanning several cells is listed in each of them; the candidates keep the order of the unit list.
+        unit_indices = cells[0] if cells.__len__() == 1 else sorted(set().union(*cells))
+        units = self.units
+        return [units[index] for index in unit_indices]
+
+    def query_circle(self, x, y, radius):
+        return self.query_box(x - radius, y - radius, x + radius, y + radius)
+
+    def query_segment(self, x1, y1, x2, y2, radius):
+        return self.query_box(min(x1, x2) - radius, min(y1, y2) - radius, max(x1, x2) + radius, max(y1, y2) + radius)
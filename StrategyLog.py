@@ -0,0 +1,104 @@
+import json
+import os
+import sys
+
+
+class StrategyLog:
+    # Leveled log of the strategies. A call only stores the tick, the level, the message format and its arguments,
+    # and a call below the level stores nothing, so the messages cost next to nothing on the tick path. The records
+    # are formatted and written in one go by flush, which Runner calls once the moves of a tick are sent and before
+    # the next world is read: units in the arguments are still as they were when the call was made, and describe
+    # turns them into text then.
+    #
+    # The level and the output are taken from STRATEGY_LOG_LEVEL (debug, info, warning or off; warning by default) and
+    # STRATEGY_LOG_PATH (standard output by default). A path ending in .jsonl gets a JSON object per line, any other
+    # path and standard output get lines as print would write them.
+    DEBUG = 10
+    INFO = 20
+    WARNING = 30
+    OFF = 100
+
+    LEVELS_BY_NAME = {"debug": DEBUG, "info": INFO, "warning": WARNING, "off": OFF}
+    NAMES_BY_LEVEL = {DEBUG: "debug", INFO: "info", WARNING: "warning"}
+
+    # Callers that never flush, such as the benchmarks, get their records written every so many.
+    MAX_BUFFERED_RECORDS = 10000
+
+    shared_log = None
+
+    def __init__(self, level=WARNING, path=None):
+        self.level = level
+        self.path = path
+        self.json_lines = (path is not None) and path.endswith(".jsonl")
+        self.file = None
+        self.records = []
+        self.describe = None
+
+        self.record_count = 0
+        self.flush_count = 0
+
+    @classmethod
+    def shared(cls):
+        if cls.shared_log is None:
+            level = cls.LEVELS_BY_NAME[os.environ.get("STRATEGY_LOG_LEVEL", "warning").lower()]
+            cls.shared_log = cls(level, os.environ.get("STRATEGY_LOG_PATH") or None)
+        return cls.shared_log
+
+    def debug(self, tick, message, *args):
+        if self.level <= StrategyLog.DEBUG:
+            self.add(tick, StrategyLog.DEBUG, message, args)
+
+    def info(self, tick, message, *args):
+        if self.level <= StrategyLog.INFO:
+            self.add(tick, StrategyLog.INFO, message, args)
+
+    def warning(self, tick, message, *args):
+        if self.level <= StrategyLog.WARNING:
+            self.add(tick, StrategyLog.WARNING, message, args)
+
+    def add(self, tick, level, message, args):
+        self.records.append((tick, level, message, args))
+        if self.records.__len__() >= StrategyLog.MAX_BUFFERED_RECORDS:
+            self.flush()
+
+    def format(self, message, args):
+        if not args:
+            return message
+        describe = self.describe
+        if describe is not None:
+            args = tuple(describe(arg) for arg in args)
+        return message % args
+
+    def flush(self):
+        if not self.records:
+            return
+        records = self.records
+        self.records = []
+        self.record_count += records.__len__()
+        self.flush_count += 1
+
+        lines = []
+        if self.json_lines:
+            names_by_level = StrategyLog.NAMES_BY_LEVEL
+            for tick, level, message, args in records:
+                lines.append(json.dumps({
+                    "tick": tick, "level": names_by_level[level], "message": self.format(message, args)
+                }))
+        else:
+            for tick, _, message, args in records:
+                text = self.format(message, args)
+                lines.append(text if tick is None else "%d %s" % (tick, text))
+        lines.append("")
+
+        if self.path is None:
+            sys.stdout.write("\n".join(lines))
+            return
+        if self.file is None:
+            self.file = open(self.path, "a")
+        self.file.write("\n".join(lines))
+
+    def close(self):
+        self.flush()
+        if self.file is not None:
+            self.file.close()
+            self.file = None
@@ -0,0 +1,88 @@
+import contextlib
+import time
+
+
+class TickOverrun(Exception):
+    pass
+
+
+class TimeBudget:
+    # Keeps the CPU time of the process against the allowance of the game: BASE_SECONDS plus TICK_SECONDS for every
+    # tick, shared by the moves of all wizards of the team. The time is the CPU time of the whole process, so reading
+    # and writing messages counts as well, as it does for the game. The share of a move is what is left of the
+    # allowance split evenly over the moves still to come; when it falls below the allowance of a move, expensive
+    # stages should switch to their cheap fallbacks, and below half of it to the cheapest ones.
+    BASE_SECONDS = 10.0
+    TICK_SECONDS = 0.010
+    # A move that uses more CPU time than this is cut short and the wizard sends a move that does nothing instead.
+    HARD_LIMIT_SECONDS = 1.0
+
+    FULL = 0
+    REDUCED = 1
+    MINIMAL = 2
+
+    def __init__(self, tick_count, moves_per_tick=1, base_seconds=BASE_SECONDS, tick_seconds=TICK_SECONDS,
+                 hard_limit_seconds=HARD_LIMIT_SECONDS):
+        self.move_seconds = tick_seconds / moves_per_tick
+        self.allowance_seconds = base_seconds + tick_seconds * tick_count
+        self.total_move_count = tick_count * moves_per_tick
+        self.moves_per_tick = moves_per_tick
+        self.hard_limit_seconds = hard_limit_seconds
+        self.start_process_time = time.process_time()
+
+        self.level = TimeBudget.FULL
+        self.move_start = None
+        self.hard_deadline = None
+        self.move_share_seconds = self.allowance_seconds / max(self.total_move_count, 1)
+
+        self.move_count = 0
+        self.move_seconds_total = 0.0
+        self.last_move_seconds = 0.0
+        self.max_move_seconds = 0.0
+        self.moves_by_level = [0, 0, 0]
+        self.overrun_count = 0
+
+    def used_seconds(self):
+        return time.process_time() - self.start_process_time
+
+    def remaining_seconds(self):
+        return self.allowance_seconds - self.used_seconds()
+
+    def start_move(self, tick_index):
+        self.move_start = time.process_time()
+        moves_left = max(self.total_move_count - tick_index * self.moves_per_tick, 1)
+        self.move_share_seconds = max(self.remaining_seconds(), 0.0) / moves_left
+        if self.move_share_seconds >= self.move_seconds:
+            self.level = TimeBudget.FULL
+        elif self.move_share_seconds >= self.move_seconds * 0.5:
+            self.level = TimeBudget.REDUCED
+        else:
+            self.level = TimeBudget.MINIMAL
+        self.moves_by_level[self.level] += 1
+
+    def remaining_move_seconds(self):
+        return self.move_share_seconds - (time.process_time() - self.move_start)
+
+    def end_move(self):
+        self.last_move_seconds = time.process_time() - self.move_start
+        self.move_count += 1
+        self.move_seconds_total += self.last_move_seconds
+        self.max_move_seconds = max(self.max_move_seconds, self.last_move_seconds)
+
+    @contextlib.contextmanager
+    def watchdog(self):
+        # Makes check raise TickOverrun in the body once the body has used the hard limit of CPU time. The body checks
+        # at points where giving up leaves its state whole, between stages and chunks of work, so it runs on past the
+        # limit until the next of them. The time is that of the calling thread only: the trace writer and other
+        # threads of the process aren't charged to the move, nor is time spent waiting.
+        self.hard_deadline = time.thread_time() + self.hard_limit_seconds
+        try:
+            yield
+        finally:
+            self.hard_deadline = None
+
+    def check(self):
+        if (self.hard_deadline is not None) and (time.thread_time() >= self.hard_deadline):
+            self.hard_deadline = None
+            self.overrun_count += 1
+            raise TickOverrun()
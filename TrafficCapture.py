@@ -0,0 +1,47 @@
+import os
+from array import array
+
+
+class TrafficCapture:
+    INDEX_FILE_SUFFIX = ".idx"
+
+    def __init__(self, path, swap_index_bytes=False):
+        self.path = path
+        self.swap_index_bytes = swap_index_bytes
+        self.data_file = open(path, "ab")
+        self.index_file = open(path + TrafficCapture.INDEX_FILE_SUFFIX, "ab")
+        self.byte_count = os.path.getsize(path)
+        self.message_count = 0
+
+    def write(self, data):
+        self.data_file.write(data)
+        self.byte_count += data.__len__()
+
+    def mark_message(self, pending_byte_count):
+        offsets = array("q", [self.byte_count - pending_byte_count])
+        if self.swap_index_bytes:
+            offsets.byteswap()
+
+        offsets.tofile(self.index_file)
+        self.message_count += 1
+
+    def flush(self):
+        self.data_file.flush()
+        self.index_file.flush()
+
+    def close(self):
+        self.data_file.close()
+        self.index_file.close()
+
+    @staticmethod
+    def read_index(path, swap_index_bytes=False):
+        offsets = array("q")
+        index_path = path + TrafficCapture.INDEX_FILE_SUFFIX
+
+        if os.path.exists(index_path):
+            with open(index_path, "rb") as index_file:
+                offsets.frombytes(index_file.read())
+            if swap_index_bytes:
+                offsets.byteswap()
+
+        return offsets.tolist()
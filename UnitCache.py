@@ -0,0 +1,62 @@
+class UnitCache:
+    # The server may refer to any unit it has sent before with a flag-100 back-reference, so an id is only evicted
+    # when the unit is known to be dead or has not been referenced for a long time. Trees and buildings are exempt
+    # from the latter: while the server sends -1 for their lists, the reader returns the cached list without reading
+    # them, so they stay in use however long ago they were last referenced.
+    DEFAULT_TTL_TICKS = 2000
+    SWEEP_INTERVAL_TICKS = 100
+
+    def __init__(self, ttl_ticks=DEFAULT_TTL_TICKS, sweep_interval_ticks=SWEEP_INTERVAL_TICKS):
+        self.ttl_ticks = ttl_ticks
+        self.sweep_interval_ticks = sweep_interval_ticks
+        self.tick = 0
+        self.unit_by_id = {}
+        self.referenced_tick_by_id = {}
+        self.dead_unit_ids = []
+
+        self.hit_count = 0
+        self.store_count = 0
+        self.eviction_count = 0
+
+    def __len__(self):
+        return self.unit_by_id.__len__()
+
+    def reference(self, unit_id):
+        unit = self.unit_by_id.get(unit_id)
+        if unit is None:
+            raise IOError("Received a reference to unknown or evicted unit [id=%s]." % unit_id)
+
+        if unit_id in self.referenced_tick_by_id:
+            self.referenced_tick_by_id[unit_id] = self.tick
+        self.hit_count += 1
+        return unit
+
+    def store(self, unit_id, unit, dead=False, static=False):
+        # Static units are not tracked by referenced tick, so the TTL sweep never evicts them.
+        self.unit_by_id[unit_id] = unit
+        if static:
+            self.referenced_tick_by_id.pop(unit_id, None)
+        else:
+            self.referenced_tick_by_id[unit_id] = self.tick
+        self.store_count += 1
+        if dead:
+            self.dead_unit_ids.append(unit_id)
+
+    def evict(self, unit_id):
+        if self.unit_by_id.pop(unit_id, None) is not None:
+            self.eviction_count += 1
+        self.referenced_tick_by_id.pop(unit_id, None)
+
+    def end_tick(self):
+        if self.dead_unit_ids:
+            for unit_id in self.dead_unit_ids:
+                self.evict(unit_id)
+            del self.dead_unit_ids[:]
+
+        if self.ttl_ticks is not None and self.tick % self.sweep_interval_ticks == 0:
+            min_referenced_tick = self.tick - self.ttl_ticks
+            for unit_id, tick in list(self.referenced_tick_by_id.items()):
+                if tick < min_referenced_tick:
+                    self.evict(unit_id)
+
+        self.tick += 1
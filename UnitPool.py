@@ -0,0 +1,67 @@
+class UnitPool:
+    # Units are kept registered for a while after they vanish: a strategy may still hold a reference to a unit that
+    # has just left the vision range, and that object must not turn into some other unit under its feet. Nor is a unit
+    # recycled while UnitCache still holds it, since the server may refer back to it until the cache lets it expire.
+    RECYCLE_DELAY_TICKS = 100
+
+    def __init__(self, recycle_delay_ticks=RECYCLE_DELAY_TICKS):
+        self.recycle_delay_ticks = recycle_delay_ticks
+        self.tick = 0
+        self.unit_by_id = {}
+        self.last_seen_tick_by_id = {}
+        self.free_units_by_class = {}
+
+        self.allocated_count = 0
+        self.reused_count = 0
+        self.last_tick_allocated_count = 0
+        self.last_tick_reused_count = 0
+        self.last_tick_recycled_count = 0
+        self.total_allocated_count = 0
+        self.total_reused_count = 0
+        self.total_recycled_count = 0
+
+    def acquire(self, unit_class, unit_id):
+        unit = self.unit_by_id.get(unit_id)
+
+        if unit is not None and unit.__class__ is unit_class:
+            self.reused_count += 1
+        else:
+            free_units = self.free_units_by_class.get(unit_class)
+            if free_units:
+                unit = free_units.pop()
+                self.reused_count += 1
+            else:
+                unit = unit_class.__new__(unit_class)
+                self.allocated_count += 1
+            self.unit_by_id[unit_id] = unit
+
+        self.last_seen_tick_by_id[unit_id] = self.tick
+        return unit
+
+    def touch(self, unit):
+        if self.unit_by_id.get(unit.id) is unit:
+            self.last_seen_tick_by_id[unit.id] = self.tick
+
+    def end_tick(self, unit_cache):
+        min_seen_tick = self.tick - self.recycle_delay_ticks
+        recycled_count = 0
+
+        cached_unit_by_id = unit_cache.unit_by_id
+        for unit_id in [unit_id for unit_id, tick in self.last_seen_tick_by_id.items() if tick < min_seen_tick]:
+            unit = self.unit_by_id[unit_id]
+            if cached_unit_by_id.get(unit_id) is unit:
+                continue
+            del self.unit_by_id[unit_id]
+            del self.last_seen_tick_by_id[unit_id]
+            self.free_units_by_class.setdefault(unit.__class__, []).append(unit)
+            recycled_count += 1
+
+        self.last_tick_allocated_count = self.allocated_count
+        self.last_tick_reused_count = self.reused_count
+        self.last_tick_recycled_count = recycled_count
+        self.total_allocated_count += self.allocated_count
+        self.total_reused_count += self.reused_count
+        self.total_recycled_count += recycled_count
+        self.allocated_count = 0
+        self.reused_count = 0
+        self.tick += 1
@@ -0,0 +1,99 @@
+from operator import attrgetter
+
+get_faction = attrgetter("faction")
+get_radius = attrgetter("radius")
+
+
+class UnitSpatialHash:
+    # Moving units are hashed by faction and by the cell of their centre, and the hash is rebuilt whenever it is given
+    # a new list, which the strategy does once per tick. A query returns the units of the given factions in the cells
+    # around the query circle widened by the largest unit radius: every unit whose circle may reach the query circle,
+    # in the order of the unit list. Callers run their own exact test on these candidates. Cells are found with int(),
+    # which truncates towards zero; that keeps them monotonic in the coordinates, which is all the queries rely on.
+    QUERY_MARGIN = 1.0
+
+    # Below this many units a faction filter over the whole list is cheaper than building the cells.
+    MIN_HASHED_UNIT_COUNT = 100
+
+    def __init__(self, cell_size):
+        self.cell_size = cell_size
+        self.units = None
+        self.unit_indices_by_cell = {}
+        self.max_radius = 0.0
+
+        self.build_count = 0
+        self.query_count = 0
+
+    def update(self, units):
+        if units is self.units:
+            return self
+
+        self.units = units
+        self.max_radius = max(map(get_radius, units), default=0.0)
+        self.build_count += 1
+
+        if units.__len__() < UnitSpatialHash.MIN_HASHED_UNIT_COUNT:
+            self.unit_indices_by_cell = None
+            return self
+
+        scale = 1.0 / self.cell_size
+        unit_indices_by_cell = {}
+
+        for index, unit in enumerate(units):
+            key = (unit.faction, int(unit.x * scale), int(unit.y * scale))
+            unit_indices = unit_indices_by_cell.get(key)
+            if unit_indices is None:
+                unit_indices_by_cell[key] = [index]
+            else:
+                unit_indices.append(index)
+
+        self.unit_indices_by_cell = unit_indices_by_cell
+        return self
+
+    def factions(self):
+        if self.unit_indices_by_cell is None:
+            return list(set(map(get_faction, self.units)))
+        return list({faction for faction, _, _ in self.unit_indices_by_cell})
+
+    def units_of_faction(self, faction):
+        if self.unit_indices_by_cell is None:
+            return [unit for unit in self.units if unit.faction == faction]
+
+        cells = [unit_indices for key, unit_indices in self.unit_indices_by_cell.items() if key[0] == faction]
+        units = self.units
+        return [units[index] for index in sorted(set().union(*cells))]
+
+    def query_circle(self, x, y, radius, factions):
+        self.query_count += 1
+        if self.unit_indices_by_cell is None:
+            return [unit for unit in self.units if unit.faction in factions]
+
+        scale = 1.0 / self.cell_size
+        radius += self.max_radius + UnitSpatialHash.QUERY_MARGIN
+        min_cell_x = int((x - radius) * scale)
+        max_cell_x = int((x + radius) * scale)
+        min_cell_y = int((y - radius) * scale)
+        max_cell_y = int((y + radius) * scale)
+        unit_indices_by_cell = self.unit_indices_by_cell
+
+        if (max_cell_x - min_cell_x + 1) * (max_cell_y - min_cell_y + 1) * factions.__len__() > \
+                unit_indices_by_cell.__len__():
+            cells = [
+                unit_indices for (faction, cell_x, cell_y), unit_indices in unit_indices_by_cell.items()
+                if min_cell_x <= cell_x <= max_cell_x and min_cell_y <= cell_y <= max_cell_y and faction in factions
+            ]
+        else:
+            cells = []
+            for faction in factions:
+                for cell_x in range(min_cell_x, max_cell_x + 1):
+                    for cell_y in range(min_cell_y, max_cell_y + 1):
+                        unit_indices = unit_indices_by_cell.get((faction, cell_x, cell_y))
+                        if unit_indices is not None:
+                            cells.append(unit_indices)
+
+        if not cells:
+            return []
+
+        unit_indices = cells[0] if cells.__len__() == 1 else sorted(set().union(*cells))
+        units = self.units
+        return [units[index] for index in unit_indices]
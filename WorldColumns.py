@@ -0,0 +1,91 @@
+import struct
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class WorldColumns:
+    BUILDING = 0
+    WIZARD = 1
+    MINION = 2
+    TREE = 3
+
+    COLUMNS = [
+        ("id", "<i8", "q"), ("x", "<f8", "d"), ("y", "<f8", "d"), ("speed_x", "<f8", "d"), ("speed_y", "<f8", "d"),
+        ("radius", "<f8", "d"), ("life", "<i4", "i"), ("max_life", "<i4", "i"), ("faction", "<i1", "b"),
+        ("kind", "<i1", "b"), ("remaining_action_cooldown_ticks", "<i4", "i")
+    ]
+
+    # While a world is decoded, a row is packed with one call into a preallocated table of the same layout. Once it is
+    # decoded, finish copies every field of the table into a contiguous array of its own, which is the column.
+    ROW_STRUCT = struct.Struct("<" + "".join(struct_format for _, _, struct_format in COLUMNS))
+
+    INITIAL_CAPACITY = 1024
+
+    def __init__(self, capacity=INITIAL_CAPACITY):
+        if numpy is None:
+            raise ImportError("NumPy is required for the columnar world view.")
+
+        self.dtype = numpy.dtype([(column_name, dtype) for column_name, dtype, _ in WorldColumns.COLUMNS])
+        self.pack_row = WorldColumns.ROW_STRUCT.pack_into
+        self.row_size = WorldColumns.ROW_STRUCT.size
+        self.table = None
+        self.buffer = None
+        self.column_arrays = {}
+        self.units = []
+        self.size = 0
+        self.capacity = 0
+        self.grow(capacity)
+        self.finish()
+
+    def grow(self, capacity):
+        table = numpy.zeros(capacity, self.dtype)
+        if self.table is not None:
+            table[:self.size] = self.table[:self.size]
+        self.table = table
+        self.buffer = memoryview(table).cast("B")
+        self.column_arrays = {
+            column_name: numpy.zeros(capacity, dtype) for column_name, dtype, _ in WorldColumns.COLUMNS
+        }
+        self.capacity = capacity
+
+    def clear(self):
+        self.units = []
+        self.size = 0
+
+    def append(self, kind, unit, id, x, y, speed_x, speed_y, radius, life, max_life, faction,
+               remaining_action_cooldown_ticks):
+        index = self.size
+        if index == self.capacity:
+            self.grow(2 * self.capacity)
+        self.pack_row(
+            self.buffer, index * self.row_size, id, x, y, speed_x, speed_y, radius, life, max_life, faction, kind,
+            remaining_action_cooldown_ticks
+        )
+        self.units.append(unit)
+        self.size = index + 1
+
+    def append_unit(self, kind, unit):
+        self.append(
+            kind, unit, unit.id, unit.x, unit.y, unit.speed_x, unit.speed_y, unit.radius, unit.life, unit.max_life,
+            -1 if unit.faction is None else unit.faction, getattr(unit, "remaining_action_cooldown_ticks", 0)
+        )
+
+    def finish(self):
+        # The columns are views of the first size elements of the column arrays, valid until the next world is decoded.
+        size = self.size
+        rows = self.table[:size]
+        for column_name, _, _ in WorldColumns.COLUMNS:
+            column = self.column_arrays[column_name][:size]
+            numpy.copyto(column, rows[column_name])
+            setattr(self, column_name, column)
+        return self
+
+    def distances_to(self, x, y):
+        return numpy.hypot(self.x - x, self.y - y)
+
+    def units_where(self, mask):
+        units = self.units
+        return [units[index] for index in numpy.flatnonzero(mask)]
@@ -0,0 +1,123 @@
+"""Move time at every level of the time budget, how a tight allowance is kept, and the watchdog.
+
+Usage: python -m benchmarks.budget [--capture PATH] [--scale NAME] [--ticks N] [--seed N] [--tick-ms MS]
+                                   [--hard-limit-ms MS]
+
+Worlds come from a capture or from a synthetic world played forward with the moves, as for benchmarks.strategy, and the
+wizards of our faction move through N ticks of them; every run starts from the same world. First the time budget is held
+at each level in turn, which gives the time a move takes at full, reduced and minimal level. Then the wizards move on an
+allowance of the given milliseconds per tick and no base allowance, and the moves spent at every level and the CPU time
+the moves used against the allowance are reported; the frames are made in this process, so their time isn't charged.
+Last, the moves run under the watchdog with the given hard limit, as Runner runs them, and the moves cut short are
+counted. All times are CPU time, the clock the budget and the watchdog keep.
+"""
+
+import argparse
+import contextlib
+import io
+import time
+
+from MyStrategy import MyStrategy
+from StrategyLog import StrategyLog
+from TimeBudget import TickOverrun, TimeBudget
+from benchmarks.frames import SCALES, make_frames
+from model.Move import Move
+
+LEVEL_NAMES = ["full", "reduced", "minimal"]
+
+
+class FixedLevelTimeBudget(TimeBudget):
+    def __init__(self, tick_count, level):
+        TimeBudget.__init__(self, tick_count)
+        self.fixed_level = level
+
+    def start_move(self, tick_index):
+        TimeBudget.start_move(self, tick_index)
+        self.moves_by_level[self.level] -= 1
+        self.level = self.fixed_level
+        self.moves_by_level[self.level] += 1
+
+
+class MoveTimeBudget(TimeBudget):
+    # Charges only the CPU time of the moves: the frames are made in this process, not by a server of their own.
+    def used_seconds(self):
+        return self.move_seconds_total
+
+
+def percentile(sorted_values, fraction):
+    return sorted_values[min(sorted_values.__len__() - 1, int(sorted_values.__len__() * fraction))]
+
+
+def our_wizards(world):
+    return [wizard for wizard in world.wizards if wizard.faction == world.wizards[0].faction]
+
+
+def run_moves(frames, ticks, make_time_budget, watchdog_budget=None):
+    strategies = {}
+    move_times = []
+    overrun_count = 0
+    game = frames.game
+    with contextlib.redirect_stdout(io.StringIO()):
+        for player_context in frames.player_contexts(ticks):
+            world = player_context.world
+            for me in our_wizards(world):
+                move = Move()
+                strategy = strategies.get(me.id)
+                if strategy is None:
+                    strategy = strategies[me.id] = MyStrategy(make_time_budget())
+                    strategy.move(me, world, game, move)
+                    frames.move(me.id, move)
+                    continue
+                start = time.process_time()
+                if watchdog_budget is None:
+                    strategy.move(me, world, game, move)
+                else:
+                    try:
+                        with watchdog_budget.watchdog():
+                            strategy.move(me, world, game, move)
+                    except TickOverrun:
+                        overrun_count += 1
+                        move = Move()
+                        strategy.recover()
+                move_times.append(time.process_time() - start)
+                frames.move(me.id, move)
+            StrategyLog.shared().flush()
+    move_times.sort()
+    return move_times, overrun_count
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--capture")
+    parser.add_argument("--scale", default="late", choices=sorted(SCALES))
+    parser.add_argument("--ticks", type=int, default=300)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--tick-ms", type=float, default=16.0)
+    parser.add_argument("--hard-limit-ms", type=float, default=20.0)
+    args = parser.parse_args()
+
+    first_world = next(make_frames(args.capture, args.scale, args.seed).player_contexts(1)).world
+    wizard_count = our_wizards(first_world).__len__()
+
+    for level, name in enumerate(LEVEL_NAMES):
+        frames = make_frames(args.capture, args.scale, args.seed)
+        move_times, _ = run_moves(frames, args.ticks, lambda: FixedLevelTimeBudget(args.ticks, level))
+        print("%-7s level: move mean %.2f ms, median %.2f ms, p99 %.2f ms" % (
+            name, sum(move_times) / move_times.__len__() * 1e3, percentile(move_times, 0.5) * 1e3,
+            percentile(move_times, 0.99) * 1e3))
+
+    time_budget = MoveTimeBudget(args.ticks, wizard_count, base_seconds=0.0, tick_seconds=args.tick_ms * 1e-3)
+    run_moves(make_frames(args.capture, args.scale, args.seed), args.ticks, lambda: time_budget)
+    print("allowance of %.1f ms per tick for %d wizards: used %.2f s of %.2f s, moves by level %s" % (
+        args.tick_ms, wizard_count, time_budget.used_seconds(), time_budget.allowance_seconds,
+        ", ".join("%s %d" % (name, count) for name, count in zip(LEVEL_NAMES, time_budget.moves_by_level))))
+
+    watchdog_budget = TimeBudget(args.ticks, wizard_count, hard_limit_seconds=args.hard_limit_ms * 1e-3)
+    move_times, overrun_count = run_moves(
+        make_frames(args.capture, args.scale, args.seed), args.ticks, lambda: watchdog_budget, watchdog_budget)
+    print("watchdog at %.1f ms: %d of %d moves cut short, longest move %.2f ms" % (
+        args.hard_limit_ms, overrun_count, move_times.__len__(), move_times[-1] * 1e3))
+
+
+if __name__ == "__main__":
+    main()
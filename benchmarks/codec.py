@@ -0,0 +1,161 @@
+"""Decode and encode throughput of the protocol codec per entity type and frame scale.
+
+Usage: python -m benchmarks.codec [--scale NAME ...] [--min-time SECONDS] [--repeat N] [--output PATH]
+                                  [--baseline PATH]
+
+Every entity list of a synthetic frame (and the frame itself) is encoded once with the write_* methods and then
+decoded and encoded again in a loop, straight from and into memory. Results are reported as messages per
+second (entities per second for lists) and MB per second, and written as JSON to PATH. With --baseline the
+throughput is also printed relative to an earlier result file.
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+
+from RemoteProcessClient import RemoteProcessClient
+from benchmarks.frames import SCALES, ByteSink, make_game, make_player_context
+from benchmarks.writer import make_moves
+
+
+def collect_cases(scale):
+    player_context = make_player_context(scale)
+    world = player_context.world
+    units = world.wizards + world.minions + world.buildings + world.trees
+
+    return [
+        ("statuses", [status for unit in units for status in unit.statuses]),
+        ("messages", [message for wizard in world.wizards for message in wizard.messages]),
+        ("players", world.players),
+        ("wizards", world.wizards),
+        ("minions", world.minions),
+        ("projectiles", world.projectiles),
+        ("bonuses", world.bonuses),
+        ("buildings", world.buildings),
+        ("trees", world.trees),
+        ("moves", make_moves(5)),
+        ("world", world),
+        ("player_context", player_context),
+        ("game", make_game())
+    ]
+
+
+def make_client():
+    return RemoteProcessClient(None, None, ByteSink())
+
+
+def load(client, data):
+    client.read_view.release()
+    client.read_buffer = bytearray(data)
+    client.read_view = memoryview(client.read_buffer)
+    client.read_limit = data.__len__()
+
+
+def measure(run, min_time, repeat):
+    iteration_count = 1
+    while True:
+        start = time.perf_counter()
+        run(iteration_count)
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        iteration_count *= 2
+
+    best_time = elapsed / iteration_count
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        run(iteration_count)
+        best_time = min(best_time, (time.perf_counter() - start) / iteration_count)
+
+    return best_time
+
+
+def benchmark_case(name, value, min_time, repeat):
+    write = getattr(RemoteProcessClient, "write_" + name)
+    read = getattr(RemoteProcessClient, "read_" + name)
+
+    encoder = make_client()
+    write(encoder, value)
+    data = bytes(encoder.write_buffer[:encoder.write_offset])
+
+    decoder = make_client()
+    load(decoder, data)
+
+    def decode(iteration_count):
+        for _ in range(iteration_count):
+            decoder.read_offset = 0
+            read(decoder)
+
+    def encode(iteration_count):
+        for _ in range(iteration_count):
+            encoder.write_offset = 0
+            write(encoder, value)
+
+    message_count = value.__len__() if isinstance(value, list) else 1
+    result = {"byte_count": data.__len__(), "message_count": message_count}
+
+    for direction, run in [("decode", decode), ("encode", encode)]:
+        seconds = measure(run, min_time, repeat)
+        result[direction] = {
+            "seconds": seconds,
+            "messages_per_second": message_count / seconds,
+            "megabytes_per_second": data.__len__() / seconds / 1e6
+        }
+
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scale", nargs="+", default=sorted(SCALES, key=lambda name: SCALES[name]),
+                        choices=sorted(SCALES))
+    parser.add_argument("--min-time", type=float, default=0.05)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", default="codec-benchmark.json")
+    parser.add_argument("--baseline")
+    args = parser.parse_args()
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            baseline = json.load(baseline_file)["results"]
+
+    results = {}
+    print("%-7s %-15s %8s %9s %14s %10s %14s %10s" % (
+        "scale", "entity", "count", "bytes", "decode msg/s", "MB/s", "encode msg/s", "MB/s"))
+
+    for scale in args.scale:
+        results[scale] = {}
+        for name, value in collect_cases(scale):
+            result = benchmark_case(name, value, args.min_time, args.repeat)
+            results[scale][name] = result
+
+            line = "%-7s %-15s %8d %9d %14.0f %10.1f %14.0f %10.1f" % (
+                scale, name, result["message_count"], result["byte_count"],
+                result["decode"]["messages_per_second"], result["decode"]["megabytes_per_second"],
+                result["encode"]["messages_per_second"], result["encode"]["megabytes_per_second"]
+            )
+            baseline_result = baseline.get(scale, {}).get(name) if baseline is not None else None
+            if baseline_result is not None:
+                line += "  decode x%.2f, encode x%.2f" % (
+                    baseline_result["decode"]["seconds"] / result["decode"]["seconds"],
+                    baseline_result["encode"]["seconds"] / result["encode"]["seconds"]
+                )
+            print(line)
+
+    with open(args.output, "w") as output_file:
+        json.dump({
+            "python": sys.version,
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "min_time": args.min_time,
+            "repeat": args.repeat,
+            "results": results
+        }, output_file, indent=2, sort_keys=True)
+    print("results written to %s" % args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""Upkeep and query time of the danger map versus rescanning the enemies, and how far the map overestimates.
+
+Usage: python -m benchmarks.danger [--scale NAME] [--ticks N] [--queries N] [--seed N]
+
+The world is a synthetic frame of the given scale, advanced tick by tick: wizards and minions step 3 units in a
+random direction they keep for a while, and the attack cooldowns of all units count down and restart. Every tick
+the danger map of the first wizard is brought up to date and queried at N random points, and the same points are
+answered by rescanning every enemy with the exact aims_me test. The map may only overestimate, so a threatened
+point it reports as safe is counted as a miss (there should be none); the share of points it reports as threatened
+while none of the enemies is in reach is reported as well.
+"""
+
+import argparse
+import contextlib
+import io
+import math
+import random
+import time
+
+from DangerMap import DangerMap
+from MyStrategy import AIM_COOLDOWN_TICKS, MyStrategy
+from benchmarks.frames import SCALES, make_game, make_player_context
+from model.Move import Move
+
+STEP = 3.0
+TURN_INTERVAL_TICKS = 50
+
+
+def advance(world, rnd, directions):
+    for unit in world.wizards + world.minions:
+        if rnd.randrange(TURN_INTERVAL_TICKS) == 0 or unit.id not in directions:
+            directions[unit.id] = rnd.uniform(-math.pi, math.pi)
+        unit.x = min(max(unit.x + STEP * math.cos(directions[unit.id]), 100.0), 3900.0)
+        unit.y = min(max(unit.y + STEP * math.sin(directions[unit.id]), 100.0), 3900.0)
+    for unit in world.wizards + world.minions + world.buildings:
+        if unit.remaining_action_cooldown_ticks > 0:
+            unit.remaining_action_cooldown_ticks -= 1
+        else:
+            unit.remaining_action_cooldown_ticks = getattr(unit, "cooldown_ticks", 30)
+
+
+def exact_damage(danger_map, threats, radius, x, y):
+    damage = 0
+    for unit, attack_distance, unit_damage, cooldown_ticks in threats:
+        if math.hypot(unit.x - x, unit.y - y) - radius <= attack_distance:
+            damage += danger_map.expected_damage(
+                unit_damage, cooldown_ticks, unit.remaining_action_cooldown_ticks)
+    return damage
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scale", default="late", choices=sorted(SCALES))
+    parser.add_argument("--ticks", type=int, default=300)
+    parser.add_argument("--queries", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    game = make_game()
+    player_context = make_player_context(args.scale, seed=args.seed)
+    world = player_context.world
+    me = player_context.wizards[0]
+    strategy = MyStrategy()
+    with contextlib.redirect_stdout(io.StringIO()):
+        strategy.initialize_tick(me, world, game, Move())
+    enemy_danger_map = DangerMap(game.map_size, game.wizard_radius, AIM_COOLDOWN_TICKS)
+
+    rnd = random.Random(args.seed)
+    directions = {}
+    update_time = 0.0
+    query_time = 0.0
+    rescan_time = 0.0
+    miss_count = 0
+    overestimate_count = 0
+    safe_count = 0
+
+    for _ in range(args.ticks):
+        advance(world, rnd, directions)
+        strategy.tick_context.end_tick()
+        points = [(rnd.uniform(0.0, game.map_size), rnd.uniform(0.0, game.map_size)) for _ in range(args.queries)]
+
+        start = time.perf_counter()
+        danger_map = enemy_danger_map.update(
+            [strategy.get_threat(unit) for unit in world.buildings if strategy.is_enemy(unit)],
+            [strategy.get_threat(unit) for unit in world.wizards + world.minions if strategy.is_enemy(unit)])
+        update_time += time.perf_counter() - start
+
+        start = time.perf_counter()
+        damages = [danger_map.expected_damage_at(x, y) for x, y in points]
+        query_time += time.perf_counter() - start
+
+        start = time.perf_counter()
+        threats = [strategy.get_threat(unit) for unit in strategy.living_units() if strategy.is_enemy(unit)]
+        exact_damages = [exact_damage(enemy_danger_map, threats, me.radius, x, y) for x, y in points]
+        rescan_time += time.perf_counter() - start
+
+        for damage, exact in zip(damages, exact_damages):
+            miss_count += damage < exact
+            safe_count += exact == 0
+            overestimate_count += (exact == 0) and (damage > 0)
+
+    print("ticks: %d, enemies: %d, queries per tick: %d" % (args.ticks, threats.__len__(), args.queries))
+    print("danger map: update %.1f us per tick, %.2f redraws (%.0f cells) per tick, query %.2f us" % (
+        update_time / args.ticks * 1e6, enemy_danger_map.redraw_count / args.ticks,
+        enemy_danger_map.redrawn_cell_count / args.ticks, query_time / (args.ticks * args.queries) * 1e6))
+    print("rescan: %.1f us per query" % (rescan_time / (args.ticks * args.queries) * 1e6))
+    print("misses: %d, safe points reported threatened: %d of %d (%.1f%%), aim horizon %d ticks" % (
+        miss_count, overestimate_count, safe_count, overestimate_count / max(safe_count, 1) * 100,
+        AIM_COOLDOWN_TICKS))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""Damage avoided by the projectile dodge and the time it takes to plan a move.
+
+Usage: python -m benchmarks.dodge [--trials N] [--projectiles N] [--seed N]
+
+A wizard stands in open field while enemy projectiles of random types are launched at it from 300 to 500 away in
+random directions, aimed within its radius of its centre and launched a few ticks apart. The wizard either stands
+still or every tick takes the move the dodge picks over standing still; projectiles move on and hit or fly out of
+range as they would in the game. The damage taken both ways is reported, as is the planning time per tick for a few
+numbers of projectiles in flight at once.
+"""
+
+import argparse
+import math
+import random
+import time
+
+from ProjectileDodge import ProjectileDodge
+from benchmarks.frames import make_game
+from model.Faction import Faction
+from model.Projectile import Projectile
+from model.ProjectileType import ProjectileType
+
+LAUNCH_INTERVAL_TICKS = 4
+PROJECTILE_COUNTS = [1, 10, 40, 100]
+
+
+class Target:
+    def __init__(self, x, y, angle, radius):
+        self.x = x
+        self.y = y
+        self.angle = angle
+        self.radius = radius
+
+
+def launch(game, rnd, target, projectile_id):
+    projectile_type = rnd.choice([
+        ProjectileType.MAGIC_MISSILE, ProjectileType.FROST_BOLT, ProjectileType.FIREBALL, ProjectileType.DART
+    ])
+    speed, radius = {
+        ProjectileType.MAGIC_MISSILE: (game.magic_missile_speed, game.magic_missile_radius),
+        ProjectileType.FROST_BOLT: (game.frost_bolt_speed, game.frost_bolt_radius),
+        ProjectileType.FIREBALL: (game.fireball_speed, game.fireball_radius),
+        ProjectileType.DART: (game.dart_speed, game.dart_radius)
+    }[projectile_type]
+    direction = rnd.uniform(-math.pi, math.pi)
+    distance = rnd.uniform(300.0, 500.0) if projectile_type != ProjectileType.DART else rnd.uniform(200.0, 300.0)
+    x = target.x + distance * math.cos(direction)
+    y = target.y + distance * math.sin(direction)
+    offset = rnd.uniform(-target.radius, target.radius)
+    aim_x = target.x - offset * math.sin(direction)
+    aim_y = target.y + offset * math.cos(direction)
+    angle = math.atan2(aim_y - y, aim_x - x)
+    return Projectile(projectile_id, x, y, speed * math.cos(angle), speed * math.sin(angle), angle,
+                      Faction.RENEGADES, radius, projectile_type, -1, -1)
+
+
+def trial(game, rnd, dodge, projectile_count, use_dodge):
+    target = Target(2000.0, 2000.0, rnd.uniform(-math.pi, math.pi), game.wizard_radius)
+    flights = {}
+    damage_taken = 0
+    tick = 0
+    launched_count = 0
+    while (launched_count < projectile_count) or flights:
+        if (launched_count < projectile_count) and (tick % LAUNCH_INTERVAL_TICKS == 0):
+            projectile = launch(game, rnd, target, launched_count)
+            flights[projectile.id] = (projectile, projectile.x, projectile.y)
+            launched_count += 1
+
+        speed, strafe_speed = 0.0, 0.0
+        if use_dodge:
+            moves = dodge.plan(target, [flight[0] for flight in flights.values()], [], 0.0, 0.0)
+            if moves is not None:
+                speed, strafe_speed = moves[0][0], moves[0][1]
+        target.x += speed * math.cos(target.angle) - strafe_speed * math.sin(target.angle)
+        target.y += speed * math.sin(target.angle) + strafe_speed * math.cos(target.angle)
+
+        for projectile_id, (projectile, start_x, start_y) in list(flights.items()):
+            projectile.x += projectile.speed_x
+            projectile.y += projectile.speed_y
+            hit_radius = dodge.hit_radius_by_type[projectile.type] + target.radius
+            if math.hypot(projectile.x - target.x, projectile.y - target.y) < hit_radius:
+                damage_taken += dodge.damage_by_type[projectile.type]
+                del flights[projectile_id]
+            elif math.hypot(projectile.x - start_x, projectile.y - start_y) > dodge.max_cast_range:
+                del flights[projectile_id]
+        tick += 1
+    return damage_taken
+
+
+def time_plan(game, rnd, dodge, projectile_count, repeats):
+    target = Target(2000.0, 2000.0, 0.0, game.wizard_radius)
+    projectiles = [launch(game, rnd, target, index) for index in range(projectile_count)]
+    dodge.plan(target, projectiles, [], 0.0, 0.0)
+    start = time.perf_counter()
+    for _ in range(repeats):
+        dodge.plan(target, projectiles, [], 0.0, 0.0)
+    return (time.perf_counter() - start) / repeats
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--trials", type=int, default=200)
+    parser.add_argument("--projectiles", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    game = make_game()
+    dodge = ProjectileDodge(game)
+    damages = []
+    for use_dodge in (False, True):
+        rnd = random.Random(args.seed)
+        damages.append(sum(trial(game, rnd, dodge, args.projectiles, use_dodge) for _ in range(args.trials)))
+    print("%d trials of %d projectiles: damage standing still %d, dodging %d (%.1f%% avoided)" % (
+        args.trials, args.projectiles, damages[0], damages[1], (1.0 - damages[1] / max(damages[0], 1)) * 100))
+
+    rnd = random.Random(args.seed)
+    for projectile_count in PROJECTILE_COUNTS:
+        print("plan with %3d projectiles in flight: %.1f us" % (
+            projectile_count, time_plan(game, rnd, dodge, projectile_count, 2000) * 1e6))
+
+
+if __name__ == "__main__":
+    main()
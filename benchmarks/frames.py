@@ -0,0 +1,526 @@
+import copy
+import math
+import random
+
+from RemoteProcessClient import RemoteProcessClient
+from ReplayClient import ReplayClient
+from model.ActionType import ActionType
+from model.Bonus import Bonus
+from model.BonusType import BonusType
+from model.Building import Building
+from model.BuildingType import BuildingType
+from model.Faction import Faction
+from model.Game import Game
+from model.Message import Message
+from model.Minion import Minion
+from model.MinionType import MinionType
+from model.Player import Player
+from model.PlayerContext import PlayerContext
+from model.Projectile import Projectile
+from model.ProjectileType import ProjectileType
+from model.Status import Status
+from model.StatusType import StatusType
+from model.Tree import Tree
+from model.Wizard import Wizard
+from model.World import World
+
+MAP_SIZE = 4000.0
+
+GAME_PARAMETERS = dict(
+    random_seed=0, tick_count=20000, map_size=MAP_SIZE, skills_enabled=True, raw_messages_enabled=True,
+    friendly_fire_damage_factor=0.0, building_damage_score_factor=0.25, building_elimination_score_factor=0.5,
+    minion_damage_score_factor=0.25, minion_elimination_score_factor=0.5, wizard_damage_score_factor=1.0,
+    wizard_elimination_score_factor=2.0, team_working_score_factor=0.2, victory_score=1000,
+    score_gain_range=600.0, raw_message_max_length=1024, raw_message_transmission_speed=0.5,
+    wizard_radius=35.0, wizard_cast_range=500.0, wizard_vision_range=600.0, wizard_forward_speed=4.0,
+    wizard_backward_speed=3.0, wizard_strafe_speed=3.0, wizard_base_life=100, wizard_life_growth_per_level=10,
+    wizard_base_mana=100, wizard_mana_growth_per_level=10, wizard_base_life_regeneration=0.05,
+    wizard_life_regeneration_growth_per_level=0.005, wizard_base_mana_regeneration=0.2,
+    wizard_mana_regeneration_growth_per_level=0.02, wizard_max_turn_angle=math.pi / 30.0,
+    wizard_max_resurrection_delay_ticks=2400, wizard_min_resurrection_delay_ticks=1200,
+    wizard_action_cooldown_ticks=30, staff_cooldown_ticks=60, magic_missile_cooldown_ticks=60,
+    frost_bolt_cooldown_ticks=90, fireball_cooldown_ticks=120, haste_cooldown_ticks=120,
+    shield_cooldown_ticks=120, magic_missile_manacost=12, frost_bolt_manacost=36, fireball_manacost=48,
+    haste_manacost=48, shield_manacost=48, staff_damage=12, staff_sector=math.pi / 6.0, staff_range=70.0,
+    level_up_xp_values=[50 * i * (i + 1) // 2 for i in range(1, 26)], minion_radius=25.0,
+    minion_vision_range=400.0, minion_speed=3.0, minion_max_turn_angle=math.pi / 30.0, minion_life=100,
+    faction_minion_appearance_interval_ticks=750, orc_woodcutter_action_cooldown_ticks=60,
+    orc_woodcutter_damage=12, orc_woodcutter_attack_sector=math.pi / 6.0, orc_woodcutter_attack_range=50.0,
+    fetish_blowdart_action_cooldown_ticks=30, fetish_blowdart_attack_range=300.0,
+    fetish_blowdart_attack_sector=math.pi / 6.0, bonus_radius=20.0, bonus_appearance_interval_ticks=2500,
+    bonus_score_amount=200, dart_radius=5.0, dart_speed=50.0, dart_direct_damage=6, magic_missile_radius=10.0,
+    magic_missile_speed=40.0, magic_missile_direct_damage=12, frost_bolt_radius=15.0, frost_bolt_speed=35.0,
+    frost_bolt_direct_damage=24, fireball_radius=20.0, fireball_speed=30.0,
+    fireball_explosion_max_damage_range=30.0, fireball_explosion_min_damage_range=100.0,
+    fireball_explosion_max_damage=24, fireball_explosion_min_damage=12, guardian_tower_radius=50.0,
+    guardian_tower_vision_range=600.0, guardian_tower_life=1000.0, guardian_tower_attack_range=600.0,
+    guardian_tower_damage=36, guardian_tower_cooldown_ticks=240, faction_base_radius=100.0,
+    faction_base_vision_range=800.0, faction_base_life=2000.0, faction_base_attack_range=800.0,
+    faction_base_damage=48, faction_base_cooldown_ticks=240, burning_duration_ticks=240,
+    burning_summary_damage=24, empowered_duration_ticks=2400, empowered_damage_factor=1.5,
+    frozen_duration_ticks=60, hastened_duration_ticks=2400, hastened_bonus_duration_factor=1.0 / 3.0,
+    hastened_movement_bonus_factor=0.3, hastened_rotation_bonus_factor=1.0, shielded_duration_ticks=2400,
+    shielded_bonus_duration_factor=1.0 / 3.0, shielded_direct_damage_absorption_factor=0.25,
+    aura_skill_range=500.0, range_bonus_per_skill_level=25.0, magical_damage_bonus_per_skill_level=1,
+    staff_damage_bonus_per_skill_level=3, movement_bonus_factor_per_skill_level=0.05,
+    magical_damage_absorption_per_skill_level=1
+)
+
+TOWER_POSITIONS = [
+    (50.0, 2693.2), (350.0, 1656.8), (902.6, 2768.1), (1688.0, 2630.0), (1370.7, 3650.0), (2312.1, 3950.0)
+]
+
+# Early game to stress frames: (minion count, tree count, projectile count).
+SCALES = {
+    "early": (6, 60, 2),
+    "mid": (40, 200, 12),
+    "late": (120, 400, 40),
+    "stress": (2000, 3000, 1000)
+}
+
+
+class ByteSink:
+    def __init__(self):
+        self.data = bytearray()
+
+    def sendall(self, data):
+        self.data += data
+
+    def close(self):
+        pass
+
+
+def make_game(**parameters):
+    game_parameters = dict(GAME_PARAMETERS)
+    game_parameters.update(parameters)
+    return Game(**game_parameters)
+
+
+def mirror(x, y, faction):
+    if faction == Faction.ACADEMY:
+        return x, y
+    return MAP_SIZE - x, MAP_SIZE - y
+
+
+def make_statuses(rnd, owner_id):
+    if rnd.random() > 0.2:
+        return []
+    return [Status(rnd.randint(1, 10 ** 6), rnd.choice([StatusType.BURNING, StatusType.FROZEN]), owner_id, 1,
+                   rnd.randint(1, 240))]
+
+
+def make_buildings(rnd):
+    buildings = []
+    unit_id = 1000
+    for faction in [Faction.ACADEMY, Faction.RENEGADES]:
+        x, y = mirror(400.0, MAP_SIZE - 400.0, faction)
+        buildings.append(Building(
+            unit_id, x, y, 0.0, 0.0, 0.0, faction, 100.0, 2000, 2000, [], BuildingType.FACTION_BASE, 800.0, 800.0,
+            48, 240, rnd.randint(0, 240)
+        ))
+        unit_id += 1
+        for tower_x, tower_y in TOWER_POSITIONS:
+            x, y = mirror(tower_x, tower_y, faction)
+            buildings.append(Building(
+                unit_id, x, y, 0.0, 0.0, 0.0, faction, 50.0, 1000, 1000, [], BuildingType.GUARDIAN_TOWER, 600.0,
+                600.0, 36, 240, rnd.randint(0, 240)
+            ))
+            unit_id += 1
+    return buildings
+
+
+def make_wizards(rnd, tick_index):
+    wizards = []
+    for wizard_id in range(1, 11):
+        faction = Faction.ACADEMY if wizard_id <= 5 else Faction.RENEGADES
+        level = min(25, tick_index // 800)
+        wizards.append(Wizard(
+            wizard_id, rnd.uniform(100.0, MAP_SIZE - 100.0), rnd.uniform(100.0, MAP_SIZE - 100.0),
+            rnd.uniform(-3.0, 3.0), rnd.uniform(-3.0, 3.0), rnd.uniform(-math.pi, math.pi), faction, 35.0,
+            rnd.randint(1, 100 + 10 * level), 100 + 10 * level, make_statuses(rnd, wizard_id), wizard_id,
+            wizard_id == 1, rnd.randint(0, 100 + 10 * level), 100 + 10 * level, 600.0, 500.0,
+            rnd.randint(0, 10000), level, list(range(level)), rnd.randint(0, 30),
+            [rnd.randint(0, 120) for _ in range(7)], wizard_id in [1, 6],
+            [Message(rnd.randint(0, 2), None, bytes(rnd.randint(0, 16)))] if wizard_id == 1 else []
+        ))
+    return wizards
+
+
+def make_minions(rnd, count):
+    minions = []
+    for minion_id in range(count):
+        faction = rnd.choice([Faction.ACADEMY, Faction.RENEGADES, Faction.NEUTRAL])
+        minion_type = rnd.choice([MinionType.ORC_WOODCUTTER, MinionType.FETISH_BLOWDART])
+        minions.append(Minion(
+            10000 + minion_id, rnd.uniform(0.0, MAP_SIZE), rnd.uniform(0.0, MAP_SIZE), rnd.uniform(-3.0, 3.0),
+            rnd.uniform(-3.0, 3.0), rnd.uniform(-math.pi, math.pi), faction, 25.0, rnd.randint(1, 100), 100,
+            make_statuses(rnd, 1), minion_type, 400.0, 12 if minion_type == MinionType.ORC_WOODCUTTER else 6,
+            60 if minion_type == MinionType.ORC_WOODCUTTER else 30, rnd.randint(0, 60)
+        ))
+    return minions
+
+
+def make_trees(rnd, count):
+    trees = []
+    for tree_id in range(count):
+        life = rnd.randint(1, 60)
+        trees.append(Tree(
+            100000 + tree_id, rnd.uniform(0.0, MAP_SIZE), rnd.uniform(0.0, MAP_SIZE), 0.0, 0.0, 0.0,
+            Faction.OTHER, rnd.uniform(20.0, 50.0), life, life, []
+        ))
+    return trees
+
+
+def make_projectiles(rnd, count):
+    projectiles = []
+    for projectile_id in range(count):
+        projectile_type = rnd.choice([
+            ProjectileType.MAGIC_MISSILE, ProjectileType.FROST_BOLT, ProjectileType.FIREBALL, ProjectileType.DART
+        ])
+        angle = rnd.uniform(-math.pi, math.pi)
+        projectiles.append(Projectile(
+            200000 + projectile_id, rnd.uniform(0.0, MAP_SIZE), rnd.uniform(0.0, MAP_SIZE), 40.0 * math.cos(angle),
+            40.0 * math.sin(angle), angle, rnd.choice([Faction.ACADEMY, Faction.RENEGADES]), 10.0,
+            projectile_type, rnd.randint(1, 10), rnd.randint(1, 10)
+        ))
+    return projectiles
+
+
+def make_bonuses(rnd):
+    return [
+        Bonus(300000, 1200.0, 1200.0, 0.0, 0.0, 0.0, Faction.OTHER, 20.0, rnd.choice([
+            BonusType.EMPOWER, BonusType.HASTE, BonusType.SHIELD
+        ])),
+        Bonus(300001, 2800.0, 2800.0, 0.0, 0.0, 0.0, Faction.OTHER, 20.0, BonusType.HASTE)
+    ]
+
+
+def make_player_context(scale="mid", tick_index=5000, seed=0):
+    minion_count, tree_count, projectile_count = SCALES[scale]
+    rnd = random.Random(seed)
+    players = [
+        Player(1, True, "MyStrategy", False, rnd.randint(0, 5000), Faction.ACADEMY),
+        Player(2, False, "Opponent", False, rnd.randint(0, 5000), Faction.RENEGADES)
+    ]
+    wizards = make_wizards(rnd, tick_index)
+    world = World(
+        tick_index, 20000, MAP_SIZE, MAP_SIZE, players, wizards, make_minions(rnd, minion_count),
+        make_projectiles(rnd, projectile_count), make_bonuses(rnd), make_buildings(rnd),
+        make_trees(rnd, tree_count)
+    )
+    return PlayerContext([wizard for wizard in wizards if wizard.me], world)
+
+
+def make_encoder():
+    return RemoteProcessClient(None, None, ByteSink())
+
+
+def encode(write, value):
+    encoder = make_encoder()
+    write(encoder, value)
+    encoder.flush()
+    return bytes(encoder.socket.data)
+
+
+def encode_team_size_message(team_size):
+    encoder = make_encoder()
+    encoder.write_enum(RemoteProcessClient.MessageType.TEAM_SIZE)
+    encoder.write_int(team_size)
+    encoder.flush()
+    return bytes(encoder.socket.data)
+
+
+def encode_game_context_message(game):
+    encoder = make_encoder()
+    encoder.write_enum(RemoteProcessClient.MessageType.GAME_CONTEXT)
+    encoder.write_game(game)
+    encoder.flush()
+    return bytes(encoder.socket.data)
+
+
+def encode_player_context_message(player_context):
+    encoder = make_encoder()
+    encoder.write_enum(RemoteProcessClient.MessageType.PLAYER_CONTEXT)
+    encoder.write_player_context(player_context)
+    encoder.flush()
+    return bytes(encoder.socket.data)
+
+
+class Simulation:
+    # Plays a synthetic world forward one tick at a time, so that strategies moving through it see their decisions
+    # play out. The wizards of the academy that were handed a move turn, walk and strafe as it says, within the
+    # limits of the game, and stop short of trees and buildings; their staff and spells hit the first unit in reach
+    # in the direction they attack. Every other wizard and minion wanders in a direction it keeps for a while. Units
+    # of both factions attack the closest enemy in reach whenever their cooldown is over, units at zero life die
+    # (wizards come back at their base with full life), statuses run out, cooldowns count down, mana and life
+    # regenerate and a wave of minions leaves each base every faction_minion_appearance_interval_ticks.
+    #
+    # Every tick is a new world of copied units, as the client decodes it; the trees are the same list as long as
+    # none of them was hit, as when the server sends -1 for them.
+    STEP = 3.0
+    TURN_INTERVAL_TICKS = 50
+    WAVE_SIZE = 3
+    SPELL_SECTOR = 0.15
+
+    SPELL_DAMAGE_BY_ACTION = {
+        ActionType.MAGIC_MISSILE: ("magic_missile_direct_damage", "magic_missile_cooldown_ticks",
+                                   "magic_missile_manacost"),
+        ActionType.FROST_BOLT: ("frost_bolt_direct_damage", "frost_bolt_cooldown_ticks", "frost_bolt_manacost"),
+        ActionType.FIREBALL: ("fireball_explosion_max_damage", "fireball_cooldown_ticks", "fireball_manacost"),
+    }
+
+    def __init__(self, scale="late", seed=0):
+        self.game = make_game()
+        self.rnd = random.Random(seed)
+        player_context = make_player_context(scale, tick_index=0, seed=seed)
+        self.world = player_context.world
+        # Trees don't grow inside buildings on the map of the game.
+        self.world.trees = [tree for tree in self.world.trees if not any(
+            math.hypot(tree.x - building.x, tree.y - building.y) < tree.radius + building.radius
+            for building in self.world.buildings
+        )]
+        self.trees = None
+        self.directions = {}
+        self.moves_by_wizard_id = {}
+        self.next_minion_id = 10000 + self.world.minions.__len__()
+        self.death_count = 0
+
+    def base_position(self, faction):
+        return mirror(400.0, MAP_SIZE - 400.0, faction)
+
+    def player_contexts(self, ticks):
+        # The moves handed to move while a player context is out are applied before the next one is made.
+        for _ in range(ticks):
+            world = self.world
+            if self.trees is None:
+                self.trees = [copy.copy(tree) for tree in world.trees]
+            snapshot = World(
+                world.tick_index, world.tick_count, world.width, world.height, world.players,
+                [copy.copy(wizard) for wizard in world.wizards], [copy.copy(minion) for minion in world.minions],
+                [copy.copy(projectile) for projectile in world.projectiles], list(world.bonuses),
+                [copy.copy(building) for building in world.buildings], self.trees
+            )
+            yield PlayerContext([wizard for wizard in snapshot.wizards if wizard.me], snapshot)
+            self.step()
+
+    def move(self, wizard_id, move):
+        self.moves_by_wizard_id[wizard_id] = move
+
+    def step(self):
+        world = self.world
+        game = self.game
+        obstacles = world.trees + world.buildings
+        for wizard in world.wizards:
+            move = self.moves_by_wizard_id.get(wizard.id)
+            if move is None or wizard.faction != Faction.ACADEMY:
+                self.wander(wizard)
+            else:
+                self.apply_move(wizard, move, obstacles)
+        for minion in world.minions:
+            self.wander(minion)
+        for projectile in world.projectiles:
+            projectile.x += projectile.speed_x
+            projectile.y += projectile.speed_y
+            if not (0.0 <= projectile.x <= MAP_SIZE and 0.0 <= projectile.y <= MAP_SIZE):
+                projectile.x = self.rnd.uniform(0.0, MAP_SIZE)
+                projectile.y = self.rnd.uniform(0.0, MAP_SIZE)
+
+        self.attack()
+        self.moves_by_wizard_id.clear()
+
+        for unit in world.wizards + world.minions + world.buildings:
+            if unit.remaining_action_cooldown_ticks > 0:
+                unit.remaining_action_cooldown_ticks -= 1
+            if unit.statuses:
+                for status in unit.statuses:
+                    status.remaining_duration_ticks -= 1
+                unit.statuses = [status for status in unit.statuses if status.remaining_duration_ticks > 0]
+        for wizard in world.wizards:
+            wizard.remaining_cooldown_ticks_by_action = [
+                max(ticks - 1, 0) for ticks in wizard.remaining_cooldown_ticks_by_action
+            ]
+            if world.tick_index % 5 == 0:
+                wizard.mana = min(wizard.mana + 1, wizard.max_mana)
+            if world.tick_index % 20 == 0:
+                wizard.life = min(wizard.life + 1, wizard.max_life)
+
+        self.remove_dead()
+        world.tick_index += 1
+        if world.tick_index % game.faction_minion_appearance_interval_ticks == 0:
+            self.spawn_wave()
+
+    def wander(self, unit):
+        if self.rnd.randrange(Simulation.TURN_INTERVAL_TICKS) == 0 or unit.id not in self.directions:
+            self.directions[unit.id] = self.rnd.uniform(-math.pi, math.pi)
+        direction = self.directions[unit.id]
+        unit.angle = direction
+        unit.speed_x = Simulation.STEP * math.cos(direction)
+        unit.speed_y = Simulation.STEP * math.sin(direction)
+        unit.x = min(max(unit.x + unit.speed_x, 100.0), MAP_SIZE - 100.0)
+        unit.y = min(max(unit.y + unit.speed_y, 100.0), MAP_SIZE - 100.0)
+
+    def apply_move(self, wizard, move, obstacles):
+        game = self.game
+        turn = min(max(move.turn, -game.wizard_max_turn_angle), game.wizard_max_turn_angle)
+        speed = min(max(move.speed, -game.wizard_backward_speed), game.wizard_forward_speed)
+        strafe_speed = min(max(move.strafe_speed, -game.wizard_strafe_speed), game.wizard_strafe_speed)
+        angle = wizard.angle
+        speed_x = speed * math.cos(angle) - strafe_speed * math.sin(angle)
+        speed_y = speed * math.sin(angle) + strafe_speed * math.cos(angle)
+        # A wizard walking into an obstacle slides along it, or stops when it can't.
+        for x, y in [(wizard.x + speed_x, wizard.y + speed_y), (wizard.x + speed_x, wizard.y),
+                     (wizard.x, wizard.y + speed_y), (wizard.x, wizard.y)]:
+            x = min(max(x, wizard.radius), MAP_SIZE - wizard.radius)
+            y = min(max(y, wizard.radius), MAP_SIZE - wizard.radius)
+            if not any(math.hypot(obstacle.x - x, obstacle.y - y) < obstacle.radius + wizard.radius
+                       for obstacle in obstacles):
+                break
+        wizard.speed_x = x - wizard.x
+        wizard.speed_y = y - wizard.y
+        wizard.x = x
+        wizard.y = y
+        wizard.angle = (angle + turn + math.pi) % (2.0 * math.pi) - math.pi
+
+        action = move.action
+        if action is None or action == ActionType.NONE or wizard.remaining_action_cooldown_ticks > 0:
+            return
+        if wizard.remaining_cooldown_ticks_by_action[action] > 0:
+            return
+        if action == ActionType.STAFF:
+            target = self.first_in_sector(wizard, angle, game.staff_sector / 2.0, game.staff_range)
+            damage = game.staff_damage
+            cooldown_ticks = game.staff_cooldown_ticks
+        elif action in Simulation.SPELL_DAMAGE_BY_ACTION:
+            damage_name, cooldown_name, manacost_name = Simulation.SPELL_DAMAGE_BY_ACTION[action]
+            if wizard.mana < getattr(game, manacost_name):
+                return
+            wizard.mana -= getattr(game, manacost_name)
+            target = self.first_in_sector(wizard, angle + move.cast_angle, Simulation.SPELL_SECTOR, wizard.cast_range)
+            damage = getattr(game, damage_name)
+            cooldown_ticks = getattr(game, cooldown_name)
+        else:
+            return
+        wizard.remaining_action_cooldown_ticks = game.wizard_action_cooldown_ticks
+        wizard.remaining_cooldown_ticks_by_action[action] = cooldown_ticks
+        if target is not None:
+            self.hit(target, damage)
+
+    def first_in_sector(self, wizard, direction, half_sector, reach):
+        world = self.world
+        closest = None
+        closest_distance = reach
+        for unit in world.wizards + world.minions + world.buildings + world.trees:
+            if unit.faction == wizard.faction:
+                continue
+            distance = math.hypot(unit.x - wizard.x, unit.y - wizard.y) - unit.radius
+            if distance > closest_distance:
+                continue
+            angle = math.atan2(unit.y - wizard.y, unit.x - wizard.x) - direction
+            angle = (angle + math.pi) % (2.0 * math.pi) - math.pi
+            if abs(angle) <= half_sector + math.asin(min(unit.radius / max(distance + unit.radius, 1.0), 1.0)):
+                closest = unit
+                closest_distance = distance
+        return closest
+
+    def attack(self):
+        world = self.world
+        fighters = [unit for unit in world.wizards + world.minions + world.buildings
+                    if unit.faction in (Faction.ACADEMY, Faction.RENEGADES)]
+        for attacker in fighters:
+            if attacker.remaining_action_cooldown_ticks > 0 or attacker.life <= 0:
+                continue
+            if type(attacker) is Wizard:
+                if attacker.id in self.moves_by_wizard_id:
+                    continue
+                reach, damage, cooldown_ticks = attacker.cast_range, 12, 60
+            elif type(attacker) is Minion:
+                if attacker.type == MinionType.ORC_WOODCUTTER:
+                    reach = self.game.orc_woodcutter_attack_range
+                else:
+                    reach = self.game.fetish_blowdart_attack_range
+                damage, cooldown_ticks = attacker.damage, attacker.cooldown_ticks
+            else:
+                reach, damage, cooldown_ticks = attacker.attack_range, attacker.damage, attacker.cooldown_ticks
+            target = None
+            target_distance = reach
+            for unit in fighters:
+                if unit.faction == attacker.faction or unit.life <= 0:
+                    continue
+                distance = math.hypot(unit.x - attacker.x, unit.y - attacker.y) - unit.radius
+                if distance <= target_distance:
+                    target = unit
+                    target_distance = distance
+            if target is not None:
+                self.hit(target, damage)
+                attacker.remaining_action_cooldown_ticks = cooldown_ticks
+
+    def hit(self, unit, damage):
+        unit.life -= damage
+        if type(unit) is Tree:
+            # The trees the strategies got are the ones hit; from now on they get a new list.
+            self.trees = None
+
+    def remove_dead(self):
+        world = self.world
+        for wizard in world.wizards:
+            if wizard.life <= 0:
+                self.death_count += 1
+                wizard.x, wizard.y = self.base_position(wizard.faction)
+                wizard.life = wizard.max_life
+                wizard.statuses = []
+        minion_count = world.minions.__len__()
+        world.minions = [minion for minion in world.minions if minion.life > 0]
+        self.death_count += minion_count - world.minions.__len__()
+        if any(tree.life <= 0 for tree in world.trees):
+            world.trees = [tree for tree in world.trees if tree.life > 0]
+            self.trees = None
+        world.buildings = [building for building in world.buildings if building.life > 0]
+
+    def spawn_wave(self):
+        game = self.game
+        for faction in [Faction.ACADEMY, Faction.RENEGADES]:
+            base_x, base_y = self.base_position(faction)
+            for _ in range(Simulation.WAVE_SIZE):
+                minion_type = self.rnd.choice([MinionType.ORC_WOODCUTTER, MinionType.FETISH_BLOWDART])
+                woodcutter = minion_type == MinionType.ORC_WOODCUTTER
+                self.world.minions.append(Minion(
+                    self.next_minion_id, base_x + self.rnd.uniform(-150.0, 150.0),
+                    base_y + self.rnd.uniform(-150.0, 150.0), 0.0, 0.0, 0.0, faction, game.minion_radius,
+                    game.minion_life, game.minion_life, [], minion_type, game.minion_vision_range,
+                    game.orc_woodcutter_damage if woodcutter else game.dart_direct_damage,
+                    game.orc_woodcutter_action_cooldown_ticks if woodcutter
+                    else game.fetish_blowdart_action_cooldown_ticks, 0
+                ))
+                self.next_minion_id += 1
+
+
+class CapturedFrames:
+    # The PLAYER_CONTEXT messages of a capture recorded with `Runner.py host port token PATH`, as they were played;
+    # the moves of the strategies don't change them.
+    def __init__(self, capture_path):
+        client = ReplayClient(capture_path)
+        self.recorded_player_contexts = []
+        try:
+            client.read_team_size_message()
+            self.game = client.read_game_context_message()
+            while True:
+                player_context = client.read_player_context_message()
+                if player_context is None:
+                    break
+                self.recorded_player_contexts.append(player_context)
+        except IOError:
+            pass
+        finally:
+            client.close()
+
+    def player_contexts(self, ticks):
+        return iter(self.recorded_player_contexts[:ticks])
+
+    def move(self, wizard_id, move):
+        pass
+
+
+def make_frames(capture_path, scale, seed=0):
+    if capture_path is None:
+        return Simulation(scale, seed)
+    return CapturedFrames(capture_path)
@@ -0,0 +1,113 @@
+"""Agreement and lookup time of the lane field versus the exact per-segment lane projection of MyStrategy.
+
+Usage: python -m benchmarks.lanes [--cell-size D] [--points N] [--seed N] [--nearest]
+
+The lane field is built from the waypoints MyStrategy sets up for a synthetic game. For N random points on the
+map, and for the units of the synthetic frames, the distance to every lane, the distance along every lane and the
+closest lane within 400 (get_unit_lane) are computed both ways. The lane field leaves out the cells where the
+distance along a lane jumps, MyStrategy computes those exactly, so only the answered queries are compared and their
+share is reported. --nearest reads the closest node instead of interpolating between the four around the point. The
+agreement the strategy relies on at the default cell size is checked by tests/test_lane_field.py.
+"""
+
+import argparse
+import contextlib
+import io
+import random
+import time
+
+from LaneField import LaneField
+from MyStrategy import MyStrategy, Point2D
+from benchmarks.frames import SCALES, make_game, make_player_context
+from model.LaneType import LaneType
+from model.Move import Move
+
+LANES = [LaneType.TOP, LaneType.MIDDLE, LaneType.BOTTOM]
+
+
+def make_strategy(game):
+    player_context = make_player_context("early")
+    strategy = MyStrategy()
+    with contextlib.redirect_stdout(io.StringIO()):
+        strategy.initialize_strategy(player_context.wizards[0], game, Move())
+    return strategy
+
+
+def collect_points(map_size, point_count, seed):
+    rnd = random.Random(seed)
+    points = [Point2D(rnd.uniform(0.0, map_size), rnd.uniform(0.0, map_size)) for _ in range(point_count)]
+    for scale in sorted(SCALES):
+        world = make_player_context(scale, seed=seed).world
+        points.extend(Point2D(unit.x, unit.y) for unit in world.wizards + world.minions + world.buildings)
+    return points
+
+
+def percentile(sorted_values, fraction):
+    return sorted_values[min(sorted_values.__len__() - 1, int(sorted_values.__len__() * fraction))]
+
+
+def measure_seconds(function, points):
+    start = time.perf_counter()
+    for point in points:
+        function(point)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--cell-size", type=float, default=LaneField.CELL_SIZE)
+    parser.add_argument("--points", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--nearest", action="store_true")
+    args = parser.parse_args()
+
+    game = make_game()
+    strategy = make_strategy(game)
+    start = time.perf_counter()
+    lane_field = LaneField(strategy.waypoints_by_lane, LANES, game.map_size, args.cell_size, not args.nearest)
+    build_time = time.perf_counter() - start
+    strategy.lane_field = None
+
+    points = collect_points(game.map_size, args.points, args.seed)
+    errors_by_name = {"distance to lane": [], "distance on lane": []}
+    same_lane_count = 0
+    answered_count = 0
+
+    for point in points:
+        for lane in LANES:
+            errors_by_name["distance to lane"].append(abs(
+                lane_field.distance_to_lane(lane, point.x, point.y) - strategy.get_unit_distance_to_lane(lane, point)))
+            distance_on_lane = lane_field.distance_on_lane(lane, point.x, point.y)
+            if distance_on_lane is not None:
+                answered_count += 1
+                errors_by_name["distance on lane"].append(abs(
+                    distance_on_lane - strategy.get_unit_distance_on_lane(lane, point)))
+
+        exact_lane = strategy.get_unit_lane(point)
+        lane, distance = lane_field.nearest_lane(point.x, point.y)
+        same_lane_count += (lane if distance <= 400 else None) == exact_lane
+
+    node_count = lane_field.node_count
+    print("lane field: %dx%d nodes of %.1f, %s, built in %.1f ms" % (
+        node_count, node_count, args.cell_size, "nearest node" if args.nearest else "bilinear", build_time * 1e3))
+
+    for name, errors in errors_by_name.items():
+        errors.sort()
+        print("%-18s mean error %.3f, median %.3f, p99 %.3f, max %.3f" % (
+            name, sum(errors) / errors.__len__(), percentile(errors, 0.5), percentile(errors, 0.99), errors[-1]))
+
+    print("distance on lane answered by the lane field for %.2f%% of the queries, the rest fall back" % (
+        answered_count / (points.__len__() * LANES.__len__()) * 100))
+
+    print("same lane: %d of %d points (%.2f%%)" % (
+        same_lane_count, points.__len__(), same_lane_count / points.__len__() * 100))
+
+    exact_time = measure_seconds(lambda point: strategy.get_position(point), points)
+    strategy.lane_field = lane_field
+    field_time = measure_seconds(lambda point: strategy.get_position(point), points)
+    print("get_position: exact %.2f us, lane field %.2f us per point" % (
+        exact_time / points.__len__() * 1e6, field_time / points.__len__() * 1e6))
+
+
+if __name__ == "__main__":
+    main()
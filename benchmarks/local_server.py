@@ -0,0 +1,149 @@
+"""Local stand-in for the game server: full round-trip tick latency of an unmodified Runner over TCP.
+
+Usage: python -m benchmarks.local_server [--capture PATH] [--scale NAME] [--ticks N] [--distinct-frames N]
+                                         [--port N] [--no-spawn]
+
+The server speaks the real handshake (token, protocol version, TEAM_SIZE, GAME_CONTEXT), then sends one
+PLAYER_CONTEXT per tick and waits for the MOVE answer before the next one, and finishes with GAME_OVER.
+Worlds are either synthetic frames of the given scale or the messages of a capture recorded with
+`Runner.py host port token PATH`. Unless --no-spawn is given, `Runner.py 127.0.0.1 PORT TOKEN` is started as a
+subprocess with its output discarded; otherwise connect any client to the printed port.
+"""
+
+import argparse
+import os
+import socket
+import subprocess
+import sys
+import time
+
+from RemoteProcessClient import RemoteProcessClient
+from TrafficCapture import TrafficCapture
+from benchmarks.frames import (
+    SCALES, encode_game_context_message, encode_player_context_message, encode_team_size_message, make_game,
+    make_player_context
+)
+
+TOKEN = "0000000000000000"
+REPOSITORY_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def make_synthetic_messages(scale, distinct_frame_count):
+    player_contexts = [
+        make_player_context(scale, tick_index=5000 + index, seed=index) for index in range(distinct_frame_count)
+    ]
+    return (
+        encode_team_size_message(player_contexts[0].wizards.__len__()),
+        encode_game_context_message(make_game()),
+        [encode_player_context_message(player_context) for player_context in player_contexts]
+    )
+
+
+def read_captured_messages(path):
+    with open(path, "rb") as capture_file:
+        data = capture_file.read()
+
+    offsets = TrafficCapture.read_index(path, RemoteProcessClient.SWAP_ARRAY_BYTES) + [data.__len__()]
+    messages_by_type = {}
+
+    for start, end in zip(offsets, offsets[1:]):
+        if start < end:
+            messages_by_type.setdefault(data[start], []).append(data[start:end])
+
+    return (
+        messages_by_type[RemoteProcessClient.MessageType.TEAM_SIZE][0],
+        messages_by_type[RemoteProcessClient.MessageType.GAME_CONTEXT][0],
+        messages_by_type[RemoteProcessClient.MessageType.PLAYER_CONTEXT]
+    )
+
+
+def serve(listener, team_size_message, game_context_message, player_context_messages, ticks):
+    connection, _ = listener.accept()
+    connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, True)
+    client = RemoteProcessClient(None, None, connection)
+
+    try:
+        RemoteProcessClient.ensure_message_type(
+            client.read_enum(RemoteProcessClient.MessageType), RemoteProcessClient.MessageType.AUTHENTICATION_TOKEN
+        )
+        client.read_string()
+        RemoteProcessClient.ensure_message_type(
+            client.read_enum(RemoteProcessClient.MessageType), RemoteProcessClient.MessageType.PROTOCOL_VERSION
+        )
+        client.read_int()
+
+        connection.sendall(team_size_message)
+        connection.sendall(game_context_message)
+
+        tick_times = []
+        for tick in range(ticks):
+            start = time.perf_counter()
+            connection.sendall(player_context_messages[tick % player_context_messages.__len__()])
+            RemoteProcessClient.ensure_message_type(
+                client.read_enum(RemoteProcessClient.MessageType), RemoteProcessClient.MessageType.MOVE
+            )
+            client.read_moves()
+            tick_times.append(time.perf_counter() - start)
+
+        client.write_enum(RemoteProcessClient.MessageType.GAME_OVER)
+        client.flush()
+        return tick_times
+    finally:
+        client.close()
+
+
+def percentile(sorted_values, fraction):
+    return sorted_values[min(sorted_values.__len__() - 1, int(sorted_values.__len__() * fraction))]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--capture")
+    parser.add_argument("--scale", default="mid", choices=sorted(SCALES))
+    parser.add_argument("--ticks", type=int, default=1000)
+    parser.add_argument("--distinct-frames", type=int, default=20)
+    parser.add_argument("--port", type=int, default=0)
+    parser.add_argument("--no-spawn", action="store_true")
+    args = parser.parse_args()
+
+    if args.capture:
+        team_size_message, game_context_message, player_context_messages = read_captured_messages(args.capture)
+        ticks = min(args.ticks, player_context_messages.__len__())
+    else:
+        team_size_message, game_context_message, player_context_messages = make_synthetic_messages(
+            args.scale, args.distinct_frames
+        )
+        ticks = args.ticks
+
+    listener = socket.socket()
+    listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, True)
+    listener.bind(("127.0.0.1", args.port))
+    listener.listen(1)
+    port = listener.getsockname()[1]
+
+    runner = None
+    if args.no_spawn:
+        print("listening on 127.0.0.1:%d" % port)
+    else:
+        runner = subprocess.Popen(
+            [sys.executable, "Runner.py", "127.0.0.1", str(port), TOKEN], cwd=REPOSITORY_DIRECTORY,
+            stdout=subprocess.DEVNULL
+        )
+
+    try:
+        tick_times = serve(listener, team_size_message, game_context_message, player_context_messages, ticks)
+    finally:
+        listener.close()
+        if runner is not None:
+            runner.wait()
+
+    tick_times.sort()
+    print("player context: %d bytes on average, ticks: %d" % (
+        sum(message.__len__() for message in player_context_messages) // player_context_messages.__len__(), ticks))
+    print("round trip per tick: median %.1f us, p90 %.1f us, p99 %.1f us, max %.1f us" % (
+        percentile(tick_times, 0.5) * 1e6, percentile(tick_times, 0.9) * 1e6, percentile(tick_times, 0.99) * 1e6,
+        tick_times[-1] * 1e6))
+
+
+if __name__ == "__main__":
+    main()
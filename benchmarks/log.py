@@ -0,0 +1,124 @@
+"""Move time with the strategy log at every level, against printing every message as it is made.
+
+Usage: python -m benchmarks.log [--capture PATH] [--scale NAME] [--ticks N] [--seed N] [--calls N]
+
+Worlds come from a capture or from a synthetic world played forward with the moves, as for benchmarks.strategy, and
+every wizard moves through N ticks of them once for every way of logging, each time from the same world: printing each
+message as soon as it is made, as the strategy did before it had a log, and the log at off, info and debug level,
+writing lines to standard output or JSON lines to a file. Standard output is redirected to a file in a temporary
+directory. Reported are the move time, the time the log takes to flush once a tick, and the lines and bytes written. The
+strategy only logs a few lines a tick, so last the cost of a single message about a unit is measured over N calls for
+every way of logging, flushing every 50 calls: the time spent in the call, on the tick path, and the time spent in the
+flush.
+"""
+
+import argparse
+import contextlib
+import os
+import tempfile
+import time
+
+from MyStrategy import MyStrategy
+from StrategyLog import StrategyLog
+from benchmarks.frames import SCALES, make_frames
+from benchmarks.strategy import percentile
+from model.Move import Move
+
+
+class PrintingStrategyLog(StrategyLog):
+    # Formats and prints every message as it is made, as the print calls it replaced did.
+    def add(self, tick, level, message, args):
+        self.record_count += 1
+        text = self.format(message, args)
+        if tick is None:
+            print(text)
+        else:
+            print(tick, text)
+
+
+def run_moves(frames, ticks, log, output_path):
+    strategies = {}
+    move_times = []
+    flush_times = []
+    with open(output_path, "w") as output, contextlib.redirect_stdout(output):
+        for player_context in frames.player_contexts(ticks):
+            for wizard in player_context.wizards:
+                strategy = strategies.get(wizard.id)
+                if strategy is None:
+                    strategy = strategies[wizard.id] = MyStrategy(log=log)
+                move = Move()
+                start = time.perf_counter()
+                strategy.move(wizard, player_context.world, frames.game, move)
+                move_times.append(time.perf_counter() - start)
+                frames.move(wizard.id, move)
+            start = time.perf_counter()
+            log.flush()
+            flush_times.append(time.perf_counter() - start)
+        log.close()
+    move_times.sort()
+    return move_times, flush_times
+
+
+def time_calls(log, unit, calls):
+    call_time = 0.0
+    flush_time = 0.0
+    for tick in range(0, calls, 50):
+        start = time.perf_counter()
+        for _ in range(50):
+            log.debug(tick, "MISSILE for %s", unit)
+        middle = time.perf_counter()
+        log.flush()
+        call_time += middle - start
+        flush_time += time.perf_counter() - middle
+    log.close()
+    return call_time / calls, flush_time / calls
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--capture")
+    parser.add_argument("--scale", default="late", choices=sorted(SCALES))
+    parser.add_argument("--ticks", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--calls", type=int, default=100000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        stdout_path = os.path.join(directory, "stdout.txt")
+        json_lines_path = os.path.join(directory, "log.jsonl")
+        runs = [
+            ("print", PrintingStrategyLog(StrategyLog.DEBUG), stdout_path),
+            ("off", StrategyLog(StrategyLog.OFF), stdout_path),
+            ("info", StrategyLog(StrategyLog.INFO), stdout_path),
+            ("debug", StrategyLog(StrategyLog.DEBUG), stdout_path),
+            ("debug jsonl", StrategyLog(StrategyLog.DEBUG, json_lines_path), stdout_path),
+        ]
+        for name, log, output_path in runs:
+            if os.path.exists(json_lines_path):
+                os.remove(json_lines_path)
+            move_times, flush_times = run_moves(
+                make_frames(args.capture, args.scale, args.seed), args.ticks, log, output_path)
+            written_path = json_lines_path if log.json_lines else output_path
+            print("%-11s move mean %.1f us, median %.1f us, p99 %.1f us; flush %.1f us per tick; "
+                  "%d lines, %d bytes" % (
+                      name, sum(move_times) / move_times.__len__() * 1e6, percentile(move_times, 0.5) * 1e6,
+                      percentile(move_times, 0.99) * 1e6, sum(flush_times) / flush_times.__len__() * 1e6,
+                      log.record_count, os.path.getsize(written_path)))
+
+        frames = make_frames(args.capture, args.scale, args.seed)
+        player_context = next(frames.player_contexts(1))
+        strategy = MyStrategy(log=StrategyLog(StrategyLog.OFF))
+        strategy.move(player_context.wizards[0], player_context.world, frames.game, Move())
+        unit = player_context.world.wizards[-1]
+        for name, log, output_path in runs:
+            if os.path.exists(json_lines_path):
+                os.remove(json_lines_path)
+            log.describe = strategy.describe_log_argument
+            with open(output_path, "w") as output, contextlib.redirect_stdout(output):
+                call_time, flush_time = time_calls(log, unit, args.calls)
+            print("%-11s %.2f us per message in the call, %.2f us in the flush" % (
+                name, call_time * 1e6, flush_time * 1e6))
+
+
+if __name__ == "__main__":
+    main()
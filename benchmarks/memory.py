@@ -0,0 +1,147 @@
+"""Memory per unit and attribute access speed of the slotted model classes versus plain __dict__ classes.
+
+Usage: python -m benchmarks.memory [--capture PATH] [--scale NAME] [--ticks N] [--repeat N]
+
+Units are taken from the PLAYER_CONTEXT messages of a capture recorded with `Runner.py host port token PATH`
+(the first N ticks), or from a synthetic frame of the given scale. Each unit is rebuilt once as the slotted
+model class and once as an equivalent class that keeps its attributes in a per-instance __dict__, sharing the
+same attribute values, so the numbers compare only the instance layout. Access speed is the best of N loops
+reading x, y and radius (id, type and remaining_duration_ticks for statuses).
+"""
+
+import argparse
+import inspect
+import time
+import tracemalloc
+
+from MyStrategy import Point2D
+from ReplayClient import ReplayClient
+from benchmarks.frames import SCALES, make_player_context
+from model.Bonus import Bonus
+from model.Building import Building
+from model.Minion import Minion
+from model.Projectile import Projectile
+from model.Status import Status
+from model.Tree import Tree
+from model.Wizard import Wizard
+
+MODEL_CLASSES = [Wizard, Minion, Building, Tree, Projectile, Bonus, Status, Point2D]
+
+ACCESSED_ATTRIBUTE_NAMES = ["x", "y", "radius"]
+ACCESSED_STATUS_ATTRIBUTE_NAMES = ["id", "type", "remaining_duration_ticks"]
+
+
+def attribute_names(model_class):
+    return [name for name in inspect.signature(model_class.__init__).parameters if name != "self"]
+
+
+def make_dict_class(model_class):
+    # The model constructors call their base class constructors explicitly, so they work on any object.
+    return type("Dict" + model_class.__name__, (), {"__init__": model_class.__init__})
+
+
+def make_access_loop(names):
+    source = "def access(instances):\n    for instance in instances:\n%s\n" % "\n".join(
+        "        instance.%s" % name for name in names
+    )
+    namespace = {}
+    exec(source, namespace)
+    return namespace["access"]
+
+
+def collect_worlds(capture_path, scale, ticks):
+    if capture_path is None:
+        return [make_player_context(scale).world]
+
+    client = ReplayClient(capture_path)
+    worlds = []
+    try:
+        client.read_team_size_message()
+        client.read_game_context_message()
+        while worlds.__len__() < ticks:
+            player_context = client.read_player_context_message()
+            if player_context is None:
+                break
+            worlds.append(player_context.world)
+    except IOError:
+        pass
+    finally:
+        client.close()
+    return worlds
+
+
+def collect_values(worlds):
+    values_by_class = {model_class: [] for model_class in MODEL_CLASSES}
+
+    for world in worlds:
+        units = world.wizards + world.minions + world.buildings + world.trees + world.projectiles + world.bonuses
+        for unit in units:
+            values_by_class[unit.__class__].append([getattr(unit, name) for name in attribute_names(unit.__class__)])
+            for status in getattr(unit, "statuses", []):
+                values_by_class[Status].append([getattr(status, name) for name in attribute_names(Status)])
+            values_by_class[Point2D].append([unit.x, unit.y])
+
+    return values_by_class
+
+
+def measure_bytes(instance_class, values):
+    instances = [None] * values.__len__()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    for index, instance_values in enumerate(values):
+        instances[index] = instance_class(*instance_values)
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return (after - before) / values.__len__(), instances
+
+
+def measure_access_nanoseconds(instances, names, repeat):
+    access = make_access_loop(names)
+    best_time = None
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        access(instances)
+        elapsed = time.perf_counter() - start
+        best_time = elapsed if best_time is None else min(best_time, elapsed)
+
+    return best_time / (instances.__len__() * names.__len__()) * 1e9
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--capture")
+    parser.add_argument("--scale", default="late", choices=sorted(SCALES))
+    parser.add_argument("--ticks", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    values_by_class = collect_values(collect_worlds(args.capture, args.scale, args.ticks))
+
+    print("%-10s %8s %12s %12s %14s %14s" % (
+        "class", "count", "dict B/unit", "slots B/unit", "dict ns/attr", "slots ns/attr"))
+    total_dict_bytes = 0.0
+    total_slots_bytes = 0.0
+
+    for model_class in MODEL_CLASSES:
+        values = values_by_class[model_class]
+        if not values:
+            continue
+
+        dict_bytes, dict_instances = measure_bytes(make_dict_class(model_class), values)
+        slots_bytes, slots_instances = measure_bytes(model_class, values)
+        total_dict_bytes += dict_bytes * values.__len__()
+        total_slots_bytes += slots_bytes * values.__len__()
+
+        names = ACCESSED_STATUS_ATTRIBUTE_NAMES if model_class is Status else ACCESSED_ATTRIBUTE_NAMES
+        dict_access = measure_access_nanoseconds(dict_instances, names, args.repeat)
+        slots_access = measure_access_nanoseconds(slots_instances, names, args.repeat)
+
+        print("%-10s %8d %12.1f %12.1f %14.1f %14.1f" % (
+            model_class.__name__, values.__len__(), dict_bytes, slots_bytes, dict_access, slots_access))
+
+    print("total: %.1f KB with __dict__, %.1f KB with __slots__" % (total_dict_bytes / 1024, total_slots_bytes / 1024))
+
+
+if __name__ == "__main__":
+    main()
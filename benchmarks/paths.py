@@ -0,0 +1,167 @@
+"""Per-tick cost of the path planner, incremental repair after trees are cut and the paths walked.
+
+Usage: python -m benchmarks.paths [--scale NAME] [--walks N] [--seed N] [--budget US] [--cut-trees N]
+
+Trees and buildings come from a synthetic frame of the given scale. Each walk picks a free start and a free goal
+and moves a wizard at the forward speed towards the steering point of the planner, planning every tick within the
+budget; until the first search has finished the wizard waits. A hundred ticks after it sets off, the N trees
+closest to the straight line from the wizard to the goal are cut down, and the ticks and expansions the planner
+spends to repair its search are compared with a search from scratch on the changed map. Reported are the ticks
+until the first path, the planning time per tick, the walked distance against the straight distance, and the
+ticks the wizard overlapped a tree or a building (the planner keeps a clearance, so there should be none). The
+planning time is CPU time, the clock the planner keeps its budget on; the wall time, which also has whatever else the
+machine did meanwhile, is reported next to it.
+"""
+
+import argparse
+import math
+import random
+import time
+
+from MyStrategy import Point2D
+from PathPlanner import PathPlanner
+from StaticUnitGrid import StaticUnitGrid
+from benchmarks.frames import SCALES, make_game, make_player_context
+
+MAX_TICKS = 3000
+CUT_TICK = 100
+
+
+class Walker(Point2D):
+    def __init__(self, x, y, vision_range):
+        Point2D.__init__(self, x, y)
+        self.vision_range = vision_range
+
+
+def percentile(sorted_values, fraction):
+    return sorted_values[min(sorted_values.__len__() - 1, int(sorted_values.__len__() * fraction))]
+
+
+def pick_free_point(planner, rnd, map_size):
+    while True:
+        x = rnd.uniform(0.0, map_size)
+        y = rnd.uniform(0.0, map_size)
+        if not planner.blocked_counts[planner.cell_of(x, y)]:
+            return x, y
+
+
+def cut_trees(trees, walker, goal_x, goal_y, count):
+    def distance_to_line(tree):
+        dx = goal_x - walker.x
+        dy = goal_y - walker.y
+        t = min(max(((tree.x - walker.x) * dx + (tree.y - walker.y) * dy) / (dx * dx + dy * dy), 0.0), 1.0)
+        return math.hypot(walker.x + t * dx - tree.x, walker.y + t * dy - tree.y)
+
+    cut_ids = {tree.id for tree in sorted(trees, key=distance_to_line)[:count]}
+    return [tree for tree in trees if tree.id not in cut_ids]
+
+
+def walk(game, world, rnd, budget, cut_tree_count):
+    planner = PathPlanner(game.map_size, game.wizard_radius)
+    trees = world.trees
+    planner.update_obstacles(trees, world.buildings, Walker(0.0, 0.0, 0.0))
+    planner.apply_obstacles(math.inf)
+    start_x, start_y = pick_free_point(planner, rnd, game.map_size)
+    goal_x, goal_y = pick_free_point(planner, rnd, game.map_size)
+    walker = Walker(start_x, start_y, game.wizard_vision_range)
+    obstacle_grid = StaticUnitGrid().update(trees + world.buildings)
+
+    result = {
+        "straight distance": math.hypot(goal_x - start_x, goal_y - start_y), "walked distance": 0.0,
+        "first path tick": None, "collision ticks": 0, "tick times": [], "tick wall times": [], "reached": False,
+        "repair ticks": None, "repair expansions": None, "scratch expansions": None, "scratch time": None,
+    }
+    set_off_tick = None
+    cut_expansion_count = None
+
+    for tick in range(MAX_TICKS):
+        if (set_off_tick is not None) and (tick == set_off_tick + CUT_TICK) and cut_tree_count:
+            trees = cut_trees(trees, walker, goal_x, goal_y, cut_tree_count)
+            obstacle_grid = StaticUnitGrid().update(trees + world.buildings)
+            scratch_planner = PathPlanner(game.map_size, game.wizard_radius)
+            scratch_planner.update_obstacles(trees, world.buildings, walker)
+            start = time.perf_counter()
+            scratch_planner.plan(walker.x, walker.y, goal_x, goal_y, 1e9)
+            result["scratch time"] = time.perf_counter() - start
+            result["scratch expansions"] = scratch_planner.expansion_count
+            cut_expansion_count = planner.expansion_count
+            cut_tick = tick
+
+        start = time.process_time()
+        wall_start = time.perf_counter()
+        planner.update_obstacles(trees, world.buildings, walker)
+        converged = planner.plan(walker.x, walker.y, goal_x, goal_y, budget)
+        steering_point = planner.steering_point(walker.x, walker.y, goal_x, goal_y)
+        result["tick times"].append(time.process_time() - start)
+        result["tick wall times"].append(time.perf_counter() - wall_start)
+
+        if converged and (cut_expansion_count is not None) and (result["repair ticks"] is None):
+            result["repair ticks"] = tick - cut_tick + 1
+            result["repair expansions"] = planner.expansion_count - cut_expansion_count
+
+        if not converged and set_off_tick is None:
+            continue
+        if set_off_tick is None:
+            set_off_tick = tick
+            result["first path tick"] = tick
+
+        target_x, target_y = steering_point if steering_point is not None else (goal_x, goal_y)
+        distance = math.hypot(target_x - walker.x, target_y - walker.y)
+        step = min(distance, game.wizard_forward_speed)
+        if distance > 0.0:
+            walker.x += (target_x - walker.x) * step / distance
+            walker.y += (target_y - walker.y) * step / distance
+        result["walked distance"] += step
+
+        if any(walker.get_distance_to_unit(obstacle) < obstacle.radius + game.wizard_radius
+               for obstacle in obstacle_grid.query_circle(walker.x, walker.y, game.wizard_radius)):
+            result["collision ticks"] += 1
+
+        if math.hypot(goal_x - walker.x, goal_y - walker.y) < 1.0:
+            result["reached"] = True
+            break
+
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scale", default="mid", choices=sorted(SCALES))
+    parser.add_argument("--walks", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--budget", type=float, default=PathPlanner.PLANNING_BUDGET_MICROSECONDS)
+    parser.add_argument("--cut-trees", type=int, default=10)
+    args = parser.parse_args()
+
+    game = make_game()
+    world = make_player_context(args.scale, seed=args.seed).world
+    rnd = random.Random(args.seed)
+    tick_times = []
+    tick_wall_times = []
+
+    print("%5s %8s %8s %6s %7s %9s %11s %11s %10s" % (
+        "walk", "straight", "walked", "first", "reached", "collision", "repair", "scratch", "scratch"))
+    print("%5s %8s %8s %6s %7s %9s %11s %11s %10s" % (
+        "", "", "", "tick", "", "ticks", "ticks/exp", "expansions", "ms"))
+    for index in range(args.walks):
+        result = walk(game, world, rnd, args.budget, args.cut_trees)
+        tick_times += result["tick times"]
+        tick_wall_times += result["tick wall times"]
+        print("%5d %8.0f %8.0f %6s %7s %9d %11s %11s %10s" % (
+            index, result["straight distance"], result["walked distance"], result["first path tick"],
+            result["reached"], result["collision ticks"],
+            "-" if result["repair ticks"] is None else "%d/%d" % (result["repair ticks"], result["repair expansions"]),
+            "-" if result["scratch expansions"] is None else result["scratch expansions"],
+            "-" if result["scratch time"] is None else "%.1f" % (result["scratch time"] * 1e3)))
+
+    tick_times.sort()
+    tick_wall_times.sort()
+    print("planning per tick (budget %.0f us): mean %.1f us, median %.1f us, p99 %.1f us, max %.1f us" % (
+        args.budget, sum(tick_times) / tick_times.__len__() * 1e6, percentile(tick_times, 0.5) * 1e6,
+        percentile(tick_times, 0.99) * 1e6, tick_times[-1] * 1e6))
+    print("wall time per tick: p99 %.1f us, max %.1f us" % (
+        percentile(tick_wall_times, 0.99) * 1e6, tick_wall_times[-1] * 1e6))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""Per-tick PLAYER_CONTEXT decode time and recv syscall count over a loopback socket.
+
+Usage: python -m benchmarks.reader [--frame PATH] [--scale NAME] [--ticks N] [--pool] [--columns]
+                                   [--skip ENTITY.FIELD ...]
+
+PATH holds one recorded PLAYER_CONTEXT message (message type byte included). Without it a synthetic
+frame of the given scale is used. With --pool the client reuses unit objects across ticks and the
+allocated/reused object counts per tick are reported as well. With --columns the client also fills the
+columnar world view (NumPy required). --skip decodes with a DecodeProfile that steps over the given fields,
+e.g. --skip world.projectiles wizard.messages.
+"""
+
+import argparse
+import socket
+import threading
+import time
+
+from DecodeProfile import DecodeProfile
+from RemoteProcessClient import RemoteProcessClient
+from UnitPool import UnitPool
+from WorldColumns import WorldColumns
+from benchmarks.frames import SCALES, encode_player_context_message, make_player_context
+
+
+class CountingSocket:
+    def __init__(self, sock):
+        self.sock = sock
+        self.recv_call_count = 0
+        self.sendall_call_count = 0
+
+    def recv(self, byte_count):
+        self.recv_call_count += 1
+        return self.sock.recv(byte_count)
+
+    def recv_into(self, buffer, byte_count=0):
+        self.recv_call_count += 1
+        return self.sock.recv_into(buffer, byte_count)
+
+    def sendall(self, data):
+        self.sendall_call_count += 1
+        self.sock.sendall(data)
+
+    def close(self):
+        self.sock.close()
+
+
+def serve(listener, frame, ticks):
+    connection, _ = listener.accept()
+    try:
+        connection.sendall(frame * ticks)
+    finally:
+        connection.close()
+
+
+def decode(frame, ticks, count_syscalls, unit_pool=None, world_columns=None, decode_profile=None):
+    listener = socket.socket()
+    listener.bind(("127.0.0.1", 0))
+    listener.listen(1)
+    server = threading.Thread(target=serve, args=(listener, frame, ticks))
+    server.start()
+
+    client = RemoteProcessClient(
+        "127.0.0.1", listener.getsockname()[1], unit_pool=unit_pool, world_columns=world_columns,
+        decode_profile=decode_profile
+    )
+    if count_syscalls:
+        client.socket = CountingSocket(client.socket)
+
+    tick_times = []
+    for _ in range(ticks):
+        start = time.perf_counter()
+        client.read_player_context_message()
+        tick_times.append(time.perf_counter() - start)
+
+    server.join()
+    listener.close()
+    recv_call_count = client.socket.recv_call_count if count_syscalls else None
+    client.close()
+    return tick_times, recv_call_count, client.unit_cache
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--frame")
+    parser.add_argument("--scale", default="late", choices=sorted(SCALES))
+    parser.add_argument("--ticks", type=int, default=200)
+    parser.add_argument("--pool", action="store_true")
+    parser.add_argument("--columns", action="store_true")
+    parser.add_argument("--skip", nargs="+", default=[], metavar="ENTITY.FIELD")
+    args = parser.parse_args()
+
+    if args.frame:
+        with open(args.frame, "rb") as frame_file:
+            frame = frame_file.read()
+    else:
+        frame = encode_player_context_message(make_player_context(args.scale))
+
+    unit_pool = UnitPool() if args.pool else None
+    world_columns = WorldColumns() if args.columns else None
+    skipped_fields_by_entity_name = {}
+    for skipped_field in args.skip:
+        entity_name, field_name = skipped_field.split(".")
+        skipped_fields_by_entity_name.setdefault(entity_name, []).append(field_name)
+    decode_profile = DecodeProfile(skipped_fields_by_entity_name) if skipped_fields_by_entity_name else None
+
+    tick_times, _, unit_cache = decode(frame, args.ticks, False, unit_pool, world_columns, decode_profile)
+    _, recv_call_count, _ = decode(frame, args.ticks, True)
+    tick_times.sort()
+
+    print("frame: %d bytes, ticks: %d" % (len(frame), args.ticks))
+    print("decode per tick: median %.1f us, p90 %.1f us" % (
+        tick_times[len(tick_times) // 2] * 1e6, tick_times[len(tick_times) * 9 // 10] * 1e6))
+    print("recv calls per tick: %.1f" % (recv_call_count / args.ticks))
+    print("unit cache: %d units, %d hits, %d evictions" % (
+        unit_cache.__len__(), unit_cache.hit_count, unit_cache.eviction_count))
+    if unit_pool is not None:
+        print("pooled units per tick: %.1f allocated, %.1f reused" % (
+            unit_pool.total_allocated_count / args.ticks, unit_pool.total_reused_count / args.ticks))
+
+
+if __name__ == "__main__":
+    main()
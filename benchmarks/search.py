@@ -0,0 +1,194 @@
+"""Rollouts per millisecond of the move search, batched and in a plain Python loop, and how it keeps its deadline.
+
+Usage: python -m benchmarks.search [--scale NAME] [--ticks N] [--budget US] [--seed N]
+
+For every wizard of our faction in N ticks of a synthetic world of the given scale, played forward with the moves as for
+benchmarks.strategy, MyStrategy plans its move by the rules and then runs the move search with the given budget.
+Reported are the rollouts per tick, the rollouts per millisecond of search, how often the search changed the move of the
+rules and how far past the deadline the search ran, in CPU time as the deadline is kept and in wall time. After every
+search the scores of its first chunk are computed again by rolling each candidate forward one by one in plain Python,
+which must give the same scores, and the rollouts per millisecond of both are compared.
+"""
+
+import argparse
+import contextlib
+import io
+import math
+import time
+
+import numpy
+
+from MoveSearch import MoveSearch
+from MyStrategy import MyStrategy
+from StrategyLog import StrategyLog
+from benchmarks.frames import SCALES, Simulation
+from model.Move import Move
+
+
+def percentile(sorted_values, fraction):
+    return sorted_values[min(sorted_values.__len__() - 1, int(sorted_values.__len__() * fraction))]
+
+
+def evaluate_naively(search, speeds, strafe_speeds, turns, attack_damages):
+    me = search.me
+    game = search.game
+    speeds, strafe_speeds = search.clip_speeds(speeds, strafe_speeds)
+    waypoint_x, waypoint_y = search.waypoint
+    low = me.radius
+    high = game.map_size - me.radius
+    threat_xs, threat_ys = search.threat_xs.tolist(), search.threat_ys.tolist()
+    threat_reaches, threat_damages = search.threat_reaches[:, 0].tolist(), search.threat_damages.tolist()
+    obstacle_xs, obstacle_ys = search.obstacle_xs.tolist(), search.obstacle_ys.tolist()
+    obstacle_radii = search.obstacle_radii[:, 0].tolist()
+    projectile_xs, projectile_ys = search.projectile_xs.tolist(), search.projectile_ys.tolist()
+    projectile_alive = search.projectile_alive.tolist()
+    projectile_hit_radii = search.projectile_hit_radii[:, 0].tolist()
+    projectile_damages = search.projectile_damages.tolist()
+    scores = []
+
+    for speed, strafe_speed, turn, attack_damage in zip(speeds.tolist(), strafe_speeds.tolist(), turns.tolist(),
+                                                        attack_damages.tolist()):
+        score = attack_damage
+        x, y = 0.0, 0.0
+        hit_projectiles = set()
+        for tick_index in range(MoveSearch.HORIZON_TICKS):
+            angle = me.angle + math.copysign(min(abs(turn), game.wizard_max_turn_angle * (tick_index + 1)), turn)
+            previous_x, previous_y = x, y
+            x += speed * math.cos(angle) - strafe_speed * math.sin(angle)
+            y += speed * math.sin(angle) + strafe_speed * math.cos(angle)
+
+            for threat_x, threat_y, reach, damages in zip(threat_xs, threat_ys, threat_reaches, threat_damages):
+                dx = threat_x[tick_index] - x
+                dy = threat_y[tick_index] - y
+                if dx * dx + dy * dy <= reach * reach:
+                    score -= damages[tick_index]
+
+            for obstacle_x, obstacle_y, radius in zip(obstacle_xs, obstacle_ys, obstacle_radii):
+                dx = obstacle_x[tick_index] - x
+                dy = obstacle_y[tick_index] - y
+                if dx * dx + dy * dy < radius * radius:
+                    score -= MoveSearch.COLLISION_PENALTY
+            if not (low <= me.x + x <= high) or not (low <= me.y + y <= high):
+                score -= MoveSearch.COLLISION_PENALTY
+
+            for index, projectile_x in enumerate(projectile_xs):
+                if index in hit_projectiles or not projectile_alive[index][tick_index]:
+                    continue
+                projectile_y = projectile_ys[index]
+                x0 = projectile_x[tick_index] - previous_x
+                y0 = projectile_y[tick_index] - previous_y
+                step_x = projectile_x[tick_index + 1] - x - x0
+                step_y = projectile_y[tick_index + 1] - y - y0
+                fraction = -(x0 * step_x + y0 * step_y) / max(step_x * step_x + step_y * step_y, 1e-9)
+                fraction = min(max(fraction, 0.0), 1.0)
+                closest_x = x0 + step_x * fraction
+                closest_y = y0 + step_y * fraction
+                if closest_x * closest_x + closest_y * closest_y < projectile_hit_radii[index] ** 2:
+                    hit_projectiles.add(index)
+                    score -= projectile_damages[index]
+
+        progress = math.hypot(waypoint_x, waypoint_y) - math.hypot(waypoint_x - x, waypoint_y - y)
+        scores.append(score + MoveSearch.PROGRESS_WEIGHT * progress)
+    return numpy.array(scores)
+
+
+class RecordingMoveSearch(MoveSearch):
+    # Keeps the first chunk of every search, to be checked against the plain Python loop once the search is done.
+    def __init__(self, game, projectile_dodge):
+        MoveSearch.__init__(self, game, projectile_dodge)
+        self.first_batch = None
+        self.batched_time = 0.0
+
+    def search(self, rule_move, missile_target, deadline, check=None):
+        self.first_batch = None
+        return MoveSearch.search(self, rule_move, missile_target, deadline, check)
+
+    def evaluate(self, speeds, strafe_speeds, turns, attack_damages):
+        start = time.perf_counter()
+        scores = MoveSearch.evaluate(self, speeds, strafe_speeds, turns, attack_damages)
+        if self.first_batch is None:
+            self.batched_time += time.perf_counter() - start
+            self.first_batch = (speeds, strafe_speeds, turns, attack_damages, scores)
+        return scores
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scale", default="mid", choices=sorted(SCALES))
+    parser.add_argument("--ticks", type=int, default=30)
+    parser.add_argument("--budget", type=float, default=MoveSearch.SEARCH_BUDGET_MICROSECONDS)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    MoveSearch.SEARCH_BUDGET_MICROSECONDS = args.budget
+    frames = Simulation(args.scale, args.seed)
+    game = frames.game
+    strategies = {}
+    search_times = []
+    overruns = []
+    wall_overruns = []
+    rollout_counts = []
+    changed_count = 0
+    naive_time = 0.0
+    checked_count = 0
+    max_score_error = 0.0
+
+    for player_context in frames.player_contexts(args.ticks):
+        world = player_context.world
+        for me in world.wizards:
+            if me.faction != world.wizards[0].faction:
+                continue
+            strategy = strategies.get(me.id)
+            if strategy is None:
+                strategy = strategies[me.id] = MyStrategy(log=StrategyLog(StrategyLog.INFO), search_moves=True)
+                with contextlib.redirect_stdout(io.StringIO()):
+                    strategy.initialize_tick(me, world, game, Move())
+                strategy.move_search = RecordingMoveSearch(game, strategy.projectile_dodge)
+
+            search = strategy.move_search
+            rollout_count = search.rollout_count
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                strategy.initialize_tick(me, world, game, Move())
+                strategy.time_budget.start_move(world.tick_index)
+                strategy.setup_move()
+                start = time.process_time()
+                wall_start = time.perf_counter()
+                strategy.search_move()
+                end = time.process_time()
+                wall_end = time.perf_counter()
+                strategy.log.flush()
+            frames.move(me.id, strategy.current_move)
+            search_times.append(end - start)
+            overruns.append(max(end - start - args.budget * 1e-6, 0.0))
+            wall_overruns.append(max(wall_end - wall_start - args.budget * 1e-6, 0.0))
+            rollout_counts.append(search.rollout_count - rollout_count)
+            changed_count += "Search:" in output.getvalue()
+
+            if search.first_batch is None:
+                continue
+            speeds, strafe_speeds, turns, attack_damages, scores = search.first_batch
+            start = time.perf_counter()
+            naive_scores = evaluate_naively(search, speeds, strafe_speeds, turns, attack_damages)
+            naive_time += time.perf_counter() - start
+            checked_count += speeds.__len__()
+            max_score_error = max(max_score_error, float(numpy.abs(scores - naive_scores).max()))
+
+    search_count = search_times.__len__()
+    rollout_total = sum(rollout_counts)
+    batched_time = sum(strategy.move_search.batched_time for strategy in strategies.values())
+    overruns.sort()
+    wall_overruns.sort()
+    print("%d searches with a budget of %.0f us: %.0f rollouts per search, %.0f rollouts per ms of search" % (
+        search_count, args.budget, rollout_total / search_count, rollout_total / (sum(search_times) * 1e3)))
+    print("deadline overrun: median %.1f us, p99 %.1f us, max %.1f us (wall time: p99 %.1f us, max %.1f us)" % (
+        percentile(overruns, 0.5) * 1e6, percentile(overruns, 0.99) * 1e6, overruns[-1] * 1e6,
+        percentile(wall_overruns, 0.99) * 1e6, wall_overruns[-1] * 1e6))
+    print("moves changed by the search: %d of %d" % (changed_count, search_count))
+    print("first chunks: batched %.0f rollouts per ms, plain Python loop %.1f rollouts per ms (%.0fx), "
+          "max score difference %.2e" % (checked_count / (batched_time * 1e3), checked_count / (naive_time * 1e3),
+                                         naive_time / batched_time, max_score_error))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Per-tick MyStrategy.move time and reuse of the per-tick derived views.
+
+Usage: python -m benchmarks.strategy [--capture PATH] [--scale NAME] [--ticks N] [--seed N]
+
+Worlds are either the PLAYER_CONTEXT messages of a capture recorded with `Runner.py host port token PATH`
+or a synthetic world of the given scale played forward with the moves of the strategies (see
+benchmarks.frames.Simulation): wizards walk, fight and die, trees are cut down and minion waves spawn. The tree
+list is shared between ticks while no tree is hit, as the decoder does while the server doesn't resend it. The
+strategy output is discarded. Besides the move time the number of derived views (enemy units, distances, obstacle
+grids and so on) that were computed and the number of calls answered from the per-tick context are reported.
+"""
+
+import argparse
+import contextlib
+import io
+import time
+
+from MyStrategy import MyStrategy
+from StrategyLog import StrategyLog
+from benchmarks.frames import SCALES, make_frames
+from model.Move import Move
+
+
+def percentile(sorted_values, fraction):
+    return sorted_values[min(sorted_values.__len__() - 1, int(sorted_values.__len__() * fraction))]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--capture")
+    parser.add_argument("--scale", default="late", choices=sorted(SCALES))
+    parser.add_argument("--ticks", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    frames = make_frames(args.capture, args.scale, args.seed)
+    strategies = {}
+    tick_times = []
+
+    with contextlib.redirect_stdout(io.StringIO()) as output:
+        for player_context in frames.player_contexts(args.ticks):
+            for wizard in player_context.wizards:
+                strategy = strategies.setdefault(wizard.id, MyStrategy())
+                move = Move()
+                start = time.perf_counter()
+                strategy.move(wizard, player_context.world, frames.game, move)
+                tick_times.append(time.perf_counter() - start)
+                frames.move(wizard.id, move)
+            StrategyLog.shared().flush()
+            output.seek(0)
+            output.truncate()
+
+    tick_times.sort()
+    print("moves: %d, move time: mean %.1f us, median %.1f us, p99 %.1f us, max %.1f us" % (
+        tick_times.__len__(), sum(tick_times) / tick_times.__len__() * 1e6, percentile(tick_times, 0.5) * 1e6,
+        percentile(tick_times, 0.99) * 1e6, tick_times[-1] * 1e6))
+
+    reused_count_by_name = {}
+    computed_count = 0
+    reused_count = 0
+    for strategy in strategies.values():
+        tick_context = strategy.tick_context
+        tick_context.end_tick()
+        computed_count += tick_context.total_computed_count
+        reused_count += tick_context.total_reused_count
+        for name, count in tick_context.total_reused_count_by_name.items():
+            reused_count_by_name[name] = reused_count_by_name.get(name, 0) + count
+
+    print("derived views: %d computed, %d reused (%.1f reused per move)" % (
+        computed_count, reused_count, reused_count / tick_times.__len__()))
+    for name, count in sorted(reused_count_by_name.items(), key=lambda item: -item[1]):
+        print("  %-32s %8d" % (name, count))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Cost of keeping the decision trace on the tick path, the memory it allocates there, and the cost of a dump.
+
+Usage: python -m benchmarks.trace [--scale NAME] [--ticks N] [--seed N]
+
+The world is a synthetic one of the given scale played forward with the moves, as for benchmarks.strategy. The wizards
+of our faction move through N ticks of it, and the moves of the last tick are recorded into a fresh trace over and over,
+as MyStrategy records them, until the buffer has wrapped around several times: reported are the time per record and the
+memory tracemalloc sees the trace holding more after recording into the full buffer, which should be no more than its
+two counters. The move time is reported for comparison. Last, the full buffer is dumped to a temporary directory:
+reported are the time the dump takes on the tick path, copying the records, and the time until the thread writing them
+is done.
+"""
+
+import argparse
+import tempfile
+import time
+import tracemalloc
+
+from DecisionTrace import DecisionTrace
+from MyStrategy import MyStrategy
+from StrategyLog import StrategyLog
+from benchmarks.frames import SCALES, make_frames
+from model.Move import Move
+
+
+def record(trace, tick, wizard_id, move):
+    trace.start(tick, wizard_id)
+    trace.branch(DecisionTrace.UNDER_ATTACK)
+    trace.branch(DecisionTrace.ATTACK)
+    trace.target(wizard_id + 1000)
+    trace.obstacle(wizard_id + 2000)
+    trace.retreat(False)
+    trace.finish(move, 0, 0.001)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scale", default="late", choices=sorted(SCALES))
+    parser.add_argument("--ticks", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    frames = make_frames(None, args.scale, args.seed)
+    log = StrategyLog(StrategyLog.OFF)
+    strategies = {}
+    move_times = []
+    moves = []
+    for player_context in frames.player_contexts(args.ticks):
+        world = player_context.world
+        moves = []
+        for me in world.wizards:
+            if me.faction != world.wizards[0].faction:
+                continue
+            strategy = strategies.get(me.id)
+            if strategy is None:
+                strategy = strategies[me.id] = MyStrategy(log=log, trace=DecisionTrace())
+            move = Move()
+            start = time.perf_counter()
+            strategy.move(me, world, frames.game, move)
+            move_times.append(time.perf_counter() - start)
+            moves.append((me.id, move))
+            frames.move(me.id, move)
+
+    trace = DecisionTrace()
+    record_count = DecisionTrace.CAPACITY * 4
+    rounds = record_count // moves.__len__()
+    for tick in range(rounds):
+        for wizard_id, move in moves:
+            record(trace, tick, wizard_id, move)
+
+    start = time.perf_counter()
+    for tick in range(rounds):
+        for wizard_id, move in moves:
+            record(trace, tick, wizard_id, move)
+    record_time = (time.perf_counter() - start) / (rounds * moves.__len__())
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    for tick in range(rounds):
+        for wizard_id, move in moves:
+            record(trace, tick, wizard_id, move)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, "filename")
+                    if stat.traceback[0].filename.endswith("DecisionTrace.py"))
+
+    print("record: %.2f us per move, move: %.1f us per move (%.2f%%)" % (
+        record_time * 1e6, sum(move_times) / move_times.__len__() * 1e6,
+        record_time / (sum(move_times) / move_times.__len__()) * 100))
+    print("memory held by the trace after recording %d moves into a full buffer: %d bytes more" % (
+        rounds * moves.__len__(), allocated))
+
+    with tempfile.TemporaryDirectory() as directory:
+        trace.directory = directory
+        start = time.perf_counter()
+        trace.dump(rounds, "benchmark")
+        middle = time.perf_counter()
+        trace.wait()
+        print("dump of %d records: %.1f ms on the tick path, %.1f ms until written" % (
+            DecisionTrace.CAPACITY, (middle - start) * 1e3, (time.perf_counter() - start) * 1e3))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""MOVE message encoding: single buffered sendall versus the old one-sendall-per-field path.
+
+Usage: python -m benchmarks.writer [--team-size N] [--ticks N]
+"""
+
+import argparse
+import socket
+import threading
+import time
+
+from RemoteProcessClient import RemoteProcessClient
+from benchmarks.reader import CountingSocket
+from model.ActionType import ActionType
+from model.LaneType import LaneType
+from model.Message import Message
+from model.Move import Move
+
+
+class PerFieldClient(RemoteProcessClient):
+    def write_move(self, move):
+        if move is None:
+            self.write_boolean(False)
+        else:
+            self.write_boolean(True)
+
+            self.write_double(move.speed)
+            self.write_double(move.strafe_speed)
+            self.write_double(move.turn)
+            self.write_enum(move.action)
+            self.write_double(move.cast_angle)
+            self.write_double(move.min_cast_distance)
+            self.write_double(move.max_cast_distance)
+            self.write_long(move.status_target_id)
+            self.write_enum(move.skill_to_learn)
+            self.write_messages(move.messages)
+
+    def reserve_write_bytes(self, byte_count):
+        self.flush()
+        return RemoteProcessClient.reserve_write_bytes(self, byte_count)
+
+
+def make_moves(team_size):
+    moves = []
+    for index in range(team_size):
+        move = Move()
+        move.speed = 4.0
+        move.strafe_speed = -3.0
+        move.turn = 0.1 * index
+        move.action = ActionType.MAGIC_MISSILE
+        move.cast_angle = 0.05
+        move.min_cast_distance = 250.0
+        if index == 0:
+            move.messages = [Message(LaneType.TOP, None, b""), Message(LaneType.MIDDLE, None, b"")]
+        moves.append(move)
+    return moves
+
+
+def drain(listener, byte_counts):
+    connection, _ = listener.accept()
+    byte_count = 0
+    try:
+        while True:
+            chunk = connection.recv(1 << 16)
+            if not chunk:
+                break
+            byte_count += len(chunk)
+    finally:
+        connection.close()
+    byte_counts.append(byte_count)
+
+
+def encode(client_class, moves, ticks):
+    listener = socket.socket()
+    listener.bind(("127.0.0.1", 0))
+    listener.listen(1)
+    byte_counts = []
+    server = threading.Thread(target=drain, args=(listener, byte_counts))
+    server.start()
+
+    client = client_class("127.0.0.1", listener.getsockname()[1])
+    client.socket = CountingSocket(client.socket)
+
+    start = time.perf_counter()
+    for _ in range(ticks):
+        client.write_moves_message(moves)
+    elapsed = time.perf_counter() - start
+    sendall_call_count = client.socket.sendall_call_count
+
+    client.close()
+    server.join()
+    listener.close()
+    return elapsed / ticks, sendall_call_count / ticks, byte_counts[0] / ticks
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--team-size", type=int, default=5)
+    parser.add_argument("--ticks", type=int, default=2000)
+    args = parser.parse_args()
+
+    moves = make_moves(args.team_size)
+    for name, client_class in [("per-field", PerFieldClient), ("buffered", RemoteProcessClient)]:
+        tick_time, sendall_calls, byte_count = encode(client_class, moves, args.ticks)
+        print("%-9s team_size=%d: %.1f us/tick, %.1f sendall calls/tick, %d bytes/tick" % (
+            name, args.team_size, tick_time * 1e6, sendall_calls, byte_count))
+
+
+if __name__ == "__main__":
+    main()
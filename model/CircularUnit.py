@@ -3,6 +3,8 @@ from model.Unit import Unit
 
 
 class CircularUnit(Unit):
+    __slots__ = ("radius",)
+
     def __init__(self, id, x, y, speed_x, speed_y, angle, faction: (None, Faction), radius):
         Unit.__init__(self, id, x, y, speed_x, speed_y, angle, faction)
 
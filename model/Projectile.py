@@ -4,6 +4,8 @@ from model.ProjectileType import ProjectileType
 
 
 class Projectile(CircularUnit):
+    __slots__ = ("type", "owner_unit_id", "owner_player_id")
+
     def __init__(self, id, x, y, speed_x, speed_y, angle, faction: (None, Faction), radius,
                  type: (None, ProjectileType), owner_unit_id, owner_player_id):
         CircularUnit.__init__(self, id, x, y, speed_x, speed_y, angle, faction, radius)
@@ -1,9 +1,31 @@
+from itertools import repeat
 from math import *
+from operator import attrgetter, sub
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 from model.Faction import Faction
 
+get_x = attrgetter("x")
+get_y = attrgetter("y")
+
+
+def to_array(values):
+    if isinstance(values, numpy.ndarray):
+        return values
+    return numpy.fromiter(values, numpy.float64)
+
+
+def coordinates(units, get):
+    return numpy.fromiter(map(get, units), numpy.float64, units.__len__())
+
 
 class Unit:
+    __slots__ = ("id", "x", "y", "speed_x", "speed_y", "angle", "faction")
+
     def __init__(self, id, x, y, speed_x, speed_y, angle, faction: (None, Faction)):
         self.id = id
         self.x = x
@@ -33,3 +55,30 @@ class Unit:
 
     def get_distance_to_unit(self, unit):
         return self.get_distance_to(unit.x, unit.y)
+
+    def get_angles_to(self, xs, ys):
+        if numpy is None:
+            relative_angles_to = map(
+                sub, map(atan2, map(sub, ys, repeat(self.y)), map(sub, xs, repeat(self.x))), repeat(self.angle)
+            )
+            return [angle - 2.0 * pi * ((angle > pi) - (angle < -pi)) for angle in relative_angles_to]
+
+        angles = numpy.arctan2(to_array(ys) - self.y, to_array(xs) - self.x)
+        angles -= self.angle
+        angles -= 2.0 * pi * ((angles > pi).view(numpy.int8) - (angles < -pi).view(numpy.int8))
+        return angles.tolist()
+
+    def get_angles_to_units(self, units):
+        if numpy is None:
+            return self.get_angles_to(map(get_x, units), map(get_y, units))
+        return self.get_angles_to(coordinates(units, get_x), coordinates(units, get_y))
+
+    def get_distances_to(self, xs, ys):
+        if numpy is None:
+            return list(map(hypot, map(sub, xs, repeat(self.x)), map(sub, ys, repeat(self.y))))
+        return numpy.hypot(to_array(xs) - self.x, to_array(ys) - self.y).tolist()
+
+    def get_distances_to_units(self, units):
+        if numpy is None:
+            return self.get_distances_to(map(get_x, units), map(get_y, units))
+        return self.get_distances_to(coordinates(units, get_x), coordinates(units, get_y))
@@ -3,6 +3,11 @@ from model.LivingUnit import LivingUnit
 
 
 class Wizard(LivingUnit):
+    __slots__ = (
+        "owner_player_id", "me", "mana", "max_mana", "vision_range", "cast_range", "xp", "level", "skills",
+        "remaining_action_cooldown_ticks", "remaining_cooldown_ticks_by_action", "master", "messages"
+    )
+
     def __init__(self, id, x, y, speed_x, speed_y, angle, faction: (None, Faction), radius, life, max_life, statuses,
                  owner_player_id, me, mana, max_mana, vision_range, cast_range, xp, level, skills,
                  remaining_action_cooldown_ticks, remaining_cooldown_ticks_by_action, master, messages):
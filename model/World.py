@@ -12,6 +12,7 @@ class World:
         self.bonuses = bonuses
         self.buildings = buildings
         self.trees = trees
+        self.columns = None
 
     def get_my_player(self):
         for player in self.players:
@@ -0,0 +1,124 @@
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+
+from AsyncRemoteProcessClient import AsyncRemoteProcessClient, ProtocolParser
+from RemoteProcessClient import RemoteProcessClient
+from StrategyLog import StrategyLog
+from UnitPool import UnitPool
+from benchmarks.frames import (
+    encode_game_context_message, encode_player_context_message, encode_team_size_message, make_encoder, make_game,
+    make_player_context
+)
+
+
+class Transport:
+    def __init__(self):
+        self.data = bytearray()
+        self.closed = False
+
+    def write(self, data):
+        self.data += data
+
+    def close(self):
+        self.closed = True
+
+
+class LoggingStrategy:
+    def move(self, me, world, game, move):
+        StrategyLog.shared().info(world.tick_index, "Move of %d", me.id)
+
+
+def encode_game_over_message():
+    encoder = make_encoder()
+    encoder.write_enum(RemoteProcessClient.MessageType.GAME_OVER)
+    encoder.flush()
+    return bytes(encoder.socket.data)
+
+
+def describe_units(player_context):
+    world = player_context.world
+    return [
+        (unit.id, unit.x, unit.life, [status.id for status in unit.statuses])
+        for unit in world.wizards + world.minions
+    ]
+
+
+def parse_in_chunks(data, chunk_size):
+    unit_pool = UnitPool()
+    parser = ProtocolParser(Transport(), unit_pool)
+    messages = parser.parse_messages()
+    descriptions = []
+    for offset in range(0, data.__len__(), chunk_size):
+        parser.feed(data[offset:offset + chunk_size])
+        for message in messages:
+            if message is None:
+                break
+            descriptions.append(describe_units(message[1]))
+    return descriptions, unit_pool
+
+
+class ProtocolParserTest(unittest.TestCase):
+    def test_pooled_units_arriving_a_byte_at_a_time_are_acquired_once(self):
+        player_context = make_player_context("mid", tick_index=5000)
+        messages = [encode_player_context_message(player_context)]
+        for wizard in player_context.world.wizards:
+            wizard.life -= 1
+            wizard.statuses = []
+        player_context.world.tick_index += 1
+        messages.append(encode_player_context_message(player_context))
+        data = b"".join(messages)
+
+        expected, expected_unit_pool = parse_in_chunks(data, data.__len__())
+        actual, unit_pool = parse_in_chunks(data, 1)
+
+        self.assertEqual(2, expected.__len__())
+        self.assertEqual(expected, actual)
+        self.assertEqual(
+            (expected_unit_pool.total_allocated_count, expected_unit_pool.total_reused_count),
+            (unit_pool.total_allocated_count, unit_pool.total_reused_count))
+
+
+class AsyncRemoteProcessClientTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.log_path = os.path.join(self.directory.name, "log.jsonl")
+        self.previous_log = StrategyLog.shared_log
+        StrategyLog.shared_log = StrategyLog(StrategyLog.DEBUG, self.log_path)
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        StrategyLog.shared_log.close()
+        StrategyLog.shared_log = self.previous_log
+        self.loop.close()
+        self.directory.cleanup()
+
+    def read_log(self):
+        with open(self.log_path) as file:
+            return [json.loads(line) for line in file]
+
+    def test_log_is_flushed_after_every_tick_and_closed_at_game_over(self):
+        player_context = make_player_context("early", tick_index=7)
+        client = AsyncRemoteProcessClient("0000000000000000", LoggingStrategy, self.loop)
+        client.connection_made(Transport())
+        client.data_received(
+            encode_team_size_message(player_context.wizards.__len__()) + encode_game_context_message(make_game()) +
+            encode_player_context_message(player_context)
+        )
+
+        log = StrategyLog.shared_log
+        self.assertEqual([], log.records)
+        self.assertEqual(1, log.flush_count)
+
+        client.data_received(encode_game_over_message())
+
+        self.assertTrue(client.finished.done())
+        self.assertIsNone(log.file)
+        self.assertEqual(
+            [{"tick": 7, "level": "info", "message": "Move of %d" % player_context.wizards[0].id}], self.read_log())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+import json
+import os
+import tempfile
+import unittest
+
+from DecisionTrace import DecisionTrace
+from model.Move import Move
+
+
+def record(trace, tick, wizard_id):
+    trace.start(tick, wizard_id)
+    trace.branch(DecisionTrace.ATTACK)
+    move = Move()
+    move.speed = 3.0
+    trace.finish(move, 0, 0.001)
+
+
+class DecisionTraceTest(unittest.TestCase):
+    def test_nothing_is_dumped_without_a_directory(self):
+        trace = DecisionTrace(capacity=8)
+        record(trace, 1, 5)
+        trace.dump_requested = True
+
+        self.assertIsNone(trace.dump(1, "request"))
+        self.assertIsNone(trace.dump_slow_tick(1))
+        self.assertFalse(trace.dump_requested)
+        self.assertEqual(0, trace.dump_count)
+
+    def test_dump_writes_the_records_as_they_were_when_it_was_made(self):
+        with tempfile.TemporaryDirectory() as directory:
+            trace = DecisionTrace(capacity=8, directory=directory)
+            record(trace, 1, 5)
+            path = trace.dump(1, "request")
+            record(trace, 2, 5)
+            trace.wait()
+
+            self.assertEqual(os.path.join(directory, "trace-1-request.jsonl"), path)
+            with open(path) as file:
+                records = [json.loads(line) for line in file]
+            self.assertEqual([(1, 5, ["attack"], 3.0)],
+                             [(r["tick"], r["wizard"], r["branches"], r["speed"]) for r in records])
+
+
+if __name__ == "__main__":
+    unittest.main()
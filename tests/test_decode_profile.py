@@ -0,0 +1,90 @@
+import unittest
+
+import ProtocolSchema
+from AsyncRemoteProcessClient import ProtocolParser
+from DecodeProfile import DecodeProfile
+from RemoteProcessClient import RemoteProcessClient
+from benchmarks.frames import (
+    ByteSink, encode, encode_game_context_message, encode_player_context_message, make_game, make_player_context
+)
+
+SKIPPED_FIELDS_BY_ENTITY_NAME = {
+    "world": ["projectiles", "bonuses"],
+    "wizard": ["statuses", "skills", "remaining_cooldown_ticks_by_action", "messages"],
+    "game": ["level_up_xp_values"],
+}
+
+
+class Transport:
+    def write(self, data):
+        pass
+
+
+def make_client(data, decode_profile=None):
+    client = RemoteProcessClient(None, None, ByteSink(), decode_profile=decode_profile)
+    client.read_buffer[:data.__len__()] = data
+    client.read_limit = data.__len__()
+    return client
+
+
+def encode_field(entity_name, field_name, value):
+    field_type = dict(ProtocolSchema.ENTITY_TYPE_BY_NAME[entity_name].fields)[field_name]
+    return encode(lambda encoder, field_value: getattr(encoder, field_type.write_method)(field_value), value)
+
+
+class DecodeProfileTest(unittest.TestCase):
+    def setUp(self):
+        self.player_context = make_player_context("mid")
+        self.data = encode_game_context_message(make_game()) + encode_player_context_message(self.player_context)
+
+    def assert_lazy_fields_equal(self, eager_game, eager_player_context, game, player_context):
+        world = player_context.world
+        eager_world = eager_player_context.world
+        for entity_name, entity, eager_entity in (
+                [("game", game, eager_game), ("world", world, eager_world)] +
+                [("wizard", wizard, eager_wizard) for wizard, eager_wizard in zip(
+                    player_context.wizards + world.wizards, eager_player_context.wizards + eager_world.wizards)]):
+            self.assertTrue(entity.lazy_fields)
+            for field_name in SKIPPED_FIELDS_BY_ENTITY_NAME[entity_name]:
+                self.assertEqual(encode_field(entity_name, field_name, getattr(eager_entity, field_name)),
+                                 encode_field(entity_name, field_name, getattr(entity, field_name)))
+            self.assertFalse(entity.lazy_fields)
+
+        self.assertEqual(encode(RemoteProcessClient.write_player_context, eager_player_context),
+                         encode(RemoteProcessClient.write_player_context, player_context))
+        self.assertEqual(
+            encode(RemoteProcessClient.write_game, eager_game), encode(RemoteProcessClient.write_game, game))
+
+    def test_lazy_fields_decode_to_the_eager_values(self):
+        eager_client = make_client(self.data)
+        eager_game = eager_client.read_game_context_message()
+        eager_player_context = eager_client.read_player_context_message()
+
+        client = make_client(self.data, DecodeProfile(SKIPPED_FIELDS_BY_ENTITY_NAME))
+        game = client.read_game_context_message()
+        player_context = client.read_player_context_message()
+
+        self.assertEqual(self.data.__len__(), client.read_offset)
+        self.assert_lazy_fields_equal(eager_game, eager_player_context, game, player_context)
+
+    def test_lazy_fields_decoded_in_chunks_by_the_asynchronous_parser_equal_the_eager_values(self):
+        eager_client = make_client(self.data)
+        eager_game = eager_client.read_game_context_message()
+        eager_player_context = eager_client.read_player_context_message()
+
+        parser = ProtocolParser(Transport(), decode_profile=DecodeProfile(SKIPPED_FIELDS_BY_ENTITY_NAME))
+        messages = parser.parse_messages()
+        decoded = []
+        for offset in range(0, self.data.__len__(), 100):
+            parser.feed(self.data[offset:offset + 100])
+            for message in messages:
+                if message is None:
+                    break
+                decoded.append(message[1])
+        game, player_context = decoded
+
+        self.assert_lazy_fields_equal(eager_game, eager_player_context, game, player_context)
+
+
+if __name__ == "__main__":
+    unittest.main()
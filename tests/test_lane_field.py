@@ -0,0 +1,96 @@
+import math
+import random
+import unittest
+
+from LaneField import LaneField, numpy
+from MyStrategy import MyStrategy, Point2D
+from StrategyLog import StrategyLog
+from benchmarks.frames import make_game, make_player_context
+from model.LaneType import LaneType
+from model.Move import Move
+
+LANES = [LaneType.TOP, LaneType.MIDDLE, LaneType.BOTTOM]
+
+POINT_COUNT = 3000
+MAX_P99_ERROR = 1.0
+MIN_SAME_LANE_FRACTION = 0.995
+
+
+def percentile(sorted_values, fraction):
+    return sorted_values[min(sorted_values.__len__() - 1, int(sorted_values.__len__() * fraction))]
+
+
+@unittest.skipIf(numpy is None, "the lane field needs NumPy")
+class LaneFieldTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.game = make_game()
+        cls.strategy = MyStrategy(log=StrategyLog(StrategyLog.OFF))
+        cls.strategy.initialize_strategy(make_player_context("early").wizards[0], cls.game, Move())
+        cls.lane_field = cls.strategy.lane_field
+        rnd = random.Random(5)
+        cls.points = [
+            Point2D(rnd.uniform(0.0, cls.game.map_size), rnd.uniform(0.0, cls.game.map_size))
+            for _ in range(POINT_COUNT)
+        ]
+
+    def setUp(self):
+        # The strategy projects exactly without its lane field.
+        self.strategy.lane_field = None
+
+    def tearDown(self):
+        self.strategy.lane_field = self.lane_field
+
+    def test_distances_agree_with_the_exact_projection(self):
+        # Bilinear sampling rounds off the kinks of the distances, so only the worst case is as large as a cell.
+        strategy = self.strategy
+        lane_field = self.lane_field
+        to_lane_errors = []
+        on_lane_errors = []
+        for point in self.points:
+            for lane in LANES:
+                distance_to_lane = lane_field.distance_to_lane(lane, point.x, point.y)
+                to_lane_errors.append(abs(distance_to_lane - strategy.get_unit_distance_to_lane(lane, point)))
+                distance_on_lane = lane_field.distance_on_lane(lane, point.x, point.y)
+                if distance_on_lane is not None:
+                    on_lane_errors.append(abs(distance_on_lane - strategy.get_unit_distance_on_lane(lane, point)))
+
+        for errors, max_error in (
+                (to_lane_errors, lane_field.cell_size),
+                (on_lane_errors, lane_field.cell_size * math.sqrt(2.0) + LaneField.JUMP_SLACK)):
+            errors.sort()
+            self.assertLessEqual(percentile(errors, 0.99), MAX_P99_ERROR)
+            self.assertLessEqual(errors[-1], max_error)
+        self.assertGreater(on_lane_errors.__len__(), 0.95 * POINT_COUNT * LANES.__len__())
+
+    def test_nearest_lane_agrees_with_the_exact_projection(self):
+        same_lane_count = 0
+        for point in self.points:
+            lane, distance = self.lane_field.nearest_lane(point.x, point.y)
+            same_lane_count += (lane if distance <= 400 else None) == self.strategy.get_unit_lane(point)
+
+        self.assertGreaterEqual(same_lane_count / POINT_COUNT, MIN_SAME_LANE_FRACTION)
+
+    def test_distance_on_lane_has_no_answer_in_cells_with_a_jump(self):
+        lane_field = self.lane_field
+        cells_per_side = lane_field.node_count - 1
+        jump_cell_count = 0
+        for lane in LANES:
+            for cell, jump in enumerate(lane_field.arc_length_jumps_by_lane[lane]):
+                if not jump:
+                    continue
+                jump_cell_count += 1
+                point = Point2D((cell // cells_per_side + 0.5) * lane_field.cell_size,
+                                (cell % cells_per_side + 0.5) * lane_field.cell_size)
+                self.assertIsNone(lane_field.distance_on_lane(lane, point.x, point.y))
+
+                exact_distance = self.strategy.get_unit_distance_on_lane(lane, point)
+                self.strategy.lane_field = lane_field
+                self.assertEqual(exact_distance, self.strategy.get_unit_distance_on_lane(lane, point))
+                self.strategy.lane_field = None
+
+        self.assertGreater(jump_cell_count, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,132 @@
+import time
+import unittest
+from unittest import mock
+
+from DecisionTrace import DecisionTrace
+from MoveSearch import MoveSearch
+from MyStrategy import MyStrategy
+from StrategyLog import StrategyLog
+from TimeBudget import TickOverrun, TimeBudget
+from benchmarks.frames import Simulation
+from model.Move import Move
+
+TICK_COUNT = 40
+# A share of a move that leaves the search a millisecond or two after the rules.
+TICK_SECONDS = 0.004
+
+
+def play(strategy, simulation):
+    # Plays the first wizard of the academy for TICK_COUNT ticks, the strategy set up beforehand so that the tight
+    # budget only has to cover the moves.
+    moves = []
+    for player_context in simulation.player_contexts(TICK_COUNT):
+        me = player_context.wizards[0]
+        if not moves:
+            strategy.initialize_tick(me, player_context.world, simulation.game, Move())
+            strategy.time_budget = TimeBudget(TICK_COUNT, base_seconds=0.0, tick_seconds=TICK_SECONDS)
+        move = Move()
+        strategy.move(me, player_context.world, simulation.game, move)
+        simulation.move(me.id, move)
+        moves.append(move)
+    return moves
+
+
+class MoveSearchTest(unittest.TestCase):
+    def test_search_under_a_tight_budget_sends_moves_as_traced(self):
+        simulation = Simulation("mid", 3)
+        game = simulation.game
+        strategy = MyStrategy(log=StrategyLog(StrategyLog.OFF), trace=DecisionTrace(), search_moves=True)
+        moves = play(strategy, simulation)
+
+        self.assertGreater(strategy.move_search.rollout_count, 0)
+        records = list(strategy.trace.records())
+        self.assertEqual(TICK_COUNT, records.__len__())
+        self.assertTrue(any("searched" in record["flags"] for record in records))
+        for move, record in zip(moves, records):
+            self.assertEqual((move.speed, move.strafe_speed, move.turn, move.action or 0),
+                             (record["speed"], record["strafe_speed"], record["turn"], record["action"]))
+            self.assertLessEqual(-game.wizard_backward_speed, move.speed)
+            self.assertLessEqual(move.speed, game.wizard_forward_speed)
+            self.assertLessEqual(abs(move.strafe_speed), game.wizard_strafe_speed)
+        # The search keeps to what is left of the share of the move; the bound leaves room for a busy machine.
+        self.assertLess(strategy.time_budget.max_move_seconds, TICK_SECONDS * 10)
+
+    def test_overrun_during_the_search_leaves_a_whole_move_and_trace(self):
+        simulation = Simulation("mid", 3)
+        game = simulation.game
+        trace = DecisionTrace()
+        strategy = MyStrategy(TimeBudget(TICK_COUNT), StrategyLog(StrategyLog.OFF), trace, search_moves=True)
+        time_budget = strategy.time_budget
+        player_contexts = simulation.player_contexts(TICK_COUNT)
+        for _ in range(3):
+            player_context = next(player_contexts)
+            strategy.move(player_context.wizards[0], player_context.world, game, Move())
+
+        # The hard limit runs out while the first chunk of the search is worked out, as Runner would see it.
+        move_search = strategy.move_search
+        evaluate = move_search.evaluate
+        chunks = []
+
+        def evaluate_and_run_out(*args):
+            chunks.append(args[0].__len__())
+            scores = evaluate(*args)
+            time_budget.hard_deadline = time.thread_time()
+            return scores
+
+        player_context = next(player_contexts)
+        me = player_context.wizards[0]
+        search_count = move_search.search_count
+        move = Move()
+        with mock.patch.object(MoveSearch, "SEARCH_BUDGET_MICROSECONDS", 1e6), \
+                mock.patch.object(move_search, "evaluate", evaluate_and_run_out):
+            with self.assertRaises(TickOverrun):
+                with time_budget.watchdog():
+                    strategy.move(me, player_context.world, game, move)
+        trace.flag(DecisionTrace.OVERRUN)
+        trace.replace_move(Move())
+        strategy.recover()
+
+        self.assertEqual([MoveSearch.CHUNK_SIZE], chunks)
+        self.assertEqual(search_count + 1, move_search.search_count)
+        self.assertEqual(1, time_budget.overrun_count)
+        self.assertEqual(4, time_budget.move_count)
+        record = list(trace.records())[-1]
+        self.assertEqual((player_context.world.tick_index, me.id, ["overrun"], "full"),
+                         (record["tick"], record["wizard"], record["flags"], record["level"]))
+        self.assertEqual((0.0, 0.0, 0.0, 0),
+                         (record["speed"], record["strafe_speed"], record["turn"], record["action"]))
+        self.assertEqual(time_budget.last_move_seconds * 1e3, record["move_ms"])
+
+        # The next move is made as if nothing happened.
+        player_context = next(player_contexts)
+        move = Move()
+        strategy.move(player_context.wizards[0], player_context.world, game, move)
+        record = list(trace.records())[-1]
+        self.assertEqual((player_context.world.tick_index, move.speed, move.strafe_speed),
+                         (record["tick"], record["speed"], record["strafe_speed"]))
+        self.assertEqual(5, time_budget.move_count)
+
+    def test_obstacle_attacked_on_the_way_is_not_traced_as_target(self):
+        simulation = Simulation("mid", 3)
+        trace = DecisionTrace()
+        strategy = MyStrategy(log=StrategyLog(StrategyLog.OFF), trace=trace)
+        player_context = next(simulation.player_contexts(1))
+        me = player_context.wizards[0]
+        tree = min(player_context.world.trees, key=me.get_distance_to_unit)
+        strategy.initialize_tick(me, player_context.world, simulation.game, Move())
+        strategy.last_tree = tree.id
+        strategy.move(me, player_context.world, simulation.game, Move())
+
+        record = list(trace.records())[-1]
+        self.assertEqual((["continue obstacle"], tree.id, None),
+                         (record["branches"], record["obstacle"], record["target"]))
+
+    def test_search_is_off_unless_asked_for(self):
+        strategy = MyStrategy(log=StrategyLog(StrategyLog.OFF), trace=DecisionTrace(), search_moves=False)
+        play(strategy, Simulation("mid", 3))
+
+        self.assertEqual(0, strategy.move_search.rollout_count)
+
+
+if __name__ == "__main__":
+    unittest.main()
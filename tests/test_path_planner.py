@@ -0,0 +1,110 @@
+import math
+import unittest
+
+from PathPlanner import INFINITY, PathPlanner
+from model.Faction import Faction
+from model.Tree import Tree
+
+MAP_SIZE = 1200.0
+WIZARD_RADIUS = 35.0
+START = (150.0, 600.0)
+GOAL = (1050.0, 600.0)
+
+
+class Observer:
+    def __init__(self, x, y, vision_range):
+        self.x = x
+        self.y = y
+        self.vision_range = vision_range
+
+    def get_distance_to_unit(self, unit):
+        return math.hypot(unit.x - self.x, unit.y - self.y)
+
+
+def make_wall():
+    # A row of trees across the straight line from the start to the goal, open at both ends.
+    return [Tree(index, 600.0, y, 0.0, 0.0, 0.0, Faction.OTHER, 30.0, 10, 10, []) for index, y in enumerate(
+        range(300, 901, 50))]
+
+
+def plan(planner, budget_microseconds=INFINITY):
+    call_count = 1
+    while not planner.plan(START[0], START[1], GOAL[0], GOAL[1], budget_microseconds):
+        call_count += 1
+    return call_count
+
+
+def follow_path(planner):
+    # The whole path down the costs to the goal, not only the cells ahead of the walker.
+    g = planner.g
+    cell = planner.start
+    path = [cell]
+    while cell != planner.goal:
+        cell = min(planner.successors(cell), key=lambda successor: successor[1] + g.get(successor[0], INFINITY))[0]
+        path.append(cell)
+        if path.__len__() > planner.column_count ** 2:
+            raise AssertionError("The path does not reach the goal.")
+    return path
+
+
+def plan_from_scratch(trees, observer):
+    planner = PathPlanner(MAP_SIZE, WIZARD_RADIUS)
+    planner.update_obstacles(trees, [], observer)
+    plan(planner)
+    return planner
+
+
+class PathPlannerTest(unittest.TestCase):
+    def setUp(self):
+        self.observer = Observer(START[0], START[1], 600.0)
+        self.planner = PathPlanner(MAP_SIZE, WIZARD_RADIUS)
+        self.planner.update_obstacles([], [], self.observer)
+        plan(self.planner)
+        self.straight_cost = self.planner.g[self.planner.start]
+
+    def assert_replanned_path(self, trees):
+        planner = self.planner
+        path = follow_path(planner)
+        scratch_planner = plan_from_scratch(trees, self.observer)
+
+        self.assertTrue(all(not planner.blocked_counts[cell] for cell in path[1:]))
+        self.assertAlmostEqual(scratch_planner.g[scratch_planner.start], planner.g[planner.start])
+        return path
+
+    def test_replan_routes_around_an_added_obstacle(self):
+        wall = make_wall()
+        self.planner.update_obstacles(wall, [], self.observer)
+        plan(self.planner)
+        path = self.assert_replanned_path(wall)
+
+        planner = self.planner
+        self.assertGreater(planner.g[planner.start], self.straight_cost)
+        wall_column = planner.cell_of(600.0, 0.0) // planner.column_count
+        crossing_ys = [planner.cell_center(cell)[1] for cell in path if cell // planner.column_count == wall_column]
+        self.assertTrue(crossing_ys)
+        self.assertTrue(all(y < 300.0 - 30.0 - WIZARD_RADIUS or y > 900.0 + 30.0 + WIZARD_RADIUS for y in crossing_ys))
+
+    def test_replan_within_a_small_budget_resumes_until_it_has_the_same_path(self):
+        wall = make_wall()
+        self.planner.update_obstacles(wall, [], self.observer)
+        call_count = plan(self.planner, 20)
+
+        self.assertGreater(call_count, 1)
+        self.assert_replanned_path(wall)
+
+    def test_replan_takes_the_straight_line_again_once_the_obstacle_is_gone(self):
+        wall = make_wall()
+        self.planner.update_obstacles(wall, [], self.observer)
+        plan(self.planner)
+
+        # The walker comes close enough to see the trees are gone.
+        self.observer.x = 600.0
+        self.planner.update_obstacles([], [], self.observer)
+        plan(self.planner)
+        self.assert_replanned_path([])
+
+        self.assertAlmostEqual(self.straight_cost, self.planner.g[self.planner.start])
+
+
+if __name__ == "__main__":
+    unittest.main()
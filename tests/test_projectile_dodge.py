@@ -0,0 +1,102 @@
+import math
+import random
+import unittest
+
+from ProjectileDodge import ProjectileDodge
+from benchmarks.dodge import Target, launch
+from benchmarks.frames import make_game
+from model.Faction import Faction
+from model.Projectile import Projectile
+from model.ProjectileType import ProjectileType
+
+
+def scalar_plan(dodge, me, projectiles, speed, strafe_speed):
+    # The plan worked out one projectile and one candidate move at a time, as it was before NumPy.
+    cos_angle = math.cos(me.angle)
+    sin_angle = math.sin(me.angle)
+    candidates = []
+    for candidate_speed, candidate_strafe_speed in dodge.candidate_speeds(speed, strafe_speed):
+        velocity_x = candidate_speed * cos_angle - candidate_strafe_speed * sin_angle
+        velocity_y = candidate_speed * sin_angle + candidate_strafe_speed * cos_angle
+        damage = 0.0
+        for projectile in projectiles:
+            origin_x, origin_y, flight_range = dodge.origins_by_id[projectile.id]
+            flown = math.hypot(projectile.x - origin_x, projectile.y - origin_y)
+            projectile_speed = math.hypot(projectile.speed_x, projectile.speed_y)
+            flight_ticks = max(flight_range - flown, 0.0) / max(projectile_speed, 1e-9)
+            x = projectile.x - me.x
+            y = projectile.y - me.y
+            relative_x = projectile.speed_x - velocity_x
+            relative_y = projectile.speed_y - velocity_y
+            squared_speed = max(relative_x * relative_x + relative_y * relative_y, 1e-9)
+            ticks = min(max(-(x * relative_x + y * relative_y) / squared_speed, 0.0), flight_ticks)
+            closest_x = x + relative_x * ticks
+            closest_y = y + relative_y * ticks
+            hit_radius = dodge.hit_radius_by_type[projectile.type] + me.radius
+            if closest_x * closest_x + closest_y * closest_y < hit_radius * hit_radius:
+                damage += dodge.damage_by_type[projectile.type]
+        candidates.append((candidate_speed, candidate_strafe_speed, damage, velocity_x, velocity_y))
+
+    planned_damage = candidates[0][2]
+    if min(candidate[2] for candidate in candidates) == planned_damage:
+        return None
+    planned_x, planned_y = candidates[0][3], candidates[0][4]
+    ordered = sorted(candidates, key=lambda candidate: (
+        candidate[2], math.hypot(candidate[3] - planned_x, candidate[4] - planned_y)))
+    return [(candidate[0], candidate[1], candidate[2]) for candidate in ordered if candidate[2] < planned_damage]
+
+
+class ProjectileDodgeTest(unittest.TestCase):
+    def setUp(self):
+        self.game = make_game()
+        self.rnd = random.Random(5)
+
+    def make_projectiles(self, me, count):
+        projectiles = [launch(self.game, self.rnd, me, index) for index in range(count)]
+        for projectile in projectiles:
+            flown = self.rnd.uniform(0.0, 300.0)
+            projectile.x += flown * math.cos(projectile.angle)
+            projectile.y += flown * math.sin(projectile.angle)
+        return projectiles
+
+    def test_plan_equals_the_scalar_plan(self):
+        dodge = ProjectileDodge(self.game)
+        dodged_count = 0
+        for _ in range(300):
+            me = Target(2000.0, 2000.0, self.rnd.uniform(-math.pi, math.pi), self.game.wizard_radius)
+            projectiles = self.make_projectiles(me, self.rnd.choice([1, 2, 5, 20]))
+            # Projectiles were launched from further away than they are now, so part of the range is flown.
+            dodge.origins_by_id = {}
+            for projectile in projectiles:
+                dodge.origins_by_id[projectile.id] = (
+                    projectile.x - 350.0 * math.cos(projectile.angle),
+                    projectile.y - 350.0 * math.sin(projectile.angle), dodge.max_cast_range)
+            speed = self.rnd.choice([0.0, self.game.wizard_forward_speed, -self.game.wizard_backward_speed])
+            strafe_speed = self.rnd.choice([0.0, self.game.wizard_strafe_speed])
+            with self.subTest(projectile_count=projectiles.__len__(), speed=speed, strafe_speed=strafe_speed):
+                origins_by_id = dict(dodge.origins_by_id)
+                moves = dodge.plan(me, projectiles, [], speed, strafe_speed)
+                self.assertEqual(origins_by_id, dodge.origins_by_id)
+                self.assertEqual(scalar_plan(dodge, me, projectiles, speed, strafe_speed), moves)
+                dodged_count += moves is not None
+        self.assertGreater(dodged_count, 0)
+
+    def test_plan_without_projectiles_keeps_the_planned_move(self):
+        dodge = ProjectileDodge(self.game)
+        me = Target(2000.0, 2000.0, 0.0, self.game.wizard_radius)
+        self.assertIsNone(dodge.plan(me, [], [], 0.0, 0.0))
+
+    def test_magic_missile_grazing_a_still_wizard_is_dodged_sideways(self):
+        dodge = ProjectileDodge(self.game)
+        me = Target(2000.0, 2000.0, 0.0, self.game.wizard_radius)
+        speed = self.game.magic_missile_speed
+        missile = Projectile(0, 2400.0, 2030.0, -speed, 0.0, math.pi, Faction.RENEGADES,
+                             self.game.magic_missile_radius, ProjectileType.MAGIC_MISSILE, -1, -1)
+        moves = dodge.plan(me, [missile], [], 0.0, 0.0)
+        self.assertIsNotNone(moves)
+        self.assertEqual([0.0] * moves.__len__(), [damage for _, _, damage in moves])
+        self.assertNotEqual(0.0, moves[0][1])
+
+
+if __name__ == "__main__":
+    unittest.main()
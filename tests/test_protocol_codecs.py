@@ -0,0 +1,67 @@
+import unittest
+
+from RemoteProcessClient import RemoteProcessClient
+from benchmarks.frames import ByteSink, make_game, make_player_context
+from benchmarks.writer import make_moves
+from hand_written_codec import HandWrittenCodec
+
+
+def make_cases():
+    player_context = make_player_context("mid")
+    world = player_context.world
+    units = world.wizards + world.minions + world.buildings + world.trees
+    return [
+        ("statuses", [status for unit in units for status in unit.statuses]),
+        ("messages", [message for wizard in world.wizards for message in wizard.messages]),
+        ("players", world.players),
+        ("wizards", world.wizards),
+        ("minions", world.minions),
+        ("projectiles", world.projectiles),
+        ("bonuses", world.bonuses),
+        ("buildings", world.buildings),
+        ("trees", world.trees),
+        ("moves", make_moves(5)),
+        ("world", world),
+        ("player_context", player_context),
+        ("game", make_game())
+    ]
+
+
+def encode(client_class, name, value):
+    client = client_class(None, None, ByteSink())
+    getattr(client, "write_" + name)(value)
+    client.flush()
+    return bytes(client.socket.data)
+
+
+def decode(client_class, name, data):
+    client = client_class(None, None, ByteSink())
+    client.read_buffer[:data.__len__()] = data
+    client.read_limit = data.__len__()
+    value = getattr(client, "read_" + name)()
+    return value, client.read_offset
+
+
+class ProtocolCodecTest(unittest.TestCase):
+    def test_generated_writers_match_the_hand_written_ones(self):
+        for name, value in make_cases():
+            with self.subTest(name):
+                self.assertEqual(encode(HandWrittenCodec, name, value), encode(RemoteProcessClient, name, value))
+
+    def test_generated_readers_match_the_hand_written_ones(self):
+        for name, value in make_cases():
+            if not hasattr(HandWrittenCodec, "read_" + name):
+                continue
+            with self.subTest(name):
+                data = encode(HandWrittenCodec, name, value)
+                expected, expected_offset = decode(HandWrittenCodec, name, data)
+                actual, offset = decode(RemoteProcessClient, name, data)
+
+                self.assertEqual(data.__len__(), offset)
+                self.assertEqual(expected_offset, offset)
+                self.assertEqual(encode(HandWrittenCodec, name, expected), encode(HandWrittenCodec, name, actual))
+                self.assertEqual(data, encode(HandWrittenCodec, name, actual))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+import math
+import random
+import unittest
+
+from StaticUnitGrid import StaticUnitGrid
+from model.CircularUnit import CircularUnit
+from model.Faction import Faction
+
+
+def make_units(rnd, count):
+    # Small units inside one cell and large ones spanning several, some of them reaching over the map edge.
+    return [
+        CircularUnit(index, rnd.uniform(0.0, 4000.0), rnd.uniform(0.0, 4000.0), 0.0, 0.0, 0.0, Faction.OTHER,
+                     rnd.choice([5.0, 20.0, 50.0, 99.0, 150.0, 400.0]))
+        for index in range(count)
+    ]
+
+
+def distance_to_segment(unit, x1, y1, x2, y2):
+    dx = x2 - x1
+    dy = y2 - y1
+    length_squared = dx * dx + dy * dy
+    t = 0.0 if length_squared == 0.0 else max(0.0, min(1.0, ((unit.x - x1) * dx + (unit.y - y1) * dy) / length_squared))
+    return math.hypot(unit.x - (x1 + t * dx), unit.y - (y1 + t * dy))
+
+
+class StaticUnitGridTest(unittest.TestCase):
+    def setUp(self):
+        rnd = random.Random(11)
+        self.rnd = rnd
+        self.units = make_units(rnd, 500)
+        self.grid = StaticUnitGrid().update(self.units)
+
+    def assert_candidates(self, candidates, exact_test):
+        self.assertEqual(sorted(set(unit.id for unit in candidates)), [unit.id for unit in candidates])
+        self.assertEqual([unit for unit in self.units if exact_test(unit)],
+                         [unit for unit in candidates if exact_test(unit)])
+
+    def test_box_query_returns_every_unit_whose_bounding_box_overlaps(self):
+        for _ in range(300):
+            min_x, max_x = sorted(self.rnd.uniform(-200.0, 4200.0) for _ in range(2))
+            min_y, max_y = sorted(self.rnd.uniform(-200.0, 4200.0) for _ in range(2))
+            self.assert_candidates(self.grid.query_box(min_x, min_y, max_x, max_y), lambda unit: (
+                unit.x + unit.radius >= min_x and unit.x - unit.radius <= max_x and
+                unit.y + unit.radius >= min_y and unit.y - unit.radius <= max_y))
+
+    def test_circle_query_returns_every_unit_the_circle_reaches(self):
+        for _ in range(300):
+            x = self.rnd.uniform(-100.0, 4100.0)
+            y = self.rnd.uniform(-100.0, 4100.0)
+            radius = self.rnd.choice([0.0, 35.0, 100.0, 600.0])
+            self.assert_candidates(self.grid.query_circle(x, y, radius),
+                                   lambda unit: unit.get_distance_to(x, y) <= radius + unit.radius)
+
+    def test_segment_query_returns_every_unit_the_swept_circle_reaches(self):
+        for _ in range(300):
+            x1, y1, x2, y2 = (self.rnd.uniform(0.0, 4000.0) for _ in range(4))
+            radius = self.rnd.choice([0.0, 35.0])
+            self.assert_candidates(self.grid.query_segment(x1, y1, x2, y2, radius),
+                                   lambda unit: distance_to_segment(unit, x1, y1, x2, y2) <= radius + unit.radius)
+
+    def test_grid_is_rebuilt_only_for_another_list(self):
+        self.grid.update(self.units)
+        self.assertEqual((1, 1), (self.grid.build_count, self.grid.reuse_count))
+
+        units = self.units[:-1]
+        self.grid.update(units)
+        self.assertEqual(2, self.grid.build_count)
+        self.assertNotIn(self.units[-1], self.grid.query_circle(self.units[-1].x, self.units[-1].y, 0.0))
+
+
+if __name__ == "__main__":
+    unittest.main()
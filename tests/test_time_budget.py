@@ -0,0 +1,57 @@
+import threading
+import time
+import unittest
+
+from TimeBudget import TickOverrun, TimeBudget
+
+
+def burn(seconds):
+    start = time.thread_time()
+    while time.thread_time() - start < seconds:
+        pass
+
+
+class WatchdogTest(unittest.TestCase):
+    def test_time_spent_waiting_is_not_charged(self):
+        time_budget = TimeBudget(1, hard_limit_seconds=0.05)
+        with time_budget.watchdog():
+            time.sleep(0.2)
+            time_budget.check()
+
+        self.assertEqual(0, time_budget.overrun_count)
+
+    def test_time_of_other_threads_is_not_charged(self):
+        time_budget = TimeBudget(1, hard_limit_seconds=0.05)
+        with time_budget.watchdog():
+            thread = threading.Thread(target=burn, args=(0.2,))
+            thread.start()
+            thread.join()
+            time_budget.check()
+
+        self.assertEqual(0, time_budget.overrun_count)
+
+    def test_busy_move_is_cut_short_at_the_next_check(self):
+        time_budget = TimeBudget(1, hard_limit_seconds=0.05)
+        start = time.thread_time()
+        with self.assertRaises(TickOverrun):
+            with time_budget.watchdog():
+                while time.thread_time() - start < 2.0:
+                    burn(0.001)
+                    time_budget.check()
+
+        self.assertLess(time.thread_time() - start, 0.06)
+        self.assertEqual(1, time_budget.overrun_count)
+
+    def test_check_outside_the_watchdog_does_nothing(self):
+        time_budget = TimeBudget(1, hard_limit_seconds=0.0)
+        time_budget.check()
+        with self.assertRaises(TickOverrun):
+            with time_budget.watchdog():
+                time_budget.check()
+        time_budget.check()
+
+        self.assertEqual(1, time_budget.overrun_count)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+import math
+import random
+import unittest
+from unittest import mock
+
+import model.Unit
+from model.Faction import Faction
+from model.Unit import Unit
+
+
+def make_points(rnd, unit):
+    points = [(rnd.uniform(0.0, 4000.0), rnd.uniform(0.0, 4000.0)) for _ in range(200)]
+    # Right behind the unit, where the relative angle is close to pi on one side and to -pi on the other.
+    for offset in (0.0, 1e-12, -1e-12, 1e-9, -1e-9, 1e-6, -1e-6):
+        behind = unit.angle + math.pi + offset
+        points.append((unit.x + 100.0 * math.cos(behind), unit.y + 100.0 * math.sin(behind)))
+    points.append((unit.x, unit.y))
+    return points
+
+
+class UnitBatchQueryTest(unittest.TestCase):
+    def assert_batch_queries_match_the_scalar_ones(self):
+        rnd = random.Random(7)
+        for angle in (0.0, 1.0, -2.5, math.pi, -math.pi, math.pi - 1e-12, -math.pi + 1e-12):
+            unit = Unit(1, rnd.uniform(0.0, 4000.0), rnd.uniform(0.0, 4000.0), 0.0, 0.0, angle, Faction.ACADEMY)
+            points = make_points(rnd, unit)
+            targets = [Unit(2, x, y, 0.0, 0.0, 0.0, Faction.RENEGADES) for x, y in points]
+            xs = [x for x, _ in points]
+            ys = [y for _, y in points]
+
+            for angles in (unit.get_angles_to(xs, ys), unit.get_angles_to_units(targets)):
+                self.assertEqual(points.__len__(), angles.__len__())
+                for (x, y), batch_angle in zip(points, angles):
+                    scalar_angle = unit.get_angle_to(x, y)
+                    self.assertLessEqual(abs(batch_angle), math.pi)
+                    self.assertAlmostEqual(0.0, math.remainder(batch_angle - scalar_angle, 2.0 * math.pi), places=12)
+
+            for distances in (unit.get_distances_to(xs, ys), unit.get_distances_to_units(targets)):
+                self.assertEqual(points.__len__(), distances.__len__())
+                for (x, y), batch_distance in zip(points, distances):
+                    self.assertTrue(math.isclose(unit.get_distance_to(x, y), batch_distance, rel_tol=1e-12))
+
+            self.assertEqual([], unit.get_distances_to_units([]))
+            self.assertEqual([], unit.get_angles_to_units([]))
+
+    @unittest.skipIf(model.Unit.numpy is None, "needs NumPy")
+    def test_vectorized_queries_match_the_scalar_ones(self):
+        self.assert_batch_queries_match_the_scalar_ones()
+
+    @unittest.skipIf(model.Unit.numpy is None, "needs NumPy")
+    def test_vectorized_queries_take_coordinate_arrays(self):
+        numpy = model.Unit.numpy
+        unit = Unit(1, 1000.0, 2000.0, 0.0, 0.0, 0.5, Faction.ACADEMY)
+        points = make_points(random.Random(3), unit)
+        xs = [x for x, _ in points]
+        ys = [y for _, y in points]
+
+        self.assertEqual(unit.get_angles_to(xs, ys), unit.get_angles_to(numpy.array(xs), numpy.array(ys)))
+        self.assertEqual(unit.get_distances_to(xs, ys), unit.get_distances_to(numpy.array(xs), numpy.array(ys)))
+
+    def test_queries_without_numpy_match_the_scalar_ones(self):
+        with mock.patch.object(model.Unit, "numpy", None):
+            self.assert_batch_queries_match_the_scalar_ones()
+
+
+if __name__ == "__main__":
+    unittest.main()
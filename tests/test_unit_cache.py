@@ -0,0 +1,125 @@
+import unittest
+
+from RemoteProcessClient import RemoteProcessClient
+from UnitCache import UnitCache
+from UnitPool import UnitPool
+from benchmarks.frames import encode_player_context_message, make_encoder, make_player_context
+
+TTL_TICKS = 20
+SWEEP_INTERVAL_TICKS = 5
+
+
+class BytesSocket:
+    def __init__(self, data):
+        self.data = memoryview(data)
+        self.offset = 0
+
+    def recv_into(self, buffer, byte_count=0):
+        byte_count = min(byte_count or buffer.__len__(), self.data.__len__() - self.offset)
+        buffer[:byte_count] = self.data[self.offset:self.offset + byte_count]
+        self.offset += byte_count
+        return byte_count
+
+    def close(self):
+        pass
+
+
+def encode_reference_message(player_context, entity_name, unit_id):
+    # Every unit of the given kind is sent as a flag-100 back-reference to the given id.
+    encoder = make_encoder()
+
+    def write_reference(unit):
+        encoder.write_bytes(bytes([100]))
+        encoder.write_long(unit_id)
+
+    setattr(encoder, "write_" + entity_name, write_reference)
+    encoder.write_enum(RemoteProcessClient.MessageType.PLAYER_CONTEXT)
+    encoder.write_player_context(player_context)
+    encoder.flush()
+    return bytes(encoder.socket.data)
+
+
+class UnitCacheTest(unittest.TestCase):
+    def test_units_of_reused_lists_survive_the_ttl_sweep(self):
+        player_context = make_player_context("early", tick_index=0)
+        world = player_context.world
+        tree = world.trees[0]
+        world.trees = [tree]
+        messages = [encode_player_context_message(player_context)]
+
+        world.trees = None
+        world.buildings = None
+        world.players = None
+        silent_message = encode_player_context_message(player_context)
+        messages += [silent_message] * (TTL_TICKS + SWEEP_INTERVAL_TICKS + 1)
+
+        world.trees = [tree]
+        messages.append(encode_reference_message(player_context, "tree", tree.id))
+
+        unit_cache = UnitCache(TTL_TICKS, SWEEP_INTERVAL_TICKS)
+        client = RemoteProcessClient(None, None, BytesSocket(b"".join(messages)), unit_cache=unit_cache)
+        for _ in range(messages.__len__() - 1):
+            self.assertEqual([tree.id], [unit.id for unit in client.read_player_context_message().world.trees])
+        trees = client.read_player_context_message().world.trees
+
+        self.assertEqual([tree.id], [unit.id for unit in trees])
+        self.assertIs(unit_cache.unit_by_id[tree.id], trees[0])
+
+    def test_minions_not_referenced_within_the_ttl_are_evicted(self):
+        unit_cache = UnitCache(TTL_TICKS, SWEEP_INTERVAL_TICKS)
+        unit_cache.store(7, object())
+        unit_cache.store(5, object(), static=True)
+        for _ in range(TTL_TICKS + SWEEP_INTERVAL_TICKS + 1):
+            unit_cache.end_tick()
+
+        self.assertNotIn(7, unit_cache.unit_by_id)
+        self.assertIn(5, unit_cache.unit_by_id)
+        with self.assertRaises(IOError):
+            unit_cache.reference(7)
+
+
+
+class UnitPoolTest(unittest.TestCase):
+    def test_pooled_unit_is_not_recycled_while_the_server_may_refer_back_to_it(self):
+        player_context = make_player_context("early", tick_index=0)
+        world = player_context.world
+        minion = world.minions[0]
+        world.minions = [minion]
+        messages = [encode_player_context_message(player_context)]
+
+        world.minions = []
+        world.trees = None
+        world.buildings = None
+        world.players = None
+        messages += [encode_player_context_message(player_context)] * (UnitPool.RECYCLE_DELAY_TICKS * 2)
+
+        world.minions = [minion]
+        messages.append(encode_reference_message(player_context, "minion", minion.id))
+
+        unit_pool = UnitPool()
+        client = RemoteProcessClient(None, None, BytesSocket(b"".join(messages)), unit_pool=unit_pool)
+        pooled_minion = client.read_player_context_message().world.minions[0]
+        for _ in range(messages.__len__() - 2):
+            client.read_player_context_message()
+        minions = client.read_player_context_message().world.minions
+
+        self.assertEqual([minion.id], [unit.id for unit in minions])
+        self.assertIs(pooled_minion, minions[0])
+        self.assertEqual(0, unit_pool.total_recycled_count)
+
+    def test_unit_expired_by_the_cache_is_recycled(self):
+        unit_cache = UnitCache(TTL_TICKS, SWEEP_INTERVAL_TICKS)
+        unit_pool = UnitPool(recycle_delay_ticks=5)
+        unit = unit_pool.acquire(object, 7)
+        unit_cache.store(7, unit)
+        for _ in range(TTL_TICKS + SWEEP_INTERVAL_TICKS + 2):
+            unit_pool.end_tick(unit_cache)
+            unit_cache.end_tick()
+
+        self.assertNotIn(7, unit_cache.unit_by_id)
+        self.assertEqual(1, unit_pool.total_recycled_count)
+        self.assertIs(unit, unit_pool.acquire(object, 8))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+import random
+import unittest
+
+from UnitSpatialHash import UnitSpatialHash
+from model.CircularUnit import CircularUnit
+from model.Faction import Faction
+
+FACTIONS = [Faction.ACADEMY, Faction.RENEGADES, Faction.NEUTRAL]
+
+
+def make_units(rnd, count):
+    # Minion and wizard sized units, and a few much larger than a cell.
+    return [
+        CircularUnit(index, rnd.uniform(0.0, 4000.0), rnd.uniform(0.0, 4000.0), 0.0, 0.0, 0.0, rnd.choice(FACTIONS),
+                     rnd.choice([25.0, 35.0, 35.0, 250.0]))
+        for index in range(count)
+    ]
+
+
+class UnitSpatialHashTest(unittest.TestCase):
+    def assert_queries_match_a_scan(self, unit_count):
+        rnd = random.Random(unit_count)
+        units = make_units(rnd, unit_count)
+        unit_hash = UnitSpatialHash(100.0).update(units)
+
+        self.assertEqual(sorted(set(unit.faction for unit in units)), sorted(unit_hash.factions()))
+        for faction in FACTIONS:
+            self.assertEqual([unit for unit in units if unit.faction == faction], unit_hash.units_of_faction(faction))
+
+        for _ in range(300):
+            x = rnd.uniform(-100.0, 4100.0)
+            y = rnd.uniform(-100.0, 4100.0)
+            radius = rnd.choice([0.0, 70.0, 500.0, 600.0, 3000.0])
+            factions = rnd.sample(FACTIONS, rnd.randint(1, 3))
+            candidates = unit_hash.query_circle(x, y, radius, factions)
+
+            def reached(unit):
+                return unit.get_distance_to(x, y) <= radius + unit.radius
+
+            self.assertEqual(sorted(set(unit.id for unit in candidates)), [unit.id for unit in candidates])
+            self.assertTrue(all(unit.faction in factions for unit in candidates))
+            self.assertEqual([unit for unit in units if unit.faction in factions and reached(unit)],
+                             [unit for unit in candidates if reached(unit)])
+
+    def test_hashed_queries_match_a_scan(self):
+        self.assert_queries_match_a_scan(UnitSpatialHash.MIN_HASHED_UNIT_COUNT * 5)
+
+    def test_queries_below_the_hashed_unit_count_match_a_scan(self):
+        self.assert_queries_match_a_scan(UnitSpatialHash.MIN_HASHED_UNIT_COUNT - 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
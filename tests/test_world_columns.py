@@ -0,0 +1,27 @@
+import unittest
+
+from WorldColumns import WorldColumns, numpy
+from benchmarks.frames import make_player_context
+
+
+@unittest.skipIf(numpy is None, "the columnar world view needs NumPy")
+class WorldColumnsTest(unittest.TestCase):
+    def test_columns_are_contiguous_and_hold_the_units_past_a_capacity_doubling(self):
+        world = make_player_context("late").world
+        units = world.minions + world.trees
+        columns = WorldColumns(capacity=16)
+        columns.clear()
+        for unit in units:
+            columns.append_unit(WorldColumns.TREE, unit)
+        columns.finish()
+
+        self.assertEqual(units.__len__(), columns.size)
+        for column_name, _, _ in WorldColumns.COLUMNS:
+            self.assertTrue(getattr(columns, column_name).flags["C_CONTIGUOUS"], column_name)
+        self.assertEqual([unit.id for unit in units], columns.id.tolist())
+        self.assertEqual([unit.x for unit in units], columns.x.tolist())
+        self.assertEqual([unit.life for unit in units], columns.life.tolist())
+
+
+if __name__ == "__main__":
+    unittest.main()